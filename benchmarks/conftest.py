@@ -0,0 +1,35 @@
+"""
+Shared fixtures of the benchmark suite. Benchmarks run with logging disabled, so that they measure
+the package's own work rather than the formatting and writing of log messages.
+"""
+
+import pathlib
+
+import numpy as np
+import pytest
+
+from pokejdr import quiet_logging
+from pokejdr.model import Pokemon
+
+INPUTS_DIR = pathlib.Path(__file__).parent.parent / "tests" / "inputs"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_package():
+    with quiet_logging():
+        yield
+
+
+@pytest.fixture()
+def _attacker_pokemon() -> Pokemon:
+    return Pokemon.from_json(INPUTS_DIR / "bulbizarre.json")
+
+
+@pytest.fixture()
+def _defender_pokemon() -> Pokemon:
+    return Pokemon.from_pickle(INPUTS_DIR / "nosferapti.pkl")
+
+
+@pytest.fixture()
+def _rng() -> np.random.Generator:
+    return np.random.default_rng(42)
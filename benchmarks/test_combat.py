@@ -0,0 +1,39 @@
+import pytest
+
+from pokejdr.model import dealt_damage
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="combat")
+class TestCombat:
+    def test_dealt_damage(self, benchmark, _attacker_pokemon, _defender_pokemon, _rng):
+        damage = benchmark(
+            dealt_damage, _attacker_pokemon, _defender_pokemon, "physical", 40, rng=_rng
+        )
+        assert damage > 0
+
+    def test_dealt_damage_with_types(self, benchmark, _attacker_pokemon, _defender_pokemon, _rng):
+        damage = benchmark(
+            dealt_damage,
+            _attacker_pokemon,
+            _defender_pokemon,
+            "special",
+            90,
+            rng=_rng,
+            move_type="Psy",
+        )
+        assert damage > 0
+
+    def test_perform_physical_attack(self, benchmark, _attacker_pokemon, _defender_pokemon, _rng):
+        def reset_health():
+            _defender_pokemon.health = 10_000
+
+        benchmark.pedantic(
+            _attacker_pokemon.perform_physical_attack,
+            args=(_defender_pokemon, 40),
+            kwargs={"rng": _rng},
+            setup=reset_health,
+            rounds=2_000,
+        )
+        assert _defender_pokemon.health < 10_000
@@ -0,0 +1,22 @@
+import pytest
+
+from pokejdr.model import Pokemon
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="generation")
+class TestGeneration:
+    def test_generate_random(self, benchmark, _rng):
+        pokemon = benchmark(Pokemon.generate_random, "Pikachu", 30, rng=_rng)
+        assert pokemon.name == "Pikachu"
+
+    def test_generate_random_name(self, benchmark, _rng):
+        pokemon = benchmark(Pokemon.generate_random, "random", 30, rng=_rng)
+        assert pokemon.level == 30
+
+    def test_generate_batch(self, benchmark, _rng):
+        columns = benchmark(
+            Pokemon.generate_batch, "random", 30, size=10_000, as_objects=False, rng=_rng
+        )
+        assert len(columns["name"]) == 10_000
@@ -0,0 +1,34 @@
+import pytest
+
+from pokejdr.model import Pokemon
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="io")
+class TestIO:
+    def test_json_round_trip(self, benchmark, tmp_path, _attacker_pokemon):
+        def round_trip():
+            _attacker_pokemon.to_json(tmp_path / "pokemon.json")
+            return Pokemon.from_json(tmp_path / "pokemon.json")
+
+        assert benchmark(round_trip) == _attacker_pokemon
+
+    def test_pickle_round_trip(self, benchmark, tmp_path, _attacker_pokemon):
+        def round_trip():
+            _attacker_pokemon.to_pickle(tmp_path / "pokemon.pkl")
+            return Pokemon.from_pickle(tmp_path / "pokemon.pkl")
+
+        assert benchmark(round_trip) == _attacker_pokemon
+
+    def test_binary_round_trip(self, benchmark, tmp_path, _attacker_pokemon):
+        def round_trip():
+            _attacker_pokemon.to_binary(tmp_path / "pokemon.bin")
+            return Pokemon.from_binary(tmp_path / "pokemon.bin")
+
+        assert benchmark(round_trip) == _attacker_pokemon
+
+    def test_bytes_round_trip(self, benchmark, _attacker_pokemon):
+        assert benchmark(lambda: Pokemon.from_bytes(_attacker_pokemon.to_bytes())) == (
+            _attacker_pokemon
+        )
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pokejdr import base_stats
+from pokejdr.model import LEVELING_CURVES, experience_for_levels, gain_evs_batch
+from pokejdr.stats import compute_stats_batch
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="leveling")
+class TestLeveling:
+    def test_level_up(self, benchmark, _attacker_pokemon):
+        def reset_level():
+            _attacker_pokemon.level = 50
+
+        benchmark.pedantic(_attacker_pokemon.level_up, setup=reset_level, rounds=2_000)
+        assert _attacker_pokemon.level == 51
+
+    @pytest.mark.parametrize("curve", list(LEVELING_CURVES))
+    def test_experience_to_level(self, benchmark, _attacker_pokemon, curve):
+        experience = benchmark(_attacker_pokemon.experience_to_level, 80, curve)
+        assert experience > 0
+
+    def test_experience_for_levels(self, benchmark):
+        experiences = benchmark(experience_for_levels, list(range(1, 101)) * 100, "average")
+        assert len(experiences) == 10_000
+
+    def test_compute_stats_batch(self, benchmark):
+        rng = np.random.default_rng(0)
+        size = 100_000
+        inputs = (
+            base_stats.SPECIES_ARRAYS["base_stats"][rng.integers(100, size=size)],
+            rng.integers(0, 32, size=(size, 6)),
+            np.zeros((size, 6), dtype=np.int64),
+            rng.integers(1, 101, size=size),
+            rng.integers(len(base_stats.NATURE_NAMES), size=size),
+        )
+        # the warmup round compiles the numba kernel, when installed
+        stats = benchmark.pedantic(compute_stats_batch, inputs, rounds=50, warmup_rounds=1)
+        assert stats.shape == (size, 6)
+
+    def test_gain_evs_batch(self, benchmark):
+        rng = np.random.default_rng(0)
+        evs = np.zeros((10_000, 6), dtype=np.int64)
+        gained_evs = rng.integers(0, 4, size=(100_000, 6))
+        winners = rng.integers(len(evs), size=len(gained_evs))
+        new_evs = benchmark(gain_evs_batch, evs, gained_evs, winners)
+        assert new_evs.shape == evs.shape
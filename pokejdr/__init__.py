@@ -1,2 +1,44 @@
+"""
+Public objects are imported from their submodule on first access, so that importing pokejdr stays
+cheap and the data files are only read once needed.
+"""
+
+import importlib
+import os
+from typing import Any, List
+
 from ._version import __version__
-from .model import Pokemon
+from .constants import QUIET_ENV_VARIABLE
+
+# Public objects and the submodule defining them
+_LAZY_OBJECTS = {
+    "disable_logging": "logs",
+    "enable_logging": "logs",
+    "quiet_logging": "logs",
+    "disable_instrumentation": "instrumentation",
+    "enable_instrumentation": "instrumentation",
+    "instrumented": "instrumentation",
+    "FastPokemon": "fast",
+    "Pokemon": "model",
+    "PokemonTable": "table",
+    "iter_roster": "roster",
+    "iter_roster_chunks": "roster",
+    "load_roster": "roster",
+    "save_roster": "roster",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_OBJECTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_OBJECTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_OBJECTS))
+
+
+if os.environ.get(QUIET_ENV_VARIABLE):  # quiet mode must apply before anything gets logged
+    from . import logs  # noqa: F401
@@ -0,0 +1,153 @@
+"""
+Asyncio counterparts of the persistence functionality, for applications running an event loop
+such as game servers. The blocking file I/O runs in executor threads, so that the event loop
+keeps serving other tasks meanwhile: functions take an optional `executor`, and otherwise use the
+event loop's default one. Bulk functions save or load many pokemons concurrently, each in its own
+file, with a bounded number of worker threads.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, TypeVar, Union
+
+from loguru import logger
+
+from pokejdr import roster
+from pokejdr.model import Pokemon
+
+# File formats of the bulk functions, each saved with `Pokemon.to_<format>` and loaded with
+# `Pokemon.from_<format>`
+FILE_FORMATS = ("json", "pickle", "binary")
+
+PathLike = Union[str, Path]
+T = TypeVar("T")
+
+
+# ----- Single Pokemon ----- #
+
+
+async def to_json(pokemon: Pokemon, json_file: PathLike, executor: Executor = None) -> None:
+    """Asynchronous counterpart of `Pokemon.to_json`."""
+    await _run_in_executor(executor, pokemon.to_json, json_file)
+
+
+async def from_json(json_file: PathLike, executor: Executor = None) -> Pokemon:
+    """Asynchronous counterpart of `Pokemon.from_json`."""
+    return await _run_in_executor(executor, Pokemon.from_json, json_file)
+
+
+async def to_pickle(pokemon: Pokemon, pickle_file: PathLike, executor: Executor = None) -> None:
+    """Asynchronous counterpart of `Pokemon.to_pickle`."""
+    await _run_in_executor(executor, pokemon.to_pickle, pickle_file)
+
+
+async def from_pickle(pickle_file: PathLike, executor: Executor = None) -> Pokemon:
+    """Asynchronous counterpart of `Pokemon.from_pickle`."""
+    return await _run_in_executor(executor, Pokemon.from_pickle, pickle_file)
+
+
+async def to_binary(pokemon: Pokemon, binary_file: PathLike, executor: Executor = None) -> None:
+    """Asynchronous counterpart of `Pokemon.to_binary`."""
+    await _run_in_executor(executor, pokemon.to_binary, binary_file)
+
+
+async def from_binary(binary_file: PathLike, executor: Executor = None) -> Pokemon:
+    """Asynchronous counterpart of `Pokemon.from_binary`."""
+    return await _run_in_executor(executor, Pokemon.from_binary, binary_file)
+
+
+# ----- Many Pokemons ----- #
+
+
+async def save_pokemons(
+    pokemons: Sequence[Pokemon],
+    files: Sequence[PathLike],
+    format: str = "json",
+    max_workers: int = 8,
+) -> None:
+    """
+    Save many pokemons concurrently, each to its own file.
+
+    Args:
+        pokemons (Sequence[Pokemon]): the pokemons to save.
+        files (Sequence[PathLike]): the save file location of each pokemon.
+        format (str): "json", "pickle" or "binary". Defaults to "json".
+        max_workers (int): maximum number of files written at the same time. Defaults to 8.
+    """
+    _assert_valid_bulk_parameters(format, max_workers)
+    if len(pokemons) != len(files):
+        logger.error(f"Got {len(pokemons)} pokemons for {len(files)} files, which should be equal.")
+        raise ValueError("Invalid bulk parameters.")
+    # Looked up at call time, to pick up wrappers such as the instrumentation ones
+    save = getattr(Pokemon, f"to_{format}")
+    logger.info("Saving {} pokemons as {} with {} workers", len(pokemons), format, max_workers)
+    await _run_all(
+        [functools.partial(save, pokemon, file) for pokemon, file in zip(pokemons, files)],
+        max_workers,
+    )
+
+
+async def load_pokemons(
+    files: Sequence[PathLike], format: str = "json", max_workers: int = 8
+) -> List[Pokemon]:
+    """
+    Load many pokemons concurrently, each from its own file.
+
+    Args:
+        files (Sequence[PathLike]): the save file locations.
+        format (str): "json", "pickle" or "binary". Defaults to "json".
+        max_workers (int): maximum number of files read at the same time. Defaults to 8.
+
+    Returns:
+        The loaded pokemons, in the order of the files.
+    """
+    _assert_valid_bulk_parameters(format, max_workers)
+    load = getattr(Pokemon, f"from_{format}")
+    logger.info(
+        "Loading {} pokemons from {} files with {} workers", len(files), format, max_workers
+    )
+    return await _run_all([functools.partial(load, file) for file in files], max_workers)
+
+
+async def save_roster(*args, executor: Executor = None, **kwargs) -> None:
+    """Asynchronous counterpart of `pokejdr.roster.save_roster`, taking the same arguments."""
+    await _run_in_executor(executor, roster.save_roster, *args, **kwargs)
+
+
+async def load_roster(*args, executor: Executor = None, **kwargs):
+    """Asynchronous counterpart of `pokejdr.roster.load_roster`, taking the same arguments."""
+    return await _run_in_executor(executor, roster.load_roster, *args, **kwargs)
+
+
+# ----- Private Helpers ----- #
+
+
+async def _run_in_executor(
+    executor: Optional[Executor], function: Callable[..., T], *args, **kwargs
+) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(function, *args, **kwargs))
+
+
+async def _run_all(calls: List[Callable[[], T]], max_workers: int) -> List[T]:
+    """
+    Run the calls in a dedicated pool of at most `max_workers` threads and gather their results
+    in order. The pool is shut down without blocking the event loop, even on cancellation.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pokejdr-io")
+    try:
+        return await asyncio.gather(*(_run_in_executor(executor, call) for call in calls))
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _assert_valid_bulk_parameters(format: str, max_workers: int) -> None:
+    """Ensure the file format and number of workers are valid, log then raise ValueError if not."""
+    if format not in FILE_FORMATS:
+        logger.error(f"Invalid file format '{format}', expected one of {FILE_FORMATS}")
+        raise ValueError("Invalid bulk parameters.")
+    if max_workers < 1:
+        logger.error(f"Invalid number of workers {max_workers}, which should be positive.")
+        raise ValueError("Invalid bulk parameters.")
@@ -1,13 +1,405 @@
 """
+Species, natures and moves data. The registries (SPECIES_STATS, SPECIES_INDEX, SPECIES_ARRAYS,
+NATURE_NAMES, NATURE_INDEX, NATURE_MODIFIERS, MOVES, MOVE_INDEX and MOVE_ARRAYS) are built on
+first access from the columnar binary files of the data directory (see `pokejdr.columnar`), which
+are memory-mapped read-only and do not need pandas. Numeric registry arrays are views of these
+memory maps, so that processes share their pages, while strings are decoded in each process. The
+NATURES_DF, POKEMONS_DF and MOVES_DF DataFrames are only loaded, with pandas, when accessed. They
+are loaded again after `reload_data`.
 
 WARNING: If updating these files with newer data, make sure to save the new data by specifying
 the pickle protocol to be 4 for backwards compatibility with older Python versions (since pokejdr
-is Python3.6+)
+is Python3.7+), then regenerate the binary files with `convert_pickles`.
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, NamedTuple, Tuple
 
-import pandas as pd
+import numpy as np
 
-NATURES_DF = pd.read_pickle(Path(__file__).parent / "data" / "natures_en.pkl")
-POKEMONS_DF = pd.read_pickle(Path(__file__).parent / "data" / "pokemons_en.pkl")
+from pokejdr.columnar import read_columns, write_columns
+from pokejdr.type_chart import type_ids
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DATA_DIR = Path(__file__).parent / "data"
+
+NATURES_PICKLE = DATA_DIR / "natures_en.pkl"
+POKEMONS_PICKLE = DATA_DIR / "pokemons_en.pkl"
+NATURES_BINARY = DATA_DIR / "natures_en.bin"
+POKEMONS_BINARY = DATA_DIR / "pokemons_en.bin"
+MOVES_PICKLE = DATA_DIR / "moves_en.pkl"
+MOVES_BINARY = DATA_DIR / "moves_en.bin"
+
+
+# ----- Species Registry ----- #
+
+BASE_STATS: Tuple[str, ...] = (
+    "health",
+    "attack",
+    "defense",
+    "special_attack",
+    "special_defense",
+    "speed",
+)
+
+
+class SpeciesStats(NamedTuple):
+    """Frozen record of a species' base statistics, as found in one row of POKEMONS_DF."""
+
+    code: int
+    number: int
+    name: str
+    health: int
+    attack: int
+    defense: int
+    special_attack: int
+    special_defense: int
+    speed: int
+    total: int
+    base_xp: int
+    base_ev: Tuple[int, ...]
+    types: Tuple[str, ...]  # one or two elemental types
+
+
+def _build_species_registry(
+    pokemons_data: Mapping[str, np.ndarray],
+) -> Tuple[Tuple[SpeciesStats, ...], Dict[str, int]]:
+    """
+    Precompute the base stats record of every species and a name -> row index for O(1) lookups.
+    When a name appears several times in the data (alternate forms), the first row wins, which is
+    consistent with the previous boolean-mask lookups.
+
+    Args:
+        pokemons_data (Mapping[str, np.ndarray]): the species data as columns, as stored in the
+            data file, see `convert_pickles`.
+
+    Returns:
+        A tuple with the records of all species, in row order, and the name -> row index mapping.
+    """
+    fields = dict(pokemons_data, **dict(zip(BASE_STATS, pokemons_data["base_stats"].T)))
+    columns = [fields[field].tolist() for field in SpeciesStats._fields[:-1]]
+    columns.append(zip(pokemons_data["type_1"].tolist(), pokemons_data["type_2"].tolist()))
+    records = tuple(
+        SpeciesStats(
+            code=int(code),
+            number=int(number),
+            name=str(name),
+            health=int(health),
+            attack=int(attack),
+            defense=int(defense),
+            special_attack=int(special_attack),
+            special_defense=int(special_defense),
+            speed=int(speed),
+            total=int(total),
+            base_xp=int(base_xp),
+            base_ev=tuple(int(ev) for ev in base_ev),
+            types=tuple(str(type_name) for type_name in types if type_name),
+        )
+        for (
+            code,
+            number,
+            name,
+            health,
+            attack,
+            defense,
+            special_attack,
+            special_defense,
+            speed,
+            total,
+            base_xp,
+            base_ev,
+            types,
+        ) in zip(*columns)
+    )
+    index: Dict[str, int] = {}
+    for row_number, record in enumerate(records):
+        index.setdefault(record.name, row_number)
+    return records, index
+
+
+def _build_species_arrays(pokemons_data: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Gather the species data into read-only numpy arrays indexed by row, for vectorized
+    computations. The "base_stats" and "base_ev" arrays are (species x 6), with stats ordered as
+    in BASE_STATS, and the "types" array is (species x 2) with the ids of the elemental types (see
+    `pokejdr.type_chart`). Numeric arrays are the columns of the data file as they are, with their
+    narrow integer dtypes, so that memory-mapped ones are shared between processes: widen them
+    before doing arithmetic. Names and type ids are built in each process.
+
+    Args:
+        pokemons_data (Mapping[str, np.ndarray]): the species data as columns, as stored in the
+            data file, see `convert_pickles`.
+
+    Returns:
+        A dictionary of numpy arrays with "code", "number", "name", "base_stats", "base_xp",
+        "base_ev" and "types" keys.
+    """
+    arrays = {
+        "code": pokemons_data["code"],
+        "number": pokemons_data["number"],
+        "name": pokemons_data["name"].astype(object),
+        "base_stats": pokemons_data["base_stats"],
+        "base_xp": pokemons_data["base_xp"],
+        "base_ev": pokemons_data["base_ev"],
+        "types": type_ids(np.column_stack([pokemons_data["type_1"], pokemons_data["type_2"]])),
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+    return arrays
+
+
+# ----- Natures Registry ----- #
+
+NATURE_STATS: Tuple[str, ...] = ("attack", "defense", "special_attack", "special_defense", "speed")
+
+
+def _build_natures_registry(
+    natures_data: Mapping[str, np.ndarray],
+) -> Tuple[Tuple[str, ...], Dict[str, int], np.ndarray]:
+    """
+    Precompute the natures as integer ids with a (natures x 5) matrix of stat modifiers, ordered
+    as in NATURE_STATS. The matrix is the "modifiers" column of the data file, read-only since it
+    is shared by all callers.
+
+    Args:
+        natures_data (Mapping[str, np.ndarray]): the natures data as columns, as stored in the
+            data file, see `convert_pickles`.
+
+    Returns:
+        A tuple with the nature names (position is the nature id), the name -> id mapping and the
+        modifiers matrix.
+    """
+    names = tuple(str(nature) for nature in natures_data["nature"].tolist())
+    index = {name: nature_id for nature_id, name in enumerate(names)}
+    modifiers = natures_data["modifiers"]
+    modifiers.flags.writeable = False
+    return names, index, modifiers
+
+
+NEUTRAL_NATURE_MODIFIERS = np.ones(len(NATURE_STATS), dtype=np.float64)
+NEUTRAL_NATURE_MODIFIERS.flags.writeable = False
+
+
+# ----- Moves Registry ----- #
+
+
+class MoveData(NamedTuple):
+    """Frozen record of an attack move, as found in one row of MOVES_DF."""
+
+    number: int
+    name: str
+    type: str  # elemental type
+    category: str  # "physical", "special" or "status"
+    power: int  # 0 for status moves and moves of variable power
+    accuracy: float  # between 0 and 1, 1 for moves that never miss
+    priority: int
+
+
+def _build_moves_registry(
+    moves_data: Mapping[str, np.ndarray],
+) -> Tuple[Tuple[MoveData, ...], Dict[str, int]]:
+    """
+    Precompute the record of every move and a name -> row index for O(1) lookups.
+
+    Args:
+        moves_data (Mapping[str, np.ndarray]): the moves data as columns, with the same columns
+            as MOVES_DF.
+
+    Returns:
+        A tuple with the records of all moves, in row order, and the name -> row index mapping.
+    """
+    columns = [moves_data[field].tolist() for field in MoveData._fields]
+    records = tuple(
+        MoveData(
+            number=int(number),
+            name=str(name),
+            type=str(type_name),
+            category=str(category),
+            power=int(power),
+            accuracy=float(accuracy),
+            priority=int(priority),
+        )
+        for number, name, type_name, category, power, accuracy, priority in zip(*columns)
+    )
+    index = {record.name: row_number for row_number, record in enumerate(records)}
+    return records, index
+
+
+def _build_move_arrays(moves_data: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Gather the moves data into read-only numpy arrays indexed by row, for vectorized
+    computations. The "type" array holds the ids of the elemental types (see
+    `pokejdr.type_chart`). As for `_build_species_arrays`, numeric arrays are the columns of the
+    data file with their narrow dtypes.
+
+    Args:
+        moves_data (Mapping[str, np.ndarray]): the moves data as columns, as stored in the data
+            file, see `convert_pickles`.
+
+    Returns:
+        A dictionary of numpy arrays with "name", "type", "category", "power", "accuracy" and
+        "priority" keys.
+    """
+    arrays = {
+        "name": moves_data["name"].astype(object),
+        "type": type_ids(moves_data["type"]),
+        "category": moves_data["category"],
+        "power": moves_data["power"],
+        "accuracy": moves_data["accuracy"],
+        "priority": moves_data["priority"],
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+    return arrays
+
+
+# ----- Data Loading ----- #
+
+
+def convert_pickles(data_dir: Path = DATA_DIR) -> None:
+    """
+    Write the columnar binary counterpart of the pickled DataFrames of the given directory. This
+    is the only function of this module needing pandas besides the DataFrames themselves, and is
+    meant to be run after updating the pickled data.
+
+    Args:
+        data_dir (Path): directory of the data files. Defaults to the package's data directory.
+    """
+    import pandas as pd
+
+    data_dir = Path(data_dir)
+    for stem, stacked_columns in (
+        ("natures_en", {"modifiers": NATURE_STATS}),
+        ("pokemons_en", {"base_stats": BASE_STATS}),
+        ("moves_en", {}),
+    ):
+        dataframe = pd.read_pickle(data_dir / f"{stem}.pkl")
+        write_columns(data_dir / f"{stem}.bin", _dataframe_columns(dataframe, stacked_columns))
+
+
+def _dataframe_columns(
+    dataframe: "pd.DataFrame", stacked_columns: Mapping[str, Tuple[str, ...]]
+) -> Dict[str, np.ndarray]:
+    """
+    Convert the columns of a DataFrame to compact fixed-width numpy arrays: integers get the
+    narrowest dtype holding their range, strings become UTF-8 bytes sized to the longest value and
+    columns of lists, such as "base_ev", become 2D arrays. Columns used together by the registries
+    are stacked into a single 2D column, which the registries then use without copies.
+    """
+    arrays = {column: np.array(dataframe[column].tolist()) for column in dataframe.columns}
+    for stacked_column, stacked in stacked_columns.items():
+        arrays[stacked_column] = np.column_stack([arrays.pop(column) for column in stacked])
+    columns = {}
+    for column, array in arrays.items():
+        if array.dtype.kind == "U":
+            array = np.char.encode(array, "utf-8")
+        elif array.dtype.kind in "iu":
+            array = array.astype(
+                np.result_type(np.min_scalar_type(array.min()), np.min_scalar_type(array.max()))
+            )
+        columns[column] = array
+    return columns
+
+
+def _read_data_columns(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Memory-map a data file, decoding its UTF-8 string columns to unicode arrays. Numeric columns
+    keep their narrow dtype, and are widened by the registry builders.
+    """
+    return {
+        column: np.char.decode(array, "utf-8") if array.dtype.kind == "S" else array
+        for column, array in read_columns(path).items()
+    }
+
+
+def _load_dataframes() -> Dict[str, Any]:
+    import pandas as pd
+
+    return {
+        "NATURES_DF": pd.read_pickle(NATURES_PICKLE),
+        "POKEMONS_DF": pd.read_pickle(POKEMONS_PICKLE),
+        "MOVES_DF": pd.read_pickle(MOVES_PICKLE),
+    }
+
+
+def _load_species() -> Dict[str, Any]:
+    pokemons_data = _read_data_columns(POKEMONS_BINARY)
+    records, index = _build_species_registry(pokemons_data)
+    return {
+        "SPECIES_STATS": records,
+        "SPECIES_INDEX": index,
+        "SPECIES_ARRAYS": _build_species_arrays(pokemons_data),
+    }
+
+
+def _load_natures() -> Dict[str, Any]:
+    names, index, modifiers = _build_natures_registry(_read_data_columns(NATURES_BINARY))
+    return {"NATURE_NAMES": names, "NATURE_INDEX": index, "NATURE_MODIFIERS": modifiers}
+
+
+def _load_moves() -> Dict[str, Any]:
+    moves_data = _read_data_columns(MOVES_BINARY)
+    records, index = _build_moves_registry(moves_data)
+    return {"MOVES": records, "MOVE_INDEX": index, "MOVE_ARRAYS": _build_move_arrays(moves_data)}
+
+
+# Lazily loaded attributes and the loader building them, along with the other ones of its group
+_LAZY_LOADERS = {
+    "NATURES_DF": _load_dataframes,
+    "POKEMONS_DF": _load_dataframes,
+    "MOVES_DF": _load_dataframes,
+    "SPECIES_STATS": _load_species,
+    "SPECIES_INDEX": _load_species,
+    "SPECIES_ARRAYS": _load_species,
+    "NATURE_NAMES": _load_natures,
+    "NATURE_INDEX": _load_natures,
+    "NATURE_MODIFIERS": _load_natures,
+    "MOVES": _load_moves,
+    "MOVE_INDEX": _load_moves,
+    "MOVE_ARRAYS": _load_moves,
+}
+
+
+# Functions clearing caches derived from the loaded data, called by `reload_data`
+_RELOAD_CALLBACKS: List[Callable[[], None]] = []
+
+
+def on_reload(callback: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a function to be called when the data is reloaded, typically to clear a cache
+    derived from it. Can be used as a decorator.
+
+    Args:
+        callback (Callable[[], None]): function called without arguments.
+
+    Returns:
+        The callback, unchanged.
+    """
+    _RELOAD_CALLBACKS.append(callback)
+    return callback
+
+
+def reload_data() -> None:
+    """
+    Drop the loaded data, which is loaded again from the data files on next access, and clear the
+    caches derived from it. To be called after updating the data files of a running application.
+    """
+    for name in _LAZY_LOADERS:
+        globals().pop(name, None)
+    for callback in _RELOAD_CALLBACKS:
+        callback()
+
+
+def __getattr__(name: str) -> Any:
+    """Build lazily loaded data on first access, then cache it as a regular module attribute."""
+    if name not in _LAZY_LOADERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    loaded = _LAZY_LOADERS[name]()
+    globals().update(loaded)
+    return loaded[name]
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_LOADERS))
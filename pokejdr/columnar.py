@@ -0,0 +1,136 @@
+"""
+Versioned columnar binary format for the package's data files. A file starts with a magic string,
+the format version and a JSON header giving the dtype, shape and offset of every column, followed
+by the raw column data aligned on 64 bytes. Columns are fixed-width numpy arrays (strings are
+stored as fixed-width unicode or bytes), so a file can be memory-mapped read-only: loading it does
+not copy the data, and processes mapping the same file share its pages.
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Dict, Mapping, Union
+
+import numpy as np
+from loguru import logger
+
+MAGIC = b"PKJDRCOL"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sII")  # magic, format version, header length
+_ALIGNMENT = 64
+
+
+def write_columns(path: Union[str, Path], columns: Mapping[str, np.ndarray]) -> None:
+    """
+    Write columns to disk in the columnar binary format.
+
+    Args:
+        path (Union[str, Path]): location of the file to write.
+        columns (Mapping[str, np.ndarray]): the columns, as numpy arrays. Object arrays are not
+            supported, strings should be given as fixed-width unicode arrays.
+    """
+    logger.opt(lazy=True).debug(
+        "Writing {} columns to '{}'", lambda: len(columns), lambda: Path(path).absolute()
+    )
+    Path(path).write_bytes(encode_columns(columns))
+
+
+def read_columns(path: Union[str, Path], mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Read the columns of a file in the columnar binary format.
+
+    Args:
+        path (Union[str, Path]): location of the file to read.
+        mmap (bool): whether to memory-map the file instead of reading it into memory. Defaults
+            to True.
+
+    Returns:
+        A dictionary with the read-only columns, keyed by name and in the order they were written.
+    """
+    logger.opt(lazy=True).debug("Reading columns from '{}'", lambda: Path(path).absolute())
+    if mmap and Path(path).stat().st_size:  # empty files can not be mapped
+        return decode_columns(np.memmap(path, dtype=np.uint8, mode="r"))
+    return decode_columns(Path(path).read_bytes())
+
+
+def encode_columns(columns: Mapping[str, np.ndarray]) -> bytes:
+    """
+    Encode columns in the columnar binary format, for instance to compress them or send them.
+
+    Args:
+        columns (Mapping[str, np.ndarray]): the columns, as numpy arrays. Object arrays are not
+            supported, strings should be given as fixed-width unicode arrays.
+
+    Returns:
+        The encoded columns.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in columns.items()}
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            logger.error(f"Column '{name}' has an object dtype, which can not be stored")
+            raise ValueError("Invalid column dtype.")
+
+    layout, position = {}, 0  # offsets are relative to the start of the data section
+    for name, array in arrays.items():
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": position}
+        position = _aligned(position + array.nbytes)
+    header = json.dumps(layout, separators=(",", ":")).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(header))
+
+    encoded = bytearray(data_start + position)
+    encoded[: _PREAMBLE.size] = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header))
+    encoded[_PREAMBLE.size : _PREAMBLE.size + len(header)] = header
+    for name, array in arrays.items():
+        start = data_start + layout[name]["offset"]
+        encoded[start : start + array.nbytes] = array.tobytes()
+    return bytes(encoded)
+
+
+def decode_columns(buffer: Union[bytes, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Decode columns from the columnar binary format. The columns are views on the buffer.
+
+    Args:
+        buffer (Union[bytes, np.ndarray]): the encoded columns, as bytes or as a uint8 numpy
+            array such as a memory map.
+
+    Returns:
+        A dictionary with the read-only columns, keyed by name and in the order they were encoded.
+    """
+    if not isinstance(buffer, np.ndarray):
+        buffer = np.frombuffer(buffer, dtype=np.uint8)
+    if len(buffer) < _PREAMBLE.size:
+        logger.error("Data is too short to be in the columnar binary format")
+        raise ValueError("Invalid data file.")
+    magic, version, header_length = _PREAMBLE.unpack(buffer[: _PREAMBLE.size].tobytes())
+    if magic != MAGIC:
+        logger.error("Data is not in the columnar binary format")
+        raise ValueError("Invalid data file.")
+    if version != FORMAT_VERSION:
+        logger.error(
+            f"Data has columnar format version {version}, while version {FORMAT_VERSION} is "
+            "supported. Regenerate it with this version of the package."
+        )
+        raise ValueError("Unsupported data file version.")
+    header = buffer[_PREAMBLE.size : _PREAMBLE.size + header_length].tobytes()
+    layout = json.loads(header.decode("utf-8"))
+    data_start = _aligned(_PREAMBLE.size + header_length)
+
+    columns = {}
+    for name, column in layout.items():
+        dtype, shape = np.dtype(column["dtype"]), tuple(column["shape"])
+        n_bytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        start = data_start + column["offset"]
+        array = buffer[start : start + n_bytes].view(dtype).reshape(shape)
+        array.flags.writeable = False
+        columns[name] = array
+    return columns
+
+
+# ----- Private Helpers ----- #
+
+
+def _aligned(position: int) -> int:
+    """Round the position up to the next multiple of the alignment of columns."""
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
@@ -4,3 +4,6 @@ LOGURU_FORMAT = (
     "<cyan>{name}</cyan>:<cyan>{line}</cyan> - "
     "<level>{message}</level>"
 )
+
+# Environment variable which, set to a non-empty value, starts the package in quiet mode
+QUIET_ENV_VARIABLE = "POKEJDR_QUIET"
@@ -0,0 +1,163 @@
+from typing import List, Optional
+
+from loguru import logger
+
+from pokejdr.model import Pokemon
+
+# Attributes coerced to int on assignment, None being allowed for the optional ones
+INT_FIELDS = frozenset(
+    (
+        "code",
+        "number",
+        "level",
+        "health",
+        "attack",
+        "defense",
+        "special_attack",
+        "special_defense",
+        "speed",
+        "base_xp",
+        "experience",
+    )
+)
+FLOAT_FIELDS = frozenset(("accuracy", "dodge"))
+LIST_FIELDS = frozenset(("iv", "ev", "base_ev"))
+
+
+# ----- Models ----- #
+
+
+class FastPokemon:
+    """
+    Lightweight runtime counterpart of Pokemon, for hot loops such as combat simulations. It is a
+    slotted class without pydantic validation: assignments only coerce numeric attributes with
+    plain code and keep health from dropping below 0, like Pokemon's validators do. Its methods
+    are those of Pokemon, so both behave the same. Use `from_pokemon` and `to_pokemon` to convert
+    from and to the validated model.
+    """
+
+    __slots__ = tuple(Pokemon.__fields__)
+
+    def __init__(
+        self,
+        code: int,
+        number: int,
+        name: str,
+        level: Optional[int],
+        health: int,
+        attack: int,
+        defense: int,
+        special_attack: int,
+        special_defense: int,
+        speed: int,
+        nature: Optional[str] = None,
+        iv: Optional[List[int]] = None,
+        ev: Optional[List[int]] = None,
+        accuracy: float = 1.0,
+        dodge: float = 1.0,
+        base_xp: Optional[int] = 0,
+        base_ev: Optional[List[int]] = None,
+        experience: Optional[int] = None,
+    ):
+        self.code = code
+        self.number = number
+        self.name = name
+        self.level = level
+        self.health = health
+        self.attack = attack
+        self.defense = defense
+        self.special_attack = special_attack
+        self.special_defense = special_defense
+        self.speed = speed
+        self.nature = nature
+        self.iv = iv
+        self.ev = ev
+        self.accuracy = accuracy
+        self.dodge = dodge
+        self.base_xp = base_xp
+        self.base_ev = base_ev
+        self.experience = experience
+
+    def __setattr__(self, attribute: str, value) -> None:
+        if attribute in INT_FIELDS:
+            if value is not None:
+                value = int(value)
+                if attribute == "health" and value < 0:
+                    logger.critical("HP have dropped below 0, pokemon has fainted!")
+                    value = 0
+        elif attribute in FLOAT_FIELDS:
+            value = float(value)
+        elif attribute in LIST_FIELDS:
+            value = [0, 0, 0, 0, 0, 0] if value is None else [int(element) for element in value]
+        object.__setattr__(self, attribute, value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (FastPokemon, Pokemon)):
+            return self.dict() == other.dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        attributes = " ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"FastPokemon({attributes})"
+
+    def __getstate__(self) -> dict:
+        return self.dict()
+
+    def __setstate__(self, state: dict) -> None:
+        for field, value in state.items():
+            setattr(self, field, value)
+
+    # ----- Conversions ----- #
+
+    @classmethod
+    def from_pokemon(cls, pokemon: Pokemon) -> "FastPokemon":
+        """
+        Create a FastPokemon from a Pokemon object, copying its data.
+
+        Args:
+            pokemon (Pokemon): the validated Pokemon object.
+
+        Returns:
+            A FastPokemon with the same data.
+        """
+        return cls(**{field: getattr(pokemon, field) for field in cls.__slots__})
+
+    def to_pokemon(self) -> Pokemon:
+        """
+        Create a validated Pokemon object from this instance's data.
+
+        Returns:
+            A Pokemon with the same data.
+        """
+        return Pokemon(**self.dict())
+
+    def dict(self) -> dict:
+        """Return the pokemon's data as a dictionary, as `Pokemon.dict` does."""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        for field in LIST_FIELDS:
+            data[field] = list(data[field])
+        return data
+
+    def copy(self) -> "FastPokemon":
+        """Return a copy of this instance, not sharing its IV and EV lists."""
+        return FastPokemon(**self.dict())
+
+    # ----- Shared Functionality ----- #
+
+    total = Pokemon.total
+    types = Pokemon.types
+    experience_given = Pokemon.experience_given
+    experience_to_level = Pokemon.experience_to_level
+    experience_to_next_level = Pokemon.experience_to_next_level
+    gain_experience = Pokemon.gain_experience
+    gain_experience_from = Pokemon.gain_experience_from
+    gain_evs = Pokemon.gain_evs
+    gain_evs_from = Pokemon.gain_evs_from
+    level_up = Pokemon.level_up
+    _update_stats_on_levelup = Pokemon._update_stats_on_levelup
+    hit_probability = Pokemon.hit_probability
+    perform_physical_attack = Pokemon.perform_physical_attack
+    perform_special_attack = Pokemon.perform_special_attack
+    use_move = Pokemon.use_move
+    to_bytes = Pokemon.to_bytes
+    to_binary = Pokemon.to_binary
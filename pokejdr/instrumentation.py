@@ -0,0 +1,309 @@
+"""
+Opt-in instrumentation of the package's hot paths, counting the calls and cumulative wall time of
+generation, stat recomputation, damage calculation, validation and I/O operations. Instrumenting
+installs timing wrappers in place of the operations' functions, and disabling it puts the original
+functions back, so that instrumentation costs nothing while disabled. Counters can be exported as
+a dict, as JSON or in the Prometheus text format, to be exposed by long running applications.
+
+    with instrumented():
+        ...
+    print(prometheus_text())
+"""
+
+import functools
+import importlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from loguru import logger
+
+# Instrumented functions by operation category, as "module:attribute path". Functions imported by
+# name in other modules are listed under each of these names, and the methods FastPokemon copies
+# from Pokemon under both classes.
+INSTRUMENTED_OPERATIONS: Dict[str, Tuple[str, ...]] = {
+    "generation": (
+        "pokejdr.model:Pokemon.generate_random",
+        "pokejdr.model:Pokemon.generate_batch",
+    ),
+    "stats": (
+        "pokejdr.stats:compute_stats",
+        "pokejdr.model:compute_stats",
+        "pokejdr.stats:compute_stats_batch",
+        "pokejdr.model:compute_stats_batch",
+        "pokejdr.table:compute_stats_batch",
+        "pokejdr.model:Pokemon._update_stats_on_levelup",
+        "pokejdr.fast:FastPokemon._update_stats_on_levelup",
+        "pokejdr.model:Pokemon.level_up",
+        "pokejdr.fast:FastPokemon.level_up",
+        "pokejdr.model:Pokemon.gain_experience",
+        "pokejdr.fast:FastPokemon.gain_experience",
+        "pokejdr.model:Pokemon.gain_evs",
+        "pokejdr.fast:FastPokemon.gain_evs",
+        "pokejdr.table:PokemonTable.level_up",
+    ),
+    "damage": (
+        "pokejdr.model:dealt_damage",
+        "pokejdr.model:dealt_damage_batch",
+        "pokejdr.simulation:dealt_damage_batch",
+        "pokejdr.model:Pokemon.perform_physical_attack",
+        "pokejdr.fast:FastPokemon.perform_physical_attack",
+        "pokejdr.model:Pokemon.perform_special_attack",
+        "pokejdr.fast:FastPokemon.perform_special_attack",
+        "pokejdr.model:Pokemon.use_move",
+        "pokejdr.fast:FastPokemon.use_move",
+    ),
+    "validation": (
+        "pokejdr.model:Pokemon.__init__",
+        "pokejdr.model:Pokemon.__setattr__",
+    ),
+    "io": (
+        "pokejdr.model:Pokemon.to_json",
+        "pokejdr.model:Pokemon.from_json",
+        "pokejdr.model:Pokemon.to_pickle",
+        "pokejdr.model:Pokemon.from_pickle",
+        "pokejdr.model:Pokemon.to_bytes",
+        "pokejdr.model:Pokemon.from_bytes",
+        "pokejdr.model:Pokemon.to_binary",
+        "pokejdr.model:Pokemon.from_binary",
+        "pokejdr.fast:FastPokemon.to_bytes",
+        "pokejdr.fast:FastPokemon.to_binary",
+        "pokejdr.roster:save_roster",
+        "pokejdr.roster:load_roster",
+    ),
+}
+PROMETHEUS_PREFIX = "pokejdr_operation"
+
+_MISSING = object()
+
+_enabled = False
+_lock = threading.Lock()
+_calls: Dict[str, int] = {}
+_seconds: Dict[str, float] = {}
+_categories: Dict[str, str] = {}
+# Patched owners with the attribute name and original value to restore when disabling
+_patches: List[Tuple[object, str, object]] = []
+
+
+# ----- Switching ----- #
+
+
+def enable_instrumentation() -> None:
+    """
+    Start counting the calls and wall time of the instrumented operations, by installing timing
+    wrappers in place of their functions. Counters keep their values from previous runs, see
+    `reset_instrumentation`.
+    """
+    global _enabled
+    if _enabled:
+        return
+    logger.debug("Enabling instrumentation")
+    # Import every module first, so that none captures a wrapper when importing from another
+    targets = [
+        (_resolve(target), category)
+        for category, category_targets in INSTRUMENTED_OPERATIONS.items()
+        for target in category_targets
+    ]
+    with _lock:
+        for (owner, attribute, operation), category in targets:
+            _install_wrapper(owner, attribute, operation, category)
+    _enabled = True
+
+
+def disable_instrumentation() -> None:
+    """Stop counting, putting back the original functions of the instrumented operations."""
+    global _enabled
+    if not _enabled:
+        return
+    logger.debug("Disabling instrumentation")
+    _enabled = False
+    with _lock:
+        while _patches:
+            owner, attribute, original = _patches.pop()
+            if original is _MISSING:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, _unwrapped(original))
+
+
+def reset_instrumentation() -> None:
+    """Set the call counters and cumulative wall times of all operations back to zero."""
+    with _lock:
+        for operation in _calls:
+            _calls[operation] = 0
+            _seconds[operation] = 0.0
+
+
+def instrumentation_enabled() -> bool:
+    """Return whether the instrumented operations are currently being counted."""
+    return _enabled
+
+
+@contextmanager
+def instrumented(reset: bool = False) -> Iterator[None]:
+    """
+    Context manager counting the instrumented operations run in its body, see
+    `enable_instrumentation`.
+
+    Args:
+        reset (bool): whether to reset the counters when entering. Defaults to False.
+    """
+    was_enabled = _enabled
+    if reset:
+        reset_instrumentation()
+    enable_instrumentation()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable_instrumentation()
+
+
+# ----- Export ----- #
+
+
+def snapshot() -> Dict[str, Dict[str, object]]:
+    """
+    Return the current counters of the operations instrumented at least once.
+
+    Returns:
+        A dict with, for each operation, its category, number of calls and cumulative wall time
+        in seconds.
+    """
+    with _lock:
+        return {
+            operation: {
+                "category": _categories[operation],
+                "calls": _calls[operation],
+                "seconds": _seconds[operation],
+            }
+            for operation in sorted(_calls)
+        }
+
+
+def snapshot_json(indent: int = None) -> str:
+    """
+    Return the current counters as a JSON document, see `snapshot`.
+
+    Args:
+        indent (int): indentation of the document. Defaults to None, for a single line.
+
+    Returns:
+        The JSON encoded counters.
+    """
+    return json.dumps(snapshot(), indent=indent)
+
+
+def prometheus_text() -> str:
+    """
+    Return the current counters in the Prometheus text exposition format, as two counter metrics
+    labelled by operation and category.
+
+    Returns:
+        The metrics, ready to be served on a scraping endpoint.
+    """
+    counters = snapshot()
+    lines = [
+        f"# HELP {PROMETHEUS_PREFIX}_calls_total Number of calls of pokejdr operations.",
+        f"# TYPE {PROMETHEUS_PREFIX}_calls_total counter",
+    ]
+    lines.extend(
+        f"{PROMETHEUS_PREFIX}_calls_total{_labels(operation, values)} {values['calls']}"
+        for operation, values in counters.items()
+    )
+    lines.extend(
+        [
+            f"# HELP {PROMETHEUS_PREFIX}_seconds_total Wall time spent in pokejdr operations.",
+            f"# TYPE {PROMETHEUS_PREFIX}_seconds_total counter",
+        ]
+    )
+    lines.extend(
+        f"{PROMETHEUS_PREFIX}_seconds_total{_labels(operation, values)} {values['seconds']!r}"
+        for operation, values in counters.items()
+    )
+    return "\n".join(lines) + "\n"
+
+
+# ----- Private Helpers ----- #
+
+
+def _labels(operation: str, values: Dict[str, object]) -> str:
+    return f'{{operation="{operation}",category="{values["category"]}"}}'
+
+
+def _resolve(target: str) -> Tuple[object, str, str]:
+    """
+    Resolve a "module:attribute path" target, importing its module.
+
+    Args:
+        target (str): location of the function to instrument.
+
+    Returns:
+        The object owning the function, the function's attribute name and the operation name.
+    """
+    module_name, path = target.split(":")
+    owner = importlib.import_module(module_name)
+    *owner_path, attribute = path.split(".")
+    for name in owner_path:
+        owner = getattr(owner, name)
+    return owner, attribute, path
+
+
+def _install_wrapper(owner: object, attribute: str, operation: str, category: str) -> None:
+    """
+    Replace a function by a timing wrapper, and record the original to restore. Staticmethod and
+    classmethod descriptors are re-created around the wrapper.
+
+    Args:
+        owner (object): module or class owning the function.
+        attribute (str): name of the function in its owner.
+        operation (str): name under which calls are counted.
+        category (str): category of the operation, for the exports.
+    """
+    original = vars(owner).get(attribute, _MISSING)
+    function = getattr(owner, attribute) if original is _MISSING else original
+    if isinstance(function, (classmethod, staticmethod)):
+        wrapper = type(function)(_timed(function.__func__, operation))
+    else:
+        wrapper = _timed(function, operation)
+    _categories[operation] = category
+    _calls.setdefault(operation, 0)
+    _seconds.setdefault(operation, 0.0)
+    _patches.append((owner, attribute, original))
+    setattr(owner, attribute, wrapper)
+
+
+def _unwrapped(function):
+    """Return the function instrumenting wrappers were installed around, or the function itself."""
+    if isinstance(function, (classmethod, staticmethod)):
+        return type(function)(_unwrapped(function.__func__))
+    while hasattr(function, "__instrumented__"):
+        function = function.__wrapped__
+    return function
+
+
+def _timed(function: Callable, operation: str) -> Callable:
+    """
+    Wrap a function to count its calls and wall time under the given operation. Wrappers captured
+    while instrumenting, for instance by a module imported meanwhile, only add a flag check once
+    instrumentation is disabled.
+    """
+    function = _unwrapped(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with _lock:
+                _calls[operation] += 1
+                _seconds[operation] += elapsed
+
+    wrapper.__instrumented__ = operation
+    return wrapper
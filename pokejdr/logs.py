@@ -0,0 +1,68 @@
+"""
+Logging configuration for pokejdr, which logs through loguru under the "pokejdr" name. Importing
+the package does not add any handler: messages go to whatever sinks the application configured
+(loguru's default one writes to stderr). Logging calls use deferred formatting, so that in quiet
+mode, or when no handler accepts their level, messages are never formatted. Setting the
+POKEJDR_QUIET environment variable to a non-empty value starts the package in quiet mode, which
+is also inherited by worker processes.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from loguru import logger
+
+from pokejdr.constants import LOGURU_FORMAT, QUIET_ENV_VARIABLE
+
+_quiet = False
+
+
+def enable_logging(
+    sink=sys.stderr, level: str = "DEBUG", format: str = LOGURU_FORMAT
+) -> Optional[int]:
+    """
+    Enable the package's logging and add a sink for its messages, with the package's format.
+
+    Args:
+        sink: any sink accepted by loguru's `logger.add`, or None to only re-enable logging
+            without adding a sink. Defaults to stderr.
+        level (str): minimum level of the messages sent to the sink. Defaults to DEBUG.
+        format (str): format of the messages. Defaults to LOGURU_FORMAT.
+
+    Returns:
+        The id of the added handler, to be given to `logger.remove`, or None if no sink was added.
+    """
+    global _quiet
+    _quiet = False
+    logger.enable("pokejdr")
+    if sink is None:
+        return None
+    return logger.add(sink, level=level, format=format, filter="pokejdr")
+
+
+def disable_logging() -> None:
+    """
+    Switch the package to quiet mode: its logging calls return immediately, without formatting
+    their messages. Recommended for simulations and other hot loops.
+    """
+    global _quiet
+    _quiet = True
+    logger.disable("pokejdr")
+
+
+@contextmanager
+def quiet_logging() -> Iterator[None]:
+    """Context manager running its body in quiet mode, see `disable_logging`."""
+    was_quiet = _quiet
+    disable_logging()
+    try:
+        yield
+    finally:
+        if not was_quiet:
+            enable_logging(sink=None)
+
+
+if os.environ.get(QUIET_ENV_VARIABLE):
+    disable_logging()
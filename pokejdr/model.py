@@ -1,20 +1,35 @@
 import json
 import pickle
-import sys
+import struct
 from pathlib import Path
-from random import uniform
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-import pandas as pd
 from loguru import logger
 from pydantic import BaseModel, PositiveInt, validator
 
-from pokejdr.base_stats import NATURES_DF, POKEMONS_DF
-from pokejdr.constants import LOGURU_FORMAT
-
-logger.remove(0)
-logger.add(sys.stderr, format=LOGURU_FORMAT)
+from pokejdr import base_stats as data
+from pokejdr.base_stats import SpeciesStats
+from pokejdr.moves import _assert_power_based_damage, get_move
+from pokejdr.rng import RandomState, get_rng
+from pokejdr.stats import compute_stats, compute_stats_batch
+from pokejdr.type_chart import (
+    NO_TYPE,
+    effectiveness,
+    effectiveness_batch,
+    stab,
+    stab_batch,
+    type_ids,
+)
+
+PHYSICAL_ATTACK_TYPES = ("normal", "physical")
+SPECIAL_ATTACK_TYPES = ("special", "spe")
+
+# Fixed layout of `Pokemon.to_bytes`, little-endian: format version, name id (row of the species
+# registry), nature id (-1 for None), code, number, level (0 for None), the 6 stats, IVs, EVs,
+# accuracy, dodge, base experience (-1 for None), base EVs and experience (-1 for None)
+BINARY_FORMAT_VERSION = 1
+BINARY_LAYOUT = struct.Struct("<BHbHHB6H6B6Hddi6Bi")
 
 
 # ----- Models ----- #
@@ -38,6 +53,7 @@ class Pokemon(BaseModel):
     dodge: float = 1.0
     base_xp: Optional[int] = 0
     base_ev: Optional[List[int]] = [0, 0, 0, 0, 0, 0]
+    experience: Optional[int] = None  # total accumulated, None until first tracked
 
     @validator("health")
     def doesnt_drop_below_0(cls, v) -> int:
@@ -65,6 +81,11 @@ class Pokemon(BaseModel):
             + self.speed
         )
 
+    @property
+    def types(self) -> Tuple[str, ...]:
+        """The one or two elemental types of the pokemon's species, empty for unknown species."""
+        return _species_types(self.name)
+
     # ----- Experience Functionality ----- #
 
     def experience_given(self, contextual_bonus: float = 1) -> int:
@@ -79,8 +100,8 @@ class Pokemon(BaseModel):
             The amount of experience gained.
         """
         experience = round(contextual_bonus * self.base_xp * self.level / 7)
-        logger.info(f"{experience} experience is gained for defeating {self.name}")
-        logger.info(f"The following EV are gained for defeating {self.name}: {self.base_ev}")
+        logger.info("{} experience is gained for defeating {}", experience, self.name)
+        logger.info("The following EV are gained for defeating {}: {}", self.name, self.base_ev)
         return experience
 
     def experience_to_level(self, target_level: int, leveling_type: str) -> int:
@@ -95,12 +116,12 @@ class Pokemon(BaseModel):
         Returns:
             The total experience needed to reach the target level.
         """
-        _assert_valid_leveling_cruve(leveling_type)
-        _assert_valid_target_level(target_level)
-        required_experience = round(LEVELING_CURVES[leveling_type](target_level))
-        logger.info(
-            f"The amount of experience {self.name} needs to reach level {target_level} "
-            f"is {required_experience:,}".replace(",", " ")
+        required_experience = int(experience_for_levels(target_level, leveling_type))
+        logger.opt(lazy=True).info(
+            "The amount of experience {} needs to reach level {} is {}",
+            lambda: self.name,
+            lambda: target_level,
+            lambda: f"{required_experience:,}".replace(",", " "),
         )
         return required_experience
 
@@ -108,7 +129,7 @@ class Pokemon(BaseModel):
         """
         Calculate the total amount of experience to go from the pokemon's current level to the next
         level. This does not take in account how much experience the pokemon has accumulated in
-        the current level, which is up to the players to keep track of.
+        the current level, which is tracked by `gain_experience`.
 
         Args:
             leveling_type (str): name of the leveling curve for the pokemon.
@@ -116,15 +137,113 @@ class Pokemon(BaseModel):
         Returns:
             The experience needed to reach the next level from the current level.
         """
-        required_experience = self.experience_to_level(
-            self.level + 1, leveling_type
-        ) - self.experience_to_level(self.level, leveling_type)
-        logger.info(
-            f"The amount of experience {self.name} needs to reach the next level "
-            f"is {required_experience:,}".replace(",", " ")
+        current_level_experience, next_level_experience = experience_for_levels(
+            [self.level, self.level + 1], leveling_type
+        ).tolist()
+        required_experience = next_level_experience - current_level_experience
+        logger.opt(lazy=True).info(
+            "The amount of experience {} needs to reach the next level is {}",
+            lambda: self.name,
+            lambda: f"{required_experience:,}".replace(",", " "),
         )
         return required_experience
 
+    def gain_experience(self, experience: int, leveling_type: str) -> int:
+        """
+        Add experience to the pokemon's total, and level it up as many times as this amount allows
+        according to its leveling curve. Stats are only updated once, at the final level. If the
+        pokemon's experience was not tracked yet, it starts from what its current level requires.
+
+        Args:
+            experience (int): the amount of experience gained.
+            leveling_type (str): name of the leveling curve for the pokemon.
+
+        Returns:
+            The number of levels gained.
+        """
+        _assert_valid_experience_gain(experience)
+        thresholds = experience_for_levels([self.level, 100], leveling_type).tolist()
+        current_experience = thresholds[0] if self.experience is None else self.experience
+        self.experience = min(current_experience + experience, thresholds[1])
+        new_level = max(int(level_from_experience(self.experience, leveling_type)), self.level)
+        levels_gained = new_level - self.level
+        logger.info(
+            "{} gains {} experience, for a total of {}, and {} level(s)",
+            self.name,
+            experience,
+            self.experience,
+            levels_gained,
+        )
+        if levels_gained:
+            self.level = new_level
+            self._update_stats_on_levelup()
+        return levels_gained
+
+    def gain_experience_from(
+        self, defeated_pokemon, leveling_type: str, contextual_bonus: float = 1
+    ) -> int:
+        """
+        Convenience function to gain the experience given for defeating another pokemon, see
+        `experience_given` and `gain_experience`.
+
+        Args:
+            defeated_pokemon (Pokemon): Pokemon object of the defeated pokemon.
+            leveling_type (str): name of the leveling curve for the pokemon.
+            contextual_bonus (float): a bonus coefficient depending on context such as an object
+                held by the pokemon. Defaults to 1.
+
+        Returns:
+            The number of levels gained.
+        """
+        return self.gain_experience(
+            defeated_pokemon.experience_given(contextual_bonus), leveling_type
+        )
+
+    def gain_evs(self, evs: Sequence[int]) -> List[int]:
+        """
+        Add EVs to the pokemon's EVs, within the limits of MAX_STAT_EV per stat and MAX_TOTAL_EV
+        in total, see `gain_evs_batch`. Stats are only recomputed if the EVs actually changed, and
+        the pokemon keeps the damage it has taken: its health changes as much as its max health.
+
+        Args:
+            evs (Sequence[int]): the 6 EVs gained, before capping.
+
+        Returns:
+            The EVs actually gained, after capping.
+        """
+        current_evs = np.array(self.ev or [0] * 6, dtype=np.int64)
+        new_evs = gain_evs_batch(current_evs, evs)
+        gained_evs = (new_evs - current_evs).tolist()
+        logger.info("{} gains the following EVs: {}", self.name, gained_evs)
+        if any(gained_evs):
+            if self.level is None:
+                self.ev = new_evs.tolist()
+            else:
+                previous_max_health = compute_stats(
+                    self.name, self.level, self.nature, self.iv, current_evs.tolist()
+                )[0]
+                damage_taken = previous_max_health - self.health
+                self.ev = new_evs.tolist()
+                self._update_stats_on_levelup()
+                self.health = max(self.health - damage_taken, 0)
+        return gained_evs
+
+    def gain_evs_from(self, defeated_pokemon, multiplier: int = 1) -> List[int]:
+        """
+        Convenience function to gain the EVs given for defeating another pokemon, which are its
+        base EVs, see `gain_evs`.
+
+        Args:
+            defeated_pokemon (Pokemon): Pokemon object of the defeated pokemon.
+            multiplier (int): a coefficient depending on context such as an object held by the
+                pokemon. Defaults to 1.
+
+        Returns:
+            The EVs actually gained, after capping.
+        """
+        base_evs = defeated_pokemon.base_ev or [0] * 6
+        return self.gain_evs([multiplier * base_ev for base_ev in base_evs])
+
     def level_up(self) -> None:
         """
         Convenience function to increment the pokemon's level and trigger an update of its stats.
@@ -138,28 +257,16 @@ class Pokemon(BaseModel):
         Called when the level attribute is changed, triggering a re-calculation of the
         pokemon's stats based on its EVs.
         """
-        logger.info(f"{self.name} has reached level {self.level}, updating stats now.")
-        defaults: Pokemon = _base_pokemon_stats(self.name)
-        nature_stat: pd.DataFrame = NATURES_DF[NATURES_DF.nature == self.nature]
-        self.health = (
-            (2 * defaults.health + self.iv[0] + self.ev[0] / 4) * self.level / 100 + self.level + 10
-        )
-        self.attack = (
-            (2 * defaults.attack + self.iv[1] + self.ev[1] / 4) * self.level / 100 + 5
-        ) * nature_stat.attack.to_numpy()[0]
-        self.defense = (
-            (2 * defaults.defense + self.iv[2] + self.ev[2] / 4) * self.level / 100 + 5
-        ) * nature_stat.defense.to_numpy()[0]
-        self.special_attack = (
-            (2 * defaults.special_attack + self.iv[3] + self.ev[3] / 4) * self.level / 100 + 5
-        ) * nature_stat.special_attack.to_numpy()[0]
-        self.special_defense = (
-            (2 * defaults.special_defense + self.iv[4] + self.ev[4] / 4) * self.level / 100 + 5
-        ) * nature_stat.special_defense.to_numpy()[0]
-        self.speed = (
-            (2 * defaults.speed + self.iv[5] + self.ev[5] / 4) * self.level / 100 + 5
-        ) * nature_stat.speed.to_numpy()[0]
-        logger.debug(f"{self.name}'s stats have been updated!")
+        logger.info("{} has reached level {}, updating stats now.", self.name, self.level)
+        (
+            self.health,
+            self.attack,
+            self.defense,
+            self.special_attack,
+            self.special_defense,
+            self.speed,
+        ) = compute_stats(self.name, self.level, self.nature, self.iv, self.ev)
+        logger.debug("{}'s stats have been updated!", self.name)
 
     # ----- Combat Functionality ----- #
 
@@ -176,7 +283,9 @@ class Pokemon(BaseModel):
             The probability as a float between 0 and 1, rounded to 3 digits precision.
         """
         probability = self.accuracy * move_accuracy / target_pokemon.dodge
-        logger.info(f"{self.name} has a {probability:.2%} change of hitting {target_pokemon.name}")
+        logger.info(
+            "{} has a {:.2%} change of hitting {}", self.name, probability, target_pokemon.name
+        )
         return round(probability, 3)
 
     def perform_physical_attack(
@@ -186,6 +295,8 @@ class Pokemon(BaseModel):
         attack_modifier: float = 1,
         defense_modifier: float = 1,
         global_modifier: float = 1,
+        rng: RandomState = None,
+        move_type: Optional[str] = None,
     ) -> None:
         """
         Performs an attack of type normal / physical onto the target pokemon. The damage is
@@ -202,6 +313,10 @@ class Pokemon(BaseModel):
                 aka no modification.
             global_modifier (float): input by GM, really weird calculation. Defaults to 1,
                 aka no modification.
+            rng (RandomState): numpy Generator or seed for the damage's random factor. Defaults
+                to None, which uses the default generator of `pokejdr.rng`.
+            move_type (Optional[str]): elemental type of the attack move, to account for STAB
+                and type effectiveness. Defaults to None, which ignores types.
         """
         damage_dealt = dealt_damage(
             self,
@@ -211,9 +326,11 @@ class Pokemon(BaseModel):
             attack_modifier,
             defense_modifier,
             global_modifier,
+            rng,
+            move_type,
         )
         target_pokemon.health -= damage_dealt
-        logger.info(f"{target_pokemon.name}'s health is now at {target_pokemon.health}")
+        logger.info("{}'s health is now at {}", target_pokemon.name, target_pokemon.health)
 
     def perform_special_attack(
         self,
@@ -222,6 +339,8 @@ class Pokemon(BaseModel):
         attack_modifier: float = 1,
         defense_modifier: float = 1,
         global_modifier: float = 1,
+        rng: RandomState = None,
+        move_type: Optional[str] = None,
     ) -> None:
         """
         Performs an attack of type special onto the target pokemon. The damage is
@@ -238,6 +357,10 @@ class Pokemon(BaseModel):
                 aka no modification.
             global_modifier (float): input by GM, really weird calculation. Defaults to 1,
                 aka no modification.
+            rng (RandomState): numpy Generator or seed for the damage's random factor. Defaults
+                to None, which uses the default generator of `pokejdr.rng`.
+            move_type (Optional[str]): elemental type of the attack move, to account for STAB
+                and type effectiveness. Defaults to None, which ignores types.
         """
         damage_dealt = dealt_damage(
             self,
@@ -247,66 +370,199 @@ class Pokemon(BaseModel):
             attack_modifier,
             defense_modifier,
             global_modifier,
+            rng,
+            move_type,
         )
         target_pokemon.health -= damage_dealt
-        logger.info(f"{target_pokemon.name}'s health is now at {target_pokemon.health}")
+        logger.info("{}'s health is now at {}", target_pokemon.name, target_pokemon.health)
+
+    def use_move(
+        self,
+        target_pokemon,
+        move_name: str,
+        attack_modifier: float = 1,
+        defense_modifier: float = 1,
+        global_modifier: float = 1,
+        rng: RandomState = None,
+    ) -> bool:
+        """
+        Uses a move of the moves table onto the target pokemon. Whether the move hits is drawn
+        from `hit_probability` with the move's accuracy, then damaging moves are performed as a
+        physical or special attack depending on their category, with the move's power and type.
+        Damaging moves without a power, whose damage follows their own rules (Seismic Toss, Low
+        Kick, Guillotine...), are not supported and raise ValueError.
+        Status moves deal no damage.
+
+        Args:
+            target_pokemon (Pokemon): Pokemon object of the pokemon getting attacked.
+            move_name (str): name of the move used, must be a valid name from the games.
+            attack_modifier (float): modifier of the attacker's attack, depending on effects
+                currently on the pokemon (from objects, previous moves etc). Defaults to 1,
+                aka no modification.
+            defense_modifier (float): modifier of the defender's defense, depending on effects
+                currently on the pokemon (from objects, previous moves etc). Defaults to 1,
+                aka no modification.
+            global_modifier (float): input by GM, for modifiers other than STAB and type
+                effectiveness. Defaults to 1, aka no modification.
+            rng (RandomState): numpy Generator or seed for the hit and the damage's random
+                factor. Defaults to None, which uses the default generator of `pokejdr.rng`.
+
+        Returns:
+            Whether the move hit the target pokemon.
+        """
+        move = get_move(move_name)
+        _assert_power_based_damage(move)
+        rng = get_rng(rng)
+        if rng.random() >= self.hit_probability(target_pokemon, move.accuracy):
+            logger.info("{}'s {} missed {}", self.name, move.name, target_pokemon.name)
+            return False
+        if move.category == "status":
+            logger.info("{} uses {} on {}", self.name, move.name, target_pokemon.name)
+            return True
+        perform_attack = (
+            self.perform_physical_attack
+            if move.category == "physical"
+            else self.perform_special_attack
+        )
+        perform_attack(
+            target_pokemon,
+            move.power,
+            attack_modifier,
+            defense_modifier,
+            global_modifier,
+            rng,
+            move.type,
+        )
+        return True
 
     # ----- Random Generation ----- #
 
     @classmethod
-    def generate_random(cls, name: str, level: int):
+    def generate_random(cls, name: str, level: int, rng: RandomState = None):
         """
         Generate a random specific pokemon of the given level.
 
         Args:
             name (str): name of the encountered pokemon, must be a valid name from the games.
             level (int): level of the encountered pokemon.
+            rng (RandomState): numpy Generator or seed to draw from. Defaults to None, which uses
+                the default generator of `pokejdr.rng`.
 
         Returns:
             A Pokemon object with generated stats.
         """
-        name = _get_random_pokemon_name() if name == "random" else name
+        rng = get_rng(rng)
+        name = _get_random_pokemon_name(rng) if name == "random" else name
         _assert_pokemon_exists(name)
-        logger.info(f"Creating a random {name.capitalize()} of level {level}")
+        logger.info("Creating a random {} of level {}", name.capitalize(), level)
 
         base_pokemon = _base_pokemon_stats(name)
-        logger.debug(f"Generating random IV for {name}")
-        randiv = list(np.random.randint(0, 32, 6))
-        random_nature = _random_nature_attributes()
+        logger.debug("Generating random IV for {}", name)
+        randiv = rng.integers(0, 32, 6).tolist()
+        nature_id = _random_nature_id(rng)
 
         logger.debug(
-            f"Computing attributes based on provided level ({level}) and attributed nature "
-            f"({random_nature.nature.to_numpy()[0]})"
+            "Computing attributes based on provided level ({}) and attributed nature ({})",
+            level,
+            data.NATURE_NAMES[nature_id],
         )
+        stats = compute_stats(name, level, data.NATURE_NAMES[nature_id], randiv)
         return cls(
             code=base_pokemon.code,
             number=base_pokemon.number,
             name=base_pokemon.name,
             level=level,
-            health=round((2 * base_pokemon.health + randiv[0]) * level / 100 + level + 10),
-            attack=round(
-                ((2 * base_pokemon.attack + randiv[1]) * level / 100 + 5) * random_nature.attack
-            ),
-            defense=round(
-                ((2 * base_pokemon.defense + randiv[2]) * level / 100 + 5) * random_nature.defense
-            ),
-            special_attack=round(
-                ((2 * base_pokemon.special_attack + randiv[3]) * level / 100 + 5)
-                * random_nature.special_attack
-            ),
-            special_defense=round(
-                ((2 * base_pokemon.special_defense + randiv[4]) * level / 100 + 5)
-                * random_nature.special_defense
-            ),
-            speed=round(
-                ((2 * base_pokemon.speed + randiv[5]) * level / 100 + 5) * random_nature.speed
-            ),
-            nature=random_nature.nature.to_numpy()[0],
+            health=stats[0],
+            attack=stats[1],
+            defense=stats[2],
+            special_attack=stats[3],
+            special_defense=stats[4],
+            speed=stats[5],
+            nature=data.NATURE_NAMES[nature_id],
             iv=randiv,
             base_xp=base_pokemon.base_xp,
             base_ev=base_pokemon.base_ev,
         )
 
+    @classmethod
+    def generate_batch(
+        cls,
+        names: Union[str, Sequence[str]],
+        levels: Union[int, Sequence[int]],
+        size: Optional[int] = None,
+        as_objects: bool = True,
+        rng: RandomState = None,
+    ) -> Union[List["Pokemon"], Dict[str, np.ndarray]]:
+        """
+        Generate many random pokemons at once. IVs and natures are drawn for the whole batch in
+        one go and stats are computed with array operations, which is much faster than calling
+        `generate_random` in a loop.
+
+        Args:
+            names (Union[str, Sequence[str]]): names of the encountered pokemons, each one being a
+                valid name from the games or "random". A single name is used for the whole batch.
+            levels (Union[int, Sequence[int]]): levels of the encountered pokemons. A single level
+                is used for the whole batch.
+            size (Optional[int]): number of pokemons to generate, only needed when both names and
+                levels are given as single values. Defaults to None.
+            as_objects (bool): if True, return a list of Pokemon objects. Otherwise return the
+                generated data as a dictionary of numpy arrays keyed by attribute name, with the
+                "iv", "ev" and "base_ev" arrays of shape (N, 6). Defaults to True.
+            rng (RandomState): numpy Generator or seed to draw from. Defaults to None, which uses
+                the default generator of `pokejdr.rng`.
+
+        Returns:
+            A list of Pokemon objects, or a dictionary of numpy arrays.
+        """
+        names_array = np.asarray(names, dtype=object)
+        levels_array = np.asarray(levels, dtype=np.int64)
+        shape = np.broadcast(names_array, levels_array).shape if size is None else (size,)
+        names_array, levels_array = (
+            np.broadcast_to(names_array, shape).ravel(),
+            np.broadcast_to(levels_array, shape).ravel(),
+        )
+        _assert_valid_levels(levels_array)
+        logger.info("Creating a batch of {} random pokemons", len(names_array))
+
+        rng = get_rng(rng)
+        species_rows = _species_rows(names_array, rng)
+        logger.debug("Generating random IVs and natures for the batch")
+        ivs = rng.integers(0, 32, size=(len(species_rows), 6))
+        nature_ids = rng.integers(len(data.NATURE_NAMES), size=len(species_rows))
+        stats = _generated_stats(
+            data.SPECIES_ARRAYS["base_stats"][species_rows], ivs, levels_array, nature_ids
+        )
+
+        columns = {
+            "code": data.SPECIES_ARRAYS["code"][species_rows].astype(np.int64),
+            "number": data.SPECIES_ARRAYS["number"][species_rows].astype(np.int64),
+            "name": data.SPECIES_ARRAYS["name"][species_rows],
+            "level": levels_array,
+            "health": stats[:, 0],
+            "attack": stats[:, 1],
+            "defense": stats[:, 2],
+            "special_attack": stats[:, 3],
+            "special_defense": stats[:, 4],
+            "speed": stats[:, 5],
+            "nature": np.array(data.NATURE_NAMES, dtype=object)[nature_ids],
+            "iv": ivs,
+            "ev": np.zeros_like(ivs),
+            "accuracy": np.ones(len(species_rows)),
+            "dodge": np.ones(len(species_rows)),
+            "base_xp": data.SPECIES_ARRAYS["base_xp"][species_rows].astype(np.int64),
+            "base_ev": data.SPECIES_ARRAYS["base_ev"][species_rows].astype(np.int64),
+        }
+        if not as_objects:
+            return columns
+
+        logger.debug("Building Pokemon objects from the generated batch")
+        # values are generated with the right types already, skip validation for speed
+        records = {field: array.tolist() for field, array in columns.items()}
+        return [
+            cls.construct(**{field: values[i] for field, values in records.items()})
+            for i in range(len(species_rows))
+        ]
+
     # ----- I/O Functionality ----- #
 
     def to_json(self, json_file: Union[Path, str]) -> None:
@@ -316,7 +572,9 @@ class Pokemon(BaseModel):
         Args:
             json_file (Union[Path, str]): PosixPath object or string with the save file location.
         """
-        logger.info(f"Saving Pokemon data as JSON at '{Path(json_file).absolute()}'")
+        logger.opt(lazy=True).info(
+            "Saving Pokemon data as JSON at '{}'", lambda: Path(json_file).absolute()
+        )
         with Path(json_file).open("w") as disk_data:
             json.dump(self.dict(), disk_data)
 
@@ -328,7 +586,9 @@ class Pokemon(BaseModel):
         Args:
             json_file (Union[Path, str]): PosixPath object or string with the save file location.
         """
-        logger.info(f"Loading JSON Pokemon data from file at '{Path(json_file).absolute()}'")
+        logger.opt(lazy=True).info(
+            "Loading JSON Pokemon data from file at '{}'", lambda: Path(json_file).absolute()
+        )
         return cls.parse_file(json_file, content_type="application/json")
 
     def to_pickle(self, pickle_file: Union[Path, str]) -> None:
@@ -338,7 +598,9 @@ class Pokemon(BaseModel):
         Args:
             pickle_file (Union[Path, str]): PosixPath object or string with the save file location.
         """
-        logger.info(f"Saving Pokemon data as PICKLE at '{Path(pickle_file).absolute()}'")
+        logger.opt(lazy=True).info(
+            "Saving Pokemon data as PICKLE at '{}'", lambda: Path(pickle_file).absolute()
+        )
         with Path(pickle_file).open("wb") as disk_data:
             pickle.dump(self, disk_data)
 
@@ -350,9 +612,143 @@ class Pokemon(BaseModel):
         Args:
             pickle_file (Union[Path, str]): PosixPath object or string with the save file location.
         """
-        logger.info(f"Loading PICKLE Pokemon data from file at '{Path(pickle_file).absolute()}'")
+        logger.opt(lazy=True).info(
+            "Loading PICKLE Pokemon data from file at '{}'", lambda: Path(pickle_file).absolute()
+        )
         return cls.parse_file(pickle_file, content_type="application/pickle", allow_pickle=True)
 
+    def to_bytes(self) -> bytes:
+        """
+        Encode the instance's data in the compact fixed layout of BINARY_LAYOUT, with its name and
+        nature stored as ids of the species and natures registries. Unlike pickle, decoding this
+        format does not run any code, which makes it safe for untrusted data.
+
+        Returns:
+            The encoded data, of BINARY_LAYOUT.size bytes.
+        """
+        try:
+            return BINARY_LAYOUT.pack(
+                BINARY_FORMAT_VERSION,
+                data.SPECIES_INDEX[self.name],
+                -1 if self.nature is None else data.NATURE_INDEX[self.nature],
+                self.code,
+                self.number,
+                0 if self.level is None else self.level,
+                self.health,
+                self.attack,
+                self.defense,
+                self.special_attack,
+                self.special_defense,
+                self.speed,
+                *self.iv,
+                *self.ev,
+                self.accuracy,
+                self.dodge,
+                -1 if self.base_xp is None else self.base_xp,
+                *self.base_ev,
+                -1 if self.experience is None else self.experience,
+            )
+        except (KeyError, TypeError, struct.error) as error:
+            logger.error(f"Pokemon data does not fit the binary layout: {error!r}")
+            raise ValueError("Pokemon can not be encoded.") from error
+
+    @classmethod
+    def from_bytes(cls, encoded: bytes) -> "Pokemon":
+        """
+        Decode a Pokemon instance from data encoded by `to_bytes`. The layout guarantees valid
+        attribute types and the decoded values are range checked, so the instance is not
+        validated again.
+
+        Args:
+            encoded (bytes): the encoded data.
+
+        Returns:
+            The decoded Pokemon.
+        """
+        if len(encoded) != BINARY_LAYOUT.size or encoded[0] != BINARY_FORMAT_VERSION:
+            logger.error(
+                f"Invalid binary Pokemon data, expected {BINARY_LAYOUT.size} bytes starting with "
+                f"format version {BINARY_FORMAT_VERSION}"
+            )
+            raise ValueError("Invalid binary Pokemon data.")
+        values = BINARY_LAYOUT.unpack(encoded)
+        name_id, nature_id, code, number, level, base_xp, experience = (
+            values[1],
+            values[2],
+            values[3],
+            values[4],
+            values[5],
+            values[26],
+            values[33],
+        )
+        if name_id >= len(data.SPECIES_STATS) or not -1 <= nature_id < len(data.NATURE_NAMES):
+            logger.error(f"Invalid name id {name_id} or nature id {nature_id} in binary data")
+            raise ValueError("Invalid binary Pokemon data.")
+        if code < 1 or number < 1 or level > 100:
+            logger.error(f"Invalid code {code}, number {number} or level {level} in binary data")
+            raise ValueError("Invalid binary Pokemon data.")
+        return cls._construct_complete(
+            {
+                "code": code,
+                "number": number,
+                "name": data.SPECIES_STATS[name_id].name,
+                "level": level or None,
+                "health": values[6],
+                "attack": values[7],
+                "defense": values[8],
+                "special_attack": values[9],
+                "special_defense": values[10],
+                "speed": values[11],
+                "nature": None if nature_id == -1 else data.NATURE_NAMES[nature_id],
+                "iv": list(values[12:18]),
+                "ev": list(values[18:24]),
+                "accuracy": values[24],
+                "dodge": values[25],
+                "base_xp": None if base_xp == -1 else base_xp,
+                "base_ev": list(values[27:33]),
+                "experience": None if experience == -1 else experience,
+            }
+        )
+
+    def to_binary(self, binary_file: Union[Path, str]) -> None:
+        """
+        Export the instance's data to disk in the binary format of `to_bytes`.
+
+        Args:
+            binary_file (Union[Path, str]): PosixPath object or string with the save file location.
+        """
+        logger.opt(lazy=True).info(
+            "Saving Pokemon data as BINARY at '{}'", lambda: Path(binary_file).absolute()
+        )
+        Path(binary_file).write_bytes(self.to_bytes())
+
+    @classmethod
+    def from_binary(cls, binary_file: Union[Path, str]) -> "Pokemon":
+        """
+        Load a Pokemon instance's data from disk, saved in the binary format of `to_bytes`.
+
+        Args:
+            binary_file (Union[Path, str]): PosixPath object or string with the save file location.
+        """
+        logger.opt(lazy=True).info(
+            "Loading BINARY Pokemon data from file at '{}'", lambda: Path(binary_file).absolute()
+        )
+        return cls.from_bytes(Path(binary_file).read_bytes())
+
+    @classmethod
+    def _construct_complete(cls, values: dict) -> "Pokemon":
+        """
+        Create an instance without validation from values for all fields, in field order. This is
+        what `construct` does, without its handling of missing fields and defaults.
+        """
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", set(_ALL_FIELDS))
+        return instance
+
+
+_ALL_FIELDS = frozenset(Pokemon.__fields__)
+
 
 # ----- Public Helpers ----- #
 
@@ -365,6 +761,8 @@ def dealt_damage(
     attack_modifier: float = 1,
     defense_modifier: float = 1,
     global_modifier: float = 1,
+    rng: RandomState = None,
+    move_type: Optional[str] = None,
 ) -> float:
     """
     Calculates the damage dealt by a pokemon to another one.
@@ -382,33 +780,118 @@ def dealt_damage(
             aka no modification.
         global_modifier (float): input by GM, really weird calculation. Defaults to 1,
             aka no modification.
+        rng (RandomState): numpy Generator or seed for the random factor. Defaults to None,
+            which uses the default generator of `pokejdr.rng`.
+        move_type (Optional[str]): elemental type of the attack move. When given, the damage is
+            multiplied by the same type attack bonus (STAB) and the type effectiveness against
+            the defender. Defaults to None, which ignores types.
 
     Returns:
                 The damage dealt by the attack.
     """
     _assert_valid_attack_type(attack_type)
-    randomness_factor = uniform(0.85, 1)
+    randomness_factor = get_rng(rng).uniform(0.85, 1)
+    type_modifier = 1.0
+    if move_type is not None:
+        type_modifier = stab(move_type, attacker.types) * effectiveness(move_type, defender.types)
+        logger.debug(
+            "{} move has a type modifier of {} on {}", move_type, type_modifier, defender.name
+        )
 
-    attack_value = attack_modifier * (
-        attacker.attack
-        if attack_type.lower() in ("normal", "physical")
-        else attacker.special_attack
-    )
+    is_physical = attack_type.lower() in PHYSICAL_ATTACK_TYPES
+    attack_value = attack_modifier * (attacker.attack if is_physical else attacker.special_attack)
     defense_value = defense_modifier * (
-        defender.defense
-        if attack_type.lower() in ("normal", "physical")
-        else defender.special_defense
+        defender.defense if is_physical else defender.special_defense
     )
     damage = (
         (2 + (attacker.level * 0.4 + 2) * attack_value * attack_power / defense_value / 50)
         * global_modifier
+        * type_modifier
         * randomness_factor
     )
+    damage = round(damage)
     logger.info(
-        f"{attacker.name} performs a {attack_type} attack on {defender.name} that deals "
-        f"{round(damage)} damage"
+        "{} performs a {} attack on {} that deals {} damage",
+        attacker.name,
+        attack_type,
+        defender.name,
+        damage,
     )
-    return round(damage)
+    return damage
+
+
+def dealt_damage_batch(
+    attacker_stats: np.ndarray,
+    defender_stats: np.ndarray,
+    attacker_levels: Union[int, np.ndarray],
+    attack_types: Union[str, Sequence[str]],
+    attack_powers: Union[float, np.ndarray],
+    attack_modifiers: Union[float, np.ndarray] = 1,
+    defense_modifiers: Union[float, np.ndarray] = 1,
+    global_modifiers: Union[float, np.ndarray] = 1,
+    rng: RandomState = None,
+    move_types: Union[str, Sequence[str], None] = None,
+    attacker_types: Optional[np.ndarray] = None,
+    defender_types: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Vectorized version of `dealt_damage`, calculating the damage of many attacks at once. All
+    inputs are broadcast against each other, so that for instance every move of every attacker
+    can be scored against every target in a single call.
+
+    Args:
+        attacker_stats (np.ndarray): array of shape (..., 6) with the stats of the attacking
+            pokemons, ordered as health, attack, defense, special_attack, special_defense, speed
+            (as given by `PokemonTable.stats`).
+        defender_stats (np.ndarray): array of shape (..., 6) with the stats of the pokemons
+            getting damaged, in the same order.
+        attacker_levels (Union[int, np.ndarray]): levels of the attacking pokemons.
+        attack_types (Union[str, Sequence[str]]): either 'normal' / 'physical' or
+            'special' / 'spe', for each attack.
+        attack_powers (Union[float, np.ndarray]): determined by the attack moves used.
+        attack_modifiers (Union[float, np.ndarray]): modifiers of the attackers' attack.
+            Defaults to 1, aka no modification.
+        defense_modifiers (Union[float, np.ndarray]): modifiers of the defenders' defense.
+            Defaults to 1, aka no modification.
+        global_modifiers (Union[float, np.ndarray]): input by GM, really weird calculation.
+            Defaults to 1, aka no modification.
+        rng (RandomState): numpy Generator or seed for the random factors. Defaults to None,
+            which uses the default generator of `pokejdr.rng`.
+        move_types (Union[str, Sequence[str], None]): elemental types of the attack moves.
+            Defaults to None, which ignores types.
+        attacker_types (Optional[np.ndarray]): array of shape (..., 2) with the type ids of the
+            attacking pokemons (as given by `PokemonTable.types`), for the same type attack
+            bonus (STAB) of the moves. Only used with `move_types`. Defaults to None.
+        defender_types (Optional[np.ndarray]): array of shape (..., 2) with the type ids of the
+            pokemons getting damaged, for the type effectiveness of the moves. Only used with
+            `move_types`. Defaults to None.
+
+    Returns:
+        An integer numpy array with the damage dealt by each attack.
+    """
+    attacker_stats = np.asarray(attacker_stats)
+    defender_stats = np.asarray(defender_stats)
+    is_physical = _physical_attack_mask(attack_types)
+    attack_values = np.where(is_physical, attacker_stats[..., 1], attacker_stats[..., 3])
+    defense_values = np.where(is_physical, defender_stats[..., 2], defender_stats[..., 4])
+
+    damage = (
+        2
+        + (np.asarray(attacker_levels) * 0.4 + 2)
+        * (attack_modifiers * attack_values)
+        * attack_powers
+        / (defense_modifiers * defense_values)
+        / 50
+    ) * global_modifiers
+    if move_types is not None:
+        move_type_ids = _move_type_ids(move_types)
+        if attacker_types is not None:
+            damage = damage * stab_batch(move_type_ids, attacker_types)
+        if defender_types is not None:
+            damage = damage * effectiveness_batch(move_type_ids, defender_types)
+    damage = damage * get_rng(rng).uniform(0.85, 1, size=damage.shape)
+    logger.trace("Computed damage for a batch of {} attacks", damage.size)
+    return np.rint(damage).astype(np.int64)
 
 
 def erratic_leveling(target_level: int) -> int:
@@ -479,11 +962,126 @@ LEVELING_CURVES: Dict[str, callable] = {
     "erratic": erratic_leveling,
     "fluctuating": fluctuating_leveling,
 }
+LEVELING_CURVE_INDEX: Dict[str, int] = {name: row for row, name in enumerate(LEVELING_CURVES)}
+
+# Total experience to reach each level (columns 0 to 100) for each curve (rows, in the order of
+# LEVELING_CURVES), so that lookups don't evaluate the curves again
+EXPERIENCE_TABLE: np.ndarray = np.array(
+    [[round(curve(level)) for level in range(101)] for curve in LEVELING_CURVES.values()],
+    dtype=np.int64,
+)
+EXPERIENCE_TABLE.flags.writeable = False
+
+
+def experience_for_levels(
+    target_levels: Union[int, Sequence[int], np.ndarray], leveling_type: str
+) -> np.ndarray:
+    """
+    Vectorized lookup of the total amount of experience needed to reach the target levels, from
+    experience 0, according to the given leveling curve.
+
+    Args:
+        target_levels (Union[int, Sequence[int], np.ndarray]): the level(s) to reach.
+        leveling_type (str): name of the leveling curve.
+
+    Returns:
+        An integer numpy array, of the same shape as target_levels, with the total experience
+        needed to reach each level.
+    """
+    curve_row = _leveling_curve_row(leveling_type)
+    target_levels = np.asarray(target_levels, dtype=np.int64)
+    _assert_valid_target_level(target_levels.max(initial=0))
+    _assert_valid_target_level_lower_bound(target_levels.min(initial=0))
+    return EXPERIENCE_TABLE[curve_row, target_levels]
+
+
+def level_from_experience(
+    experience: Union[int, Sequence[int], np.ndarray], leveling_type: str
+) -> np.ndarray:
+    """
+    Vectorized reverse lookup of the level reached with the given total amounts of experience,
+    according to the given leveling curve, through a binary search in EXPERIENCE_TABLE. Amounts
+    below what level 1 requires give level 1, and the level is capped at 100.
+
+    Args:
+        experience (Union[int, Sequence[int], np.ndarray]): total amount(s) of experience.
+        leveling_type (str): name of the leveling curve.
+
+    Returns:
+        An integer numpy array, of the same shape as experience, with the reached levels.
+    """
+    curve_row = _leveling_curve_row(leveling_type)
+    # count of levels 1 to 100 whose threshold has been reached, which is the highest one of them
+    levels = np.searchsorted(EXPERIENCE_TABLE[curve_row, 1:], experience, side="right")
+    return np.maximum(levels, 1)
+
+
+# ----- Effort Values ----- #
+
+
+MAX_STAT_EV = 252
+MAX_TOTAL_EV = 510
+
+
+def gain_evs_batch(
+    evs: np.ndarray, gained_evs: np.ndarray, winners: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Vectorized EV gain, adding EVs to many pokemons at once. Gains are clipped so that no EV goes
+    over MAX_STAT_EV, then so that the total of each pokemon's EVs does not go over MAX_TOTAL_EV,
+    the remaining room being allotted in the order of the stats.
+
+    Args:
+        evs (np.ndarray): array of shape (..., 6) with the current EVs of the pokemons.
+        gained_evs (np.ndarray): array of shape (..., 6) with the EVs gained, broadcast against
+            evs. If winners is given, array of shape (K, 6) with the EVs gained in K battles.
+        winners (Optional[np.ndarray]): (K,) array with, for each battle, the row of evs of the
+            pokemon winning it, so that rows winning many battles add up all their gains.
+            Defaults to None, for gains aligned with evs.
+
+    Returns:
+        An integer array of the same shape as evs with the new EVs.
+    """
+    evs = np.asarray(evs, dtype=np.int64)
+    gained_evs = np.asarray(gained_evs, dtype=np.int64)
+    _assert_valid_ev_gains(gained_evs)
+    if winners is not None:
+        totals = np.zeros_like(evs)
+        np.add.at(totals, np.asarray(winners, dtype=np.int64), gained_evs)
+        gained_evs = totals
+    gained_evs = np.clip(gained_evs, 0, np.maximum(MAX_STAT_EV - evs, 0))
+    total_room = np.maximum(MAX_TOTAL_EV - evs.sum(axis=-1, keepdims=True), 0)
+    gained_before = np.cumsum(gained_evs, axis=-1) - gained_evs
+    return evs + np.clip(total_room - gained_before, 0, gained_evs)
 
 
 # ----- Private Helpers ----- #
 
 
+def _assert_valid_ev_gains(gained_evs: np.ndarray) -> None:
+    """
+    Ensure the given EV gains are not negative, log then raise ValueError if they are.
+
+    Args:
+        gained_evs (np.ndarray): the EV gains to check the validity of.
+    """
+    if (gained_evs < 0).any():
+        logger.error(f"Invalid EV gains {gained_evs.tolist()}, which should not be negative.")
+        raise ValueError("Invalid EV gain.")
+
+
+def _assert_valid_experience_gain(experience: int) -> None:
+    """
+    Ensure the given experience gain is not negative, log then raise ValueError if it is.
+
+    Args:
+        experience (int): the experience gain to check the validity of.
+    """
+    if experience < 0:
+        logger.error(f"Invalid experience gain {experience}, which should not be negative.")
+        raise ValueError("Invalid experience gain.")
+
+
 def _assert_valid_target_level(target_level: int) -> None:
     """
     Ensure the given target level is reachable, log then raise ValueError if not.
@@ -500,6 +1098,31 @@ def _assert_valid_target_level(target_level: int) -> None:
         raise ValueError("Invalid target level: too high.")
 
 
+def _assert_valid_target_level_lower_bound(target_level: int) -> None:
+    """
+    Ensure the given target level is not negative, log then raise ValueError if it is.
+
+    Args:
+        target_level (int): the level.
+    """
+    if target_level < 0:
+        logger.error(f"An invalid target level was provided: {target_level} which is negative.")
+        raise ValueError("Invalid target level: negative.")
+
+
+def _assert_valid_levels(levels: np.ndarray) -> None:
+    """
+    Ensure all the given levels are valid pokemon levels, log then raise ValueError if not.
+
+    Args:
+        levels (np.ndarray): array of levels to check.
+    """
+    logger.trace("Checking provided levels validity")
+    if levels.size and (levels.min() < 1 or levels.max() > 100):
+        logger.error("Invalid levels were provided, all levels should be between 1 and 100.")
+        raise ValueError("Invalid levels.")
+
+
 def _assert_valid_leveling_cruve(curve_name: str) -> None:
     """
     Ensure the given leveling curve type is valid, log then raise ValueError if not.
@@ -508,11 +1131,25 @@ def _assert_valid_leveling_cruve(curve_name: str) -> None:
         curve_name (str): name of the leveling curve to check.
     """
     logger.trace("Checking provided leveling curve validity")
-    if curve_name.lower() not in [e.lower() for e in LEVELING_CURVES.keys()]:
+    if curve_name.lower() not in LEVELING_CURVE_INDEX:
         logger.error(f"An invalid leveling curve was provided: '{curve_name}'")
         raise ValueError("Invalid leveling curve.")
 
 
+def _leveling_curve_row(curve_name: str) -> int:
+    """
+    Ensure the given leveling curve type is valid and return its row in EXPERIENCE_TABLE.
+
+    Args:
+        curve_name (str): name of the leveling curve, case insensitive.
+
+    Returns:
+        The row of the curve in EXPERIENCE_TABLE.
+    """
+    _assert_valid_leveling_cruve(curve_name)
+    return LEVELING_CURVE_INDEX[curve_name.lower()]
+
+
 def _assert_valid_attack_type(type_name: str) -> None:
     """
     Ensure the given attack type is valid, log then raise ValueError if not.
@@ -521,15 +1158,52 @@ def _assert_valid_attack_type(type_name: str) -> None:
         type_name (str): type of attack used, which should be normal or special.
     """
     logger.trace("Checking provided attack type validity")
-    if type_name.lower() not in ("normal", "physical", "special", "spe"):
+    if type_name.lower() not in PHYSICAL_ATTACK_TYPES + SPECIAL_ATTACK_TYPES:
         logger.error(f"An invalid attack type was provided: '{type_name}'")
         raise ValueError("Invalid attack type.")
 
 
-def _get_random_pokemon_name() -> str:
+def _physical_attack_mask(attack_types: Union[str, Sequence[str]]) -> np.ndarray:
+    """
+    Ensure the given attack types are valid, log then raise ValueError if not, and tell which
+    ones are physical. Each distinct type is only checked once.
+
+    Args:
+        attack_types (Union[str, Sequence[str]]): types of attacks used, which should be normal
+            or special.
+
+    Returns:
+        A boolean numpy array, True where the attack is physical.
+    """
+    unique_types, inverse = np.unique(np.asarray(attack_types, dtype=str), return_inverse=True)
+    for type_name in unique_types:
+        _assert_valid_attack_type(type_name)
+    unique_physical = np.array([t.lower() in PHYSICAL_ATTACK_TYPES for t in unique_types])
+    return unique_physical[inverse].reshape(np.shape(attack_types))
+
+
+def _move_type_ids(move_types: Union[str, Sequence[str]]) -> np.ndarray:
+    """
+    Resolve the elemental types of attack moves to type ids, log then raise ValueError if one of
+    them is missing or invalid.
+
+    Args:
+        move_types (Union[str, Sequence[str]]): elemental types of the attack moves.
+
+    Returns:
+        An integer numpy array of type ids, with the shape of the input.
+    """
+    move_type_ids = type_ids(move_types)
+    if (move_type_ids == NO_TYPE).any():
+        logger.error("An attack move without elemental type was provided")
+        raise ValueError("Invalid elemental type.")
+    return move_type_ids
+
+
+def _get_random_pokemon_name(rng: np.random.Generator) -> str:
     """Gives back a valid name picked at random from the list of names from the games."""
     logger.trace("Picking a random name from Pokemon database")
-    return POKEMONS_DF.name.sample(1, replace=True).to_numpy()[0]
+    return data.SPECIES_STATS[rng.integers(len(data.SPECIES_STATS))].name
 
 
 def _assert_pokemon_exists(pokemon_name: str) -> None:
@@ -540,32 +1214,94 @@ def _assert_pokemon_exists(pokemon_name: str) -> None:
         pokemon_name (str): name to check the validity of.
     """
     logger.trace("Checking provided pokemon name validity")
-    if pokemon_name not in POKEMONS_DF.name.to_numpy():
+    if pokemon_name not in data.SPECIES_INDEX:
         logger.error(f"An invalid pokemon name was provided: '{pokemon_name}'")
         raise ValueError("Invalid Pokemon name.")
 
 
-def _base_pokemon_stats(pokemon_name: str) -> Pokemon:
+def _base_pokemon_stats(pokemon_name: str) -> SpeciesStats:
     """
-    Return the base stats of a given pokemon, as a Pokemon object.
+    Return the base stats of a given pokemon, from the precomputed species registry.
 
     Args:
         pokemon_name (str): name of a pokemon to get the base stats of.
 
     Returns:
-        A Pokemon object with the base stats.
+        A frozen SpeciesStats record with the base stats.
+    """
+    logger.trace("Loading base statistics for Pokemon '{}'", pokemon_name)
+    return data.SPECIES_STATS[data.SPECIES_INDEX[pokemon_name]]
+
+
+def _species_types(pokemon_name: str) -> Tuple[str, ...]:
+    """
+    Return the elemental types of a given pokemon, from the precomputed species registry.
+
+    Args:
+        pokemon_name (str): name of a pokemon to get the types of.
+
+    Returns:
+        A tuple with the one or two types of the pokemon, empty if its name is not a valid name
+        from the games.
+    """
+    if pokemon_name not in data.SPECIES_INDEX:
+        return ()
+    return data.SPECIES_STATS[data.SPECIES_INDEX[pokemon_name]].types
+
+
+def _species_rows(names: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Resolve an array of pokemon names to rows of the species registry. Names equal to "random"
+    are resolved to randomly picked rows.
+
+    Args:
+        names (np.ndarray): array of names, each a valid name from the games or "random".
+        rng (np.random.Generator): generator to pick random rows with.
+
+    Returns:
+        An integer numpy array with the corresponding rows of SPECIES_STATS and SPECIES_ARRAYS.
+    """
+    logger.trace("Resolving pokemon names to species registry rows")
+    rows = np.empty(len(names), dtype=np.int64)
+    is_random = names == "random"
+    rows[is_random] = rng.integers(len(data.SPECIES_STATS), size=int(is_random.sum()))
+    unique_names, inverse = np.unique(names[~is_random].astype(str), return_inverse=True)
+    for name in unique_names:
+        _assert_pokemon_exists(name)
+    unique_rows = np.array([data.SPECIES_INDEX[name] for name in unique_names], dtype=np.int64)
+    rows[~is_random] = unique_rows[inverse]
+    return rows
+
+
+def _generated_stats(
+    base_stats: np.ndarray, ivs: np.ndarray, levels: np.ndarray, nature_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized version of the stats computation done in `Pokemon.generate_random`.
+
+    Args:
+        base_stats (np.ndarray): (N, 6) array of base stats of the species.
+        ivs (np.ndarray): (N, 6) array of IVs.
+        levels (np.ndarray): (N,) array of levels.
+        nature_ids (np.ndarray): (N,) array of nature ids.
+
+    Returns:
+        An (N, 6) integer array of stats, ordered as health, attack, defense, special_attack,
+        special_defense, speed.
     """
-    logger.trace(f"Loading base statistics for Pokemon '{pokemon_name}'")
-    return Pokemon(**POKEMONS_DF[POKEMONS_DF.name == pokemon_name].to_dict("records")[0])
+    return compute_stats_batch(base_stats, ivs, np.zeros_like(ivs), levels, nature_ids)
 
 
-def _random_nature_attributes() -> pd.DataFrame:
+def _random_nature_id(rng: np.random.Generator) -> int:
     """
-    Picks a random nature among the available ones for pokemons, and returns the corresponding
-    subset of the NATURES_DF containing the attributes (modifiers) of the picked nature.
+    Picks a random nature among the available ones for pokemons.
+
+    Args:
+        rng (np.random.Generator): generator to pick the nature with.
 
     Returns:
-        A pandas DataFrame with the modifiers.
+        The id of the picked nature, which is its row in NATURE_MODIFIERS and its position in
+        NATURE_NAMES.
     """
-    logger.trace(f"Picking a random nature")
-    return NATURES_DF.sample(1, replace=True)
+    logger.trace("Picking a random nature")
+    return int(rng.integers(len(data.NATURE_NAMES)))
@@ -0,0 +1,79 @@
+"""
+Lookups in the bundled moves table. Moves are identified by their name, and resolved through the
+index of `pokejdr.base_stats` to their record, for single lookups, or to their row, for vectorized
+computations on the MOVE_ARRAYS arrays.
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+from pokejdr import base_stats as data
+from pokejdr.base_stats import MoveData
+
+MOVE_CATEGORIES = ("physical", "special", "status")
+
+
+def get_move(move_name: str) -> MoveData:
+    """
+    Return the data of a given move.
+
+    Args:
+        move_name (str): name of the move, must be a valid name from the games.
+
+    Returns:
+        A frozen MoveData record with the move's type, category, power, accuracy and priority.
+    """
+    _assert_move_exists(move_name)
+    return data.MOVES[data.MOVE_INDEX[move_name]]
+
+
+def move_rows(move_names: Union[str, Sequence[str]]) -> np.ndarray:
+    """
+    Resolve move names to rows of the moves registry, to index the MOVE_ARRAYS arrays with. Each
+    distinct name is only looked up once.
+
+    Args:
+        move_names (Union[str, Sequence[str]]): names of the moves, of any shape.
+
+    Returns:
+        An integer numpy array of rows, with the shape of the input.
+    """
+    unique_names, inverse = np.unique(np.asarray(move_names, dtype=str), return_inverse=True)
+    for move_name in unique_names:
+        _assert_move_exists(move_name)
+    unique_rows = np.array([data.MOVE_INDEX[name] for name in unique_names], dtype=np.int64)
+    return unique_rows[inverse].reshape(np.shape(move_names))
+
+
+# ----- Private Helpers ----- #
+
+
+def _assert_power_based_damage(move: MoveData) -> None:
+    """
+    Ensure the damage of the given move derives from its power, log then raise ValueError if not.
+    Damaging moves without a power, such as Seismic Toss, Low Kick or Guillotine, deal fixed or
+    variable damage according to their own rules, which are not supported.
+
+    Args:
+        move (MoveData): data of the move to check.
+    """
+    if move.category != "status" and move.power <= 0:
+        logger.error(
+            f"The damage of move '{move.name}' does not derive from its power, which is not "
+            "supported"
+        )
+        raise ValueError("Unsupported move: fixed or variable damage.")
+
+
+def _assert_move_exists(move_name: str) -> None:
+    """
+    Ensure the given move name is valid, log then raise ValueError if not.
+
+    Args:
+        move_name (str): name to check the validity of.
+    """
+    if move_name not in data.MOVE_INDEX:
+        logger.error(f"An invalid move name was provided: '{move_name}'")
+        raise ValueError("Invalid move name.")
@@ -0,0 +1,86 @@
+"""
+Random number generation for pokejdr. Every random path of the package accepts an `rng` argument,
+either a numpy Generator or a seed, and otherwise draws from a package-wide default Generator
+which can be seeded or temporarily replaced. Independent streams for parallel workers are spawned
+from a single seed, so that sharded runs are reproducible and uncorrelated.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+RandomState = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+_DEFAULT_RNG: np.random.Generator = np.random.default_rng()
+
+
+def get_rng(rng: RandomState = None) -> np.random.Generator:
+    """
+    Resolve the `rng` argument of random functions to a numpy Generator.
+
+    Args:
+        rng (RandomState): a numpy Generator, which is returned as is, a seed (int or
+            SeedSequence) to create a new Generator from, or None to get the default Generator.
+
+    Returns:
+        A numpy Generator.
+    """
+    if rng is None:
+        return _DEFAULT_RNG
+    return np.random.default_rng(rng)
+
+
+def set_seed(seed: Optional[int]) -> None:
+    """
+    Reset the default Generator with the given seed, making subsequent draws reproducible.
+
+    Args:
+        seed (Optional[int]): the seed, or None for fresh entropy from the OS.
+    """
+    global _DEFAULT_RNG
+    logger.debug("Seeding the default random generator with {}", seed)
+    _DEFAULT_RNG = np.random.default_rng(seed)
+
+
+@contextmanager
+def using_rng(rng: RandomState) -> Iterator[np.random.Generator]:
+    """
+    Context manager temporarily replacing the default Generator, for instance to replay a session
+    with a given seed without passing `rng` to every call. The previous default is restored on
+    exit. This changes module state and is not meant to be used concurrently from several threads.
+
+    Args:
+        rng (RandomState): a numpy Generator or a seed to use as the default within the context.
+
+    Yields:
+        The Generator used as default within the context.
+    """
+    global _DEFAULT_RNG
+    previous, _DEFAULT_RNG = _DEFAULT_RNG, np.random.default_rng(rng)
+    try:
+        yield _DEFAULT_RNG
+    finally:
+        _DEFAULT_RNG = previous
+
+
+def spawn_rngs(
+    n_streams: int, seed: Union[None, int, np.random.SeedSequence] = None
+) -> List[np.random.Generator]:
+    """
+    Create independent Generators, for instance one per worker process or per chunk of work.
+    The same seed always gives the same streams.
+
+    Args:
+        n_streams (int): number of Generators to create.
+        seed (Union[None, int, np.random.SeedSequence]): the root seed. Defaults to None, which
+            uses fresh entropy from the OS.
+
+    Returns:
+        A list of numpy Generators.
+    """
+    seed_sequence = (
+        seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    )
+    return [np.random.default_rng(child) for child in seed_sequence.spawn(n_streams)]
@@ -0,0 +1,476 @@
+"""
+Roster persistence: saving and loading many pokemons in a single file, instead of one file per
+pokemon. Two formats are supported:
+
+- "ndjson": newline-delimited JSON, one pokemon per line, which can be read as a stream.
+- "columnar": the columnar binary format of `pokejdr.columnar`, holding the columns of a
+  PokemonTable with dictionary-encoded names and natures. It is compact and fast to load.
+
+Both can be compressed with gzip, bz2 or xz. Formats and compressions are inferred from the file
+extension by default, for instance "box.ndjson.gz" or "box.bin". Large files can be read as a
+stream of Pokemon objects with `iter_roster`, or as chunks of columns restricted to some fields
+with `iter_roster_chunks`.
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+from itertools import islice
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+from pokejdr import base_stats as data
+from pokejdr.columnar import decode_columns, encode_columns, read_columns
+from pokejdr.model import Pokemon
+from pokejdr.table import (
+    _NO_EXPERIENCE,
+    _NO_LEVEL,
+    MATRIX_COLUMNS,
+    SCALAR_COLUMNS,
+    PokemonTable,
+    _lookup_ids,
+    _matrix,
+)
+
+ROSTER_FORMATS = ("ndjson", "columnar")
+COMPRESSIONS = ("gzip", "bz2", "xz")
+
+_FORMAT_SUFFIXES = {".ndjson": "ndjson", ".jsonl": "ndjson", ".bin": "columnar"}
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+_COMPRESSION_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+# Values standing for None in the integer columns of columnar rosters, as in PokemonTable
+_MISSING_SENTINELS = {"level": _NO_LEVEL, "experience": _NO_EXPERIENCE}
+# Valid (min, max) values of the constrained columns of columnar rosters, None for no bound. All
+# integer columns are also bounded by their dtype in PokemonTable.
+_VALUE_RANGES = {
+    "code": (1, None),
+    "number": (1, None),
+    "level": (_NO_LEVEL, 100),
+    "health": (0, None),
+    "experience": (_NO_EXPERIENCE, None),
+}
+
+PathLike = Union[str, Path]
+
+
+# ----- Public API ----- #
+
+
+def save_roster(
+    pokemons: Union[Iterable[Pokemon], PokemonTable],
+    path: PathLike,
+    format: Optional[str] = None,
+    compression: Optional[str] = "infer",
+) -> None:
+    """
+    Save many pokemons to a single file.
+
+    Args:
+        pokemons (Union[Iterable[Pokemon], PokemonTable]): the pokemons to save, as Pokemon (or
+            FastPokemon) objects or as a PokemonTable. An iterable is consumed lazily when saving
+            to NDJSON.
+        path (PathLike): location of the file to write.
+        format (Optional[str]): "ndjson" or "columnar". Defaults to None, which infers it from the
+            file extension.
+        compression (Optional[str]): "gzip", "bz2", "xz" or None for no compression. Defaults to
+            "infer", which infers it from the file extension.
+    """
+    format, compression = _resolve_format(path, format), _resolve_compression(path, compression)
+    logger.opt(lazy=True).info(
+        "Saving roster as {} at '{}'", lambda: format, lambda: Path(path).absolute()
+    )
+    if format == "ndjson":
+        records = (
+            _table_records(pokemons)
+            if isinstance(pokemons, PokemonTable)
+            else (pokemon.dict() for pokemon in pokemons)
+        )
+        with _open(path, "wt", compression) as roster_file:
+            for record in records:
+                roster_file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                roster_file.write("\n")
+    else:
+        table = (
+            pokemons
+            if isinstance(pokemons, PokemonTable)
+            else PokemonTable.from_pokemons(list(pokemons))
+        )
+        with _open(path, "wb", compression) as roster_file:
+            roster_file.write(encode_columns(_table_columns(table)))
+
+
+def load_roster(
+    path: PathLike,
+    format: Optional[str] = None,
+    compression: Optional[str] = "infer",
+    as_table: bool = False,
+    validate: bool = True,
+) -> Union[List[Pokemon], PokemonTable]:
+    """
+    Load the pokemons of a roster file.
+
+    Args:
+        path (PathLike): location of the file to read.
+        format (Optional[str]): "ndjson" or "columnar". Defaults to None, which infers it from the
+            file extension.
+        compression (Optional[str]): "gzip", "bz2", "xz" or None for no compression. Defaults to
+            "infer", which infers it from the file extension.
+        as_table (bool): whether to return a PokemonTable instead of a list of Pokemon objects.
+            Defaults to False.
+        validate (bool): whether to validate the NDJSON records as Pokemon objects, which should
+            be kept for untrusted files. Columnar files are always checked when loaded: their
+            names and natures against the registries, and their values against the ranges of
+            Pokemon attributes and PokemonTable dtypes. Defaults to True.
+
+    Returns:
+        The pokemons, as a list of Pokemon objects or a PokemonTable.
+    """
+    format, compression = _resolve_format(path, format), _resolve_compression(path, compression)
+    logger.opt(lazy=True).info(
+        "Loading {} roster from file at '{}'", lambda: format, lambda: Path(path).absolute()
+    )
+    if format == "ndjson":
+        pokemons = list(iter_roster(path, compression, validate, format))
+        return PokemonTable.from_pokemons(pokemons) if as_table else pokemons
+
+    table = _columns_table(_read_columnar_roster(path, compression))
+    return table if as_table else table.to_pokemons()
+
+
+def iter_roster(
+    path: PathLike,
+    compression: Optional[str] = "infer",
+    validate: bool = True,
+    format: Optional[str] = None,
+    chunk_size: int = 10_000,
+) -> Iterator[Pokemon]:
+    """
+    Read the pokemons of a roster file one at a time, without loading the whole file: NDJSON files
+    are read line by line, and uncompressed columnar files are memory-mapped and converted by
+    chunks. Compressed columnar files are decompressed in memory first.
+
+    Args:
+        path (PathLike): location of the file to read.
+        compression (Optional[str]): "gzip", "bz2", "xz" or None for no compression. Defaults to
+            "infer", which infers it from the file extension.
+        validate (bool): whether to validate the NDJSON records as Pokemon objects, which should
+            be kept for untrusted files. Defaults to True.
+        format (Optional[str]): "ndjson" or "columnar". Defaults to None, which infers it from the
+            file extension.
+        chunk_size (int): number of pokemons converted at once from columnar files. Defaults to
+            10 000.
+
+    Yields:
+        The Pokemon objects, in file order.
+    """
+    format, compression = _resolve_format(path, format), _resolve_compression(path, compression)
+    if format == "columnar":
+        columns = _read_columnar_roster(path, compression)
+        for rows in _chunk_slices(len(columns["code"]), chunk_size):
+            yield from _columns_table(_slice_columns(columns, rows)).to_pokemons()
+        return
+
+    parse = Pokemon.parse_obj if validate else lambda record: Pokemon.construct(**record)
+    with _open(path, "rt", compression) as roster_file:
+        for line in roster_file:
+            if line.strip():
+                yield parse(json.loads(line))
+
+
+def iter_roster_chunks(
+    path: PathLike,
+    chunk_size: int = 10_000,
+    fields: Optional[Sequence[str]] = None,
+    format: Optional[str] = None,
+    compression: Optional[str] = "infer",
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Read a roster file by chunks of columns, without loading the whole file, for instance to scan
+    large exports. Chunks are laid out as `PokemonTable.to_columns` gives them, so that a chunk
+    with all fields can be given to `PokemonTable.from_columns`. Only the requested fields are
+    converted, but only columnar files avoid parsing the other ones, whose columns are never
+    read: NDJSON records are parsed in full by `json.loads` and projected afterwards, so large
+    exports scanned for a few fields are best saved as columnar rosters. Records are not
+    validated as Pokemon objects.
+
+    Args:
+        path (PathLike): location of the file to read.
+        chunk_size (int): maximum number of pokemons per chunk. Defaults to 10 000.
+        fields (Optional[Sequence[str]]): the Pokemon fields to read, for instance
+            ["name", "level"]. Defaults to None, which reads all fields.
+        format (Optional[str]): "ndjson" or "columnar". Defaults to None, which infers it from the
+            file extension.
+        compression (Optional[str]): "gzip", "bz2", "xz" or None for no compression. Defaults to
+            "infer", which infers it from the file extension.
+
+    Yields:
+        Dictionaries of numpy arrays keyed by field name, of at most `chunk_size` rows.
+    """
+    format, compression = _resolve_format(path, format), _resolve_compression(path, compression)
+    fields = _resolve_fields(fields)
+    _assert_valid_chunk_size(chunk_size)
+    logger.opt(lazy=True).debug(
+        "Reading {} roster at '{}' by chunks of {} pokemons",
+        lambda: format,
+        lambda: Path(path).absolute(),
+        lambda: chunk_size,
+    )
+    if format == "columnar":
+        columns = _read_columnar_roster(path, compression)
+        for rows in _chunk_slices(len(columns["code"]), chunk_size):
+            yield {field: _columnar_field(columns, field, rows) for field in fields}
+        return
+
+    with _open(path, "rt", compression) as roster_file:
+        records = (json.loads(line) for line in roster_file if line.strip())
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            yield {field: _records_field(chunk, field) for field in fields}
+
+
+# ----- Private Helpers ----- #
+
+
+def _resolve_format(path: PathLike, format: Optional[str]) -> str:
+    """
+    Return the given roster format, or infer it from the file extension if None. Log then raise
+    ValueError if the format is invalid or can not be inferred.
+    """
+    if format is None:
+        suffixes = Path(path).suffixes
+        if suffixes and suffixes[-1] in _COMPRESSION_SUFFIXES:
+            suffixes = suffixes[:-1]
+        format = _FORMAT_SUFFIXES.get(suffixes[-1] if suffixes else "")
+        if format is None:
+            logger.error(
+                f"Could not infer the roster format of '{path}', expected an extension in "
+                f"{list(_FORMAT_SUFFIXES)} or an explicit format in {ROSTER_FORMATS}"
+            )
+            raise ValueError("Invalid roster format.")
+    if format not in ROSTER_FORMATS:
+        logger.error(f"Invalid roster format '{format}', expected one of {ROSTER_FORMATS}")
+        raise ValueError("Invalid roster format.")
+    return format
+
+
+def _resolve_fields(fields: Optional[Sequence[str]]) -> List[str]:
+    """
+    Return the requested fields in Pokemon field order, all of them if None. Log then raise
+    ValueError if some are not Pokemon fields.
+    """
+    if fields is None:
+        return list(Pokemon.__fields__)
+    invalid = set(fields) - set(Pokemon.__fields__)
+    if invalid:
+        logger.error(f"Invalid fields requested: {sorted(invalid)}, not attributes of Pokemon")
+        raise ValueError("Invalid roster fields.")
+    return [field for field in Pokemon.__fields__ if field in fields]
+
+
+def _assert_valid_roster_columns(columns: Dict[str, np.ndarray]) -> None:
+    """
+    Ensure the columns of a columnar roster are complete, of consistent shapes and within the
+    valid ranges of their values, log then raise ValueError if not. This prevents out of range
+    values from being wrapped or truncated when cast to the dtypes of PokemonTable.
+
+    Args:
+        columns (Dict[str, np.ndarray]): the raw columns of the roster.
+    """
+    table_columns = {
+        column: dtype
+        for column, dtype in {**SCALAR_COLUMNS, **MATRIX_COLUMNS}.items()
+        if column not in ("name_id", "nature_id")
+    }
+    expected = {*table_columns, "name", "nature", "name_vocabulary", "nature_vocabulary"}
+    if not expected <= set(columns):
+        logger.error(f"Columnar roster is missing columns {sorted(expected - set(columns))}")
+        raise ValueError("Invalid columnar roster.")
+
+    size = len(columns["code"])
+    for column in ("name", "nature", *table_columns):
+        values = columns[column]
+        shape = (size, 6) if column in MATRIX_COLUMNS else (size,)
+        if values.shape != shape or values.dtype.kind not in "iuf":
+            logger.error(
+                f"Column '{column}' of columnar roster has shape {values.shape} and dtype "
+                f"{values.dtype}, expected numbers of shape {shape}"
+            )
+            raise ValueError("Invalid columnar roster.")
+
+    for column, dtype in table_columns.items():
+        if dtype.kind not in "iu" or not size:
+            continue
+        values = columns[column]
+        low, high = _VALUE_RANGES.get(column, (None, None))
+        limits = np.iinfo(dtype)
+        low = limits.min if low is None else max(low, limits.min)
+        high = limits.max if high is None else min(high, limits.max)
+        if values.dtype.kind == "f" or values.min() < low or values.max() > high:
+            logger.error(
+                f"Column '{column}' of columnar roster should hold integers in [{low}, {high}]"
+            )
+            raise ValueError("Invalid columnar roster.")
+
+    for field in ("name", "nature"):
+        _assert_valid_positions(columns, field, columns[field])
+
+
+def _assert_valid_positions(columns: Dict[str, np.ndarray], field: str, values: np.ndarray) -> None:
+    """
+    Ensure the dictionary-encoded names or natures of a columnar roster are positions in their
+    vocabulary, log then raise ValueError if not.
+
+    Args:
+        columns (Dict[str, np.ndarray]): the raw columns of the roster.
+        field (str): "name" or "nature".
+        values (np.ndarray): the encoded values to check.
+    """
+    vocabulary_size = len(columns[f"{field}_vocabulary"])
+    if values.dtype.kind not in "iu" or (
+        values.size and (values.min() < 0 or values.max() >= vocabulary_size)
+    ):
+        logger.error(
+            f"Invalid {field} positions in columnar roster, expected integers in "
+            f"[0, {vocabulary_size - 1}]"
+        )
+        raise ValueError("Invalid columnar roster.")
+
+
+def _assert_valid_chunk_size(chunk_size: int) -> None:
+    """Ensure the chunk size is strictly positive, log then raise ValueError if not."""
+    if chunk_size < 1:
+        logger.error(f"Invalid chunk size {chunk_size}, which should be positive.")
+        raise ValueError("Invalid chunk size.")
+
+
+def _resolve_compression(path: PathLike, compression: Optional[str]) -> Optional[str]:
+    """
+    Return the given compression, or infer it from the file extension if "infer". Log then raise
+    ValueError if the compression is invalid.
+    """
+    if compression == "infer":
+        return _COMPRESSION_SUFFIXES.get(Path(path).suffix)
+    if compression is not None and compression not in COMPRESSIONS:
+        logger.error(f"Invalid compression '{compression}', expected one of {COMPRESSIONS}")
+        raise ValueError("Invalid compression.")
+    return compression
+
+
+def _open(path: PathLike, mode: str, compression: Optional[str]) -> IO:
+    """Open a file with the given compression, in text mode with UTF-8 encoding for "t" modes."""
+    encoding = "utf-8" if "t" in mode else None
+    if compression is None:
+        return Path(path).open(mode.replace("t", ""), encoding=encoding)
+    return _COMPRESSION_OPENERS[compression](path, mode, encoding=encoding)
+
+
+def _table_records(table: PokemonTable) -> Iterator[dict]:
+    """Yield the rows of a table as dictionaries, as `Pokemon.dict` gives them."""
+    columns = {field: array.tolist() for field, array in table.to_columns().items()}
+    for position in range(len(table)):
+        yield {field: values[position] for field, values in columns.items()}
+
+
+def _table_columns(table: PokemonTable) -> Dict[str, np.ndarray]:
+    """
+    Gather the columns of a table to store in a columnar roster. Names and natures are
+    dictionary-encoded: the "name" and "nature" columns hold positions in the "name_vocabulary"
+    and "nature_vocabulary" string columns, since registry ids depend on the data's row order. A
+    missing nature is stored as an empty string.
+    """
+    columns = {
+        column: getattr(table, column)
+        for column in table.__slots__
+        if column not in ("name_id", "nature_id")
+    }
+    name_ids, columns["name"] = np.unique(table.name_id, return_inverse=True)
+    nature_ids, columns["nature"] = np.unique(table.nature_id, return_inverse=True)
+    columns["name"] = columns["name"].astype(np.int32)
+    columns["nature"] = columns["nature"].astype(np.int32)
+    columns["name_vocabulary"] = data.SPECIES_ARRAYS["name"][name_ids].astype(str)
+    columns["nature_vocabulary"] = np.array(
+        [data.NATURE_NAMES[nature_id] if nature_id != -1 else "" for nature_id in nature_ids],
+        dtype=str,
+    )
+    return columns
+
+
+def _columns_table(columns: Dict[str, np.ndarray]) -> PokemonTable:
+    """
+    Create a table from the columns of a columnar roster, as given by `_table_columns`, once
+    checked with `_assert_valid_roster_columns`.
+    """
+    _assert_valid_roster_columns(columns)
+    names = columns["name_vocabulary"].tolist()
+    natures = [nature or None for nature in columns["nature_vocabulary"].tolist()]
+    name_ids = _lookup_ids(names, data.SPECIES_INDEX, "pokemon name")
+    nature_ids = _lookup_ids(natures, data.NATURE_INDEX, "nature")
+    return PokemonTable(
+        name_id=name_ids[columns["name"]],
+        nature_id=nature_ids[columns["nature"]],
+        **{
+            column: np.array(columns[column])  # copies, the decoded columns are read-only
+            for column in (*SCALAR_COLUMNS, *MATRIX_COLUMNS)
+            if column not in ("name_id", "nature_id")
+        },
+    )
+
+
+def _read_columnar_roster(path: PathLike, compression: Optional[str]) -> Dict[str, np.ndarray]:
+    """Read the raw columns of a columnar roster, memory-mapped if the file is uncompressed."""
+    if compression is None:
+        return read_columns(path, mmap=True)
+    with _open(path, "rb", compression) as roster_file:
+        return decode_columns(roster_file.read())
+
+
+def _chunk_slices(size: int, chunk_size: int) -> Iterator[slice]:
+    for start in range(0, size, chunk_size):
+        yield slice(start, start + chunk_size)
+
+
+def _slice_columns(columns: Dict[str, np.ndarray], rows: slice) -> Dict[str, np.ndarray]:
+    """Select rows of the raw columns of a columnar roster, keeping the vocabularies whole."""
+    return {
+        column: values if column.endswith("_vocabulary") else values[rows]
+        for column, values in columns.items()
+    }
+
+
+def _columnar_field(columns: Dict[str, np.ndarray], field: str, rows: slice) -> np.ndarray:
+    """
+    Convert rows of one field of a columnar roster as `PokemonTable.to_columns` gives it, with
+    names and natures as strings and None for missing natures, levels and experience.
+    """
+    values = columns[field][rows]
+    if field in ("name", "nature"):
+        _assert_valid_positions(columns, field, values)
+        vocabulary = np.array(columns[f"{field}_vocabulary"].tolist(), dtype=object)
+        vocabulary[vocabulary == ""] = None
+        return vocabulary[values]
+    if field in _MISSING_SENTINELS:
+        converted = values.astype(object)
+        converted[values == _MISSING_SENTINELS[field]] = None
+        return converted
+    return np.array(values)  # copies, the decoded columns are read-only
+
+
+def _records_field(records: List[dict], field: str) -> np.ndarray:
+    """
+    Gather one field of NDJSON records as `PokemonTable.to_columns` gives it, missing keys
+    taking the field's default value.
+    """
+    default = Pokemon.__fields__[field].default
+    values = [record.get(field, default) for record in records]
+    if field in MATRIX_COLUMNS:
+        return _matrix(values, len(values))
+    if field in ("name", "nature") or field in _MISSING_SENTINELS:
+        return np.array(values, dtype=object)
+    return np.array(values)
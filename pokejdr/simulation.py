@@ -0,0 +1,361 @@
+"""
+Headless Monte Carlo battle simulation, to estimate win probabilities and expected battle lengths
+of matchups. Battles are run in lockstep with numpy arrays, and spread in chunks across a process
+pool. Each chunk draws from its own random stream spawned from a single seed, so that results are
+reproducible whatever the number of workers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from pokejdr.model import Pokemon, _assert_valid_attack_type, dealt_damage_batch
+from pokejdr.moves import _assert_power_based_damage, get_move
+from pokejdr.rng import spawn_rngs
+from pokejdr.type_chart import effectiveness, stab
+
+# ----- Simulation Inputs & Outputs ----- #
+
+
+class Attack(NamedTuple):
+    """The attack a pokemon uses at every turn of a simulated battle."""
+
+    power: float
+    attack_type: str = "physical"
+    accuracy: float = 1.0
+    attack_modifier: float = 1.0
+    defense_modifier: float = 1.0
+    global_modifier: float = 1.0
+    move_type: Optional[str] = None  # elemental type, for STAB and type effectiveness
+    priority: int = 0
+
+    @classmethod
+    def from_move(cls, move_name: str, **modifiers: float) -> "Attack":
+        """
+        Create the attack of a damaging move from the moves table.
+
+        Args:
+            move_name (str): name of the move, must be a valid name from the games.
+            **modifiers (float): attack_modifier, defense_modifier or global_modifier values.
+
+        Returns:
+            An Attack with the move's power, category, accuracy, type and priority.
+        """
+        move = get_move(move_name)
+        _assert_valid_attack_type(move.category)
+        _assert_power_based_damage(move)
+        return cls(
+            power=move.power,
+            attack_type=move.category,
+            accuracy=move.accuracy,
+            move_type=move.type,
+            priority=move.priority,
+            **modifiers,
+        )
+
+
+class Matchup(NamedTuple):
+    """Two pokemons facing each other, with the attack each of them uses."""
+
+    first: Pokemon
+    first_attack: Attack
+    second: Pokemon
+    second_attack: Attack
+
+
+class BattleStatistics(NamedTuple):
+    """Aggregated results of the simulated battles of a matchup."""
+
+    n_battles: int
+    first_wins: int
+    second_wins: int
+    draws: int
+    mean_turns: float  # over the battles that ended with a pokemon fainting
+    std_turns: float
+
+    @property
+    def first_win_probability(self) -> float:
+        return self.first_wins / self.n_battles
+
+    @property
+    def second_win_probability(self) -> float:
+        return self.second_wins / self.n_battles
+
+    @property
+    def draw_probability(self) -> float:
+        return self.draws / self.n_battles
+
+
+class _Combatant(NamedTuple):
+    """Plain data needed to simulate one side of a matchup, cheap to send to worker processes."""
+
+    health: int
+    stats: np.ndarray
+    level: int
+    hit_probability: float
+    attack: Attack
+    type_modifier: float  # STAB and type effectiveness of the attack against the target
+
+
+# ----- Simulation ----- #
+
+
+def simulate_battles(
+    first: Pokemon,
+    first_attack: Attack,
+    second: Pokemon,
+    second_attack: Attack,
+    n_battles: int = 10_000,
+    max_turns: int = 100,
+    n_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    chunk_size: int = 10_000,
+) -> BattleStatistics:
+    """
+    Simulate many independent battles between two pokemons, each using the same attack at every
+    turn. The pokemon with the highest priority attack, or else the fastest pokemon, attacks first
+    (ties are decided at random for each battle), attacks hit according to
+    `Pokemon.hit_probability` and deal damage according to `dealt_damage`, including STAB and type
+    effectiveness for attacks with a `move_type`. The pokemons themselves are not modified.
+
+    Args:
+        first (Pokemon): Pokemon object of the first pokemon.
+        first_attack (Attack): the attack used by the first pokemon.
+        second (Pokemon): Pokemon object of the second pokemon.
+        second_attack (Attack): the attack used by the second pokemon.
+        n_battles (int): number of battles to simulate. Defaults to 10 000.
+        max_turns (int): number of turns after which a battle is declared a draw. Defaults to 100.
+        n_workers (Optional[int]): number of worker processes. Defaults to None, which uses all
+            cores. With 1, battles are simulated in the calling process.
+        seed (Optional[int]): seed for reproducible results. Defaults to None.
+        chunk_size (int): number of battles simulated at once by a worker. Defaults to 10 000.
+
+    Returns:
+        The aggregated BattleStatistics of the battles.
+    """
+    return simulate_matchups(
+        [Matchup(first, first_attack, second, second_attack)],
+        n_battles=n_battles,
+        max_turns=max_turns,
+        n_workers=n_workers,
+        seed=seed,
+        chunk_size=chunk_size,
+    )[0]
+
+
+def simulate_matchups(
+    matchups: Sequence[Matchup],
+    n_battles: int = 10_000,
+    max_turns: int = 100,
+    n_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    chunk_size: int = 10_000,
+) -> List[BattleStatistics]:
+    """
+    Simulate many independent battles for each of the given matchups, sharing a single process
+    pool. See `simulate_battles` for the battle rules.
+
+    Args:
+        matchups (Sequence[Matchup]): the matchups to simulate.
+        n_battles (int): number of battles to simulate per matchup. Defaults to 10 000.
+        max_turns (int): number of turns after which a battle is declared a draw. Defaults to 100.
+        n_workers (Optional[int]): number of worker processes. Defaults to None, which uses all
+            cores. With 1, battles are simulated in the calling process.
+        seed (Optional[int]): seed for reproducible results. Defaults to None.
+        chunk_size (int): number of battles simulated at once by a worker. Defaults to 10 000.
+
+    Returns:
+        A list with the aggregated BattleStatistics of each matchup, in order.
+    """
+    _assert_valid_simulation_parameters(n_battles, max_turns, chunk_size)
+    sides = [_combatants(matchup) for matchup in matchups]
+    chunk_sizes = [min(chunk_size, n_battles - start) for start in range(0, n_battles, chunk_size)]
+    tasks = [
+        (first, second, size, max_turns)
+        for first, second in sides
+        for size in chunk_sizes  # chunks of a matchup are contiguous
+    ]
+    rngs = spawn_rngs(len(tasks), seed)
+    n_workers = os.cpu_count() if n_workers is None else n_workers
+    logger.info(
+        "Simulating {} battles for {} matchup(s) in {} chunks over {} worker(s)",
+        n_battles,
+        len(matchups),
+        len(tasks),
+        min(n_workers, len(tasks)),
+    )
+
+    if n_workers <= 1 or len(tasks) <= 1:
+        chunk_results = [_simulate_chunk(*task, rng) for task, rng in zip(tasks, rngs)]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            chunk_results = list(pool.map(_simulate_chunk, *zip(*tasks), rngs))
+
+    return [
+        _aggregate(chunk_results[position : position + len(chunk_sizes)])
+        for position in range(0, len(chunk_results), len(chunk_sizes))
+    ]
+
+
+# ----- Private Helpers ----- #
+
+
+def _assert_valid_simulation_parameters(n_battles: int, max_turns: int, chunk_size: int) -> None:
+    """
+    Ensure the simulation parameters are strictly positive, log then raise ValueError if not.
+
+    Args:
+        n_battles (int): number of battles to simulate.
+        max_turns (int): number of turns after which a battle is declared a draw.
+        chunk_size (int): number of battles simulated at once by a worker.
+    """
+    logger.trace("Checking provided simulation parameters validity")
+    if min(n_battles, max_turns, chunk_size) < 1:
+        logger.error(
+            f"Invalid simulation parameters were provided: n_battles={n_battles}, "
+            f"max_turns={max_turns}, chunk_size={chunk_size}, which should all be positive."
+        )
+        raise ValueError("Invalid simulation parameters.")
+
+
+def _combatants(matchup: Matchup) -> Tuple[_Combatant, _Combatant]:
+    """
+    Extract the data needed for the simulation from both sides of a matchup.
+
+    Args:
+        matchup (Matchup): the matchup.
+
+    Returns:
+        A tuple with the _Combatant of the first and second pokemons.
+    """
+    _assert_valid_attack_type(matchup.first_attack.attack_type)
+    _assert_valid_attack_type(matchup.second_attack.attack_type)
+    return (
+        _combatant(matchup.first, matchup.first_attack, matchup.second),
+        _combatant(matchup.second, matchup.second_attack, matchup.first),
+    )
+
+
+def _combatant(pokemon: Pokemon, attack: Attack, target: Pokemon) -> _Combatant:
+    type_modifier = 1.0
+    if attack.move_type is not None:
+        type_modifier = stab(attack.move_type, pokemon.types) * effectiveness(
+            attack.move_type, target.types
+        )
+    return _Combatant(
+        health=pokemon.health,
+        stats=np.array(
+            [
+                pokemon.health,
+                pokemon.attack,
+                pokemon.defense,
+                pokemon.special_attack,
+                pokemon.special_defense,
+                pokemon.speed,
+            ]
+        ),
+        level=pokemon.level,
+        hit_probability=min(pokemon.hit_probability(target, attack.accuracy), 1),
+        attack=attack,
+        type_modifier=type_modifier,
+    )
+
+
+def _simulate_chunk(
+    first: _Combatant,
+    second: _Combatant,
+    n_battles: int,
+    max_turns: int,
+    rng: np.random.Generator,
+) -> Tuple[int, int, int, int, int]:
+    """
+    Simulate battles in lockstep: at each half-turn, every battle still going on has one of its
+    pokemons attack the other.
+
+    Args:
+        first (_Combatant): data of the first pokemon.
+        second (_Combatant): data of the second pokemon.
+        n_battles (int): number of battles to simulate.
+        max_turns (int): number of turns after which a battle is declared a draw.
+        rng (np.random.Generator): this chunk's own random stream.
+
+    Returns:
+        A tuple with the wins of the first pokemon, the wins of the second pokemon, the draws,
+        and the sum and sum of squares of the number of turns of decided battles.
+    """
+    combatants = (first, second)
+    health = np.array([[first.health], [second.health]]).repeat(n_battles, axis=1)
+    winner = np.full(n_battles, -1)  # -1 while the battle goes on, then the winner's side
+    turns = np.zeros(n_battles, dtype=np.int64)
+    winner[health[1] == 0] = 0
+    winner[health[0] == 0] = 1
+
+    if first.attack.priority != second.attack.priority:
+        first_leads = np.full(n_battles, first.attack.priority > second.attack.priority)
+    elif first.stats[5] == second.stats[5]:
+        first_leads = rng.random(n_battles) < 0.5
+    else:
+        first_leads = np.full(n_battles, first.stats[5] > second.stats[5])
+
+    for turn in range(1, max_turns + 1):
+        for leading in (True, False):
+            for side, target in ((0, 1), (1, 0)):
+                acting = (winner == -1) & ((first_leads == leading) == (side == 0))
+                n_acting = int(acting.sum())
+                if not n_acting:
+                    continue
+                attacker, defender = combatants[side], combatants[target]
+                damage = dealt_damage_batch(
+                    attacker_stats=np.broadcast_to(attacker.stats, (n_acting, 6)),
+                    defender_stats=defender.stats,
+                    attacker_levels=attacker.level,
+                    attack_types=attacker.attack.attack_type,
+                    attack_powers=attacker.attack.power,
+                    attack_modifiers=attacker.attack.attack_modifier,
+                    defense_modifiers=attacker.attack.defense_modifier,
+                    global_modifiers=attacker.attack.global_modifier * attacker.type_modifier,
+                    rng=rng,
+                )
+                hits = rng.random(n_acting) < attacker.hit_probability
+                health[target, acting] = np.maximum(health[target, acting] - damage * hits, 0)
+                fainted = acting & (health[target] == 0)
+                winner[fainted] = side
+                turns[fainted] = turn
+        if (winner != -1).all():
+            break
+
+    decided_turns = turns[winner != -1]
+    return (
+        int((winner == 0).sum()),
+        int((winner == 1).sum()),
+        int((winner == -1).sum()),
+        int(decided_turns.sum()),
+        int((decided_turns ** 2).sum()),
+    )
+
+
+def _aggregate(chunk_results: Sequence[Tuple[int, int, int, int, int]]) -> BattleStatistics:
+    """
+    Merge the results of the chunks of a matchup into its BattleStatistics.
+
+    Args:
+        chunk_results (Sequence[Tuple[int, int, int, int, int]]): results of `_simulate_chunk`.
+
+    Returns:
+        The aggregated BattleStatistics.
+    """
+    first_wins, second_wins, draws, turns_sum, turns_squares_sum = np.sum(chunk_results, axis=0)
+    decided = first_wins + second_wins
+    mean_turns = turns_sum / decided if decided else float("nan")
+    variance = turns_squares_sum / decided - mean_turns ** 2 if decided else float("nan")
+    return BattleStatistics(
+        n_battles=int(decided + draws),
+        first_wins=int(first_wins),
+        second_wins=int(second_wins),
+        draws=int(draws),
+        mean_turns=float(mean_turns),
+        std_turns=float(np.sqrt(max(variance, 0))) if decided else float("nan"),
+    )
@@ -0,0 +1,308 @@
+"""
+Stat computation from a species' base stats, level, nature, IVs and EVs. The formula is written
+once, in `_health` and `_stat`, which work on plain numbers as well as on numpy arrays: single
+pokemons, whole populations and the optional numba backend all evaluate these same functions, and
+all truncate the results to the final integer stats, so that generation and leveling up cannot
+drift apart. Results for single pokemons are memoized in a bounded LRU cache keyed on their
+inputs, since the same combinations come back constantly when generating wild pokemons of a zone
+or leveling up a party. The cache is cleared whenever the species data is reloaded with
+`pokejdr.base_stats.reload_data`.
+"""
+
+import importlib.util
+from functools import lru_cache
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from pokejdr import base_stats as data
+from pokejdr.base_stats import NEUTRAL_NATURE_MODIFIERS
+
+STATS_CACHE_SIZE = 4096
+NO_NATURE = -1  # nature id of pokemons without a nature, which get neutral modifiers
+STATS_BACKENDS = ("numpy", "numba")
+# Smallest batch computed with the numba backend: below it, numpy is barely slower, and short-lived
+# callers computing small batches do not pay for importing numba and loading the compiled kernel
+NUMBA_MIN_BATCH_SIZE = 10_000
+
+_NO_POINTS = (0, 0, 0, 0, 0, 0)
+
+StatsTuple = Tuple[int, int, int, int, int, int]
+
+
+# ----- Stat Formula ----- #
+
+
+def _health(base, iv, ev, level):
+    return (2 * base + iv + ev / 4) * level / 100 + level + 10
+
+
+def _stat(base, iv, ev, level, modifier):
+    return ((2 * base + iv + ev / 4) * level / 100 + 5) * modifier
+
+
+# ----- Stat Computation ----- #
+
+
+def compute_stats(
+    name: str,
+    level: int,
+    nature: Optional[str] = None,
+    ivs: Sequence[int] = _NO_POINTS,
+    evs: Sequence[int] = _NO_POINTS,
+) -> StatsTuple:
+    """
+    Compute the stats of a pokemon, ordered as health, attack, defense, special_attack,
+    special_defense and speed. Results are memoized, see `stats_cache_info`.
+
+    Args:
+        name (str): name of the pokemon's species, must be a valid name from the games.
+        level (int): level of the pokemon.
+        nature (Optional[str]): name of the pokemon's nature. Defaults to None, for neutral
+            modifiers.
+        ivs (Sequence[int]): the 6 IVs of the pokemon. Defaults to zeros.
+        evs (Sequence[int]): the 6 EVs of the pokemon. Defaults to zeros.
+
+    Returns:
+        A tuple with the 6 stats, truncated to integers.
+    """
+    return _cached_stats(name, level, nature, tuple(ivs), tuple(evs))
+
+
+def _compute_stats(
+    name: str, level: int, nature: Optional[str], ivs: Tuple[int, ...], evs: Tuple[int, ...]
+) -> StatsTuple:
+    base_stats = data.SPECIES_ARRAYS["base_stats"][data.SPECIES_INDEX[name]].tolist()
+    modifiers = nature_modifiers(nature).tolist()
+    return (int(_health(base_stats[0], ivs[0], evs[0], level)),) + tuple(
+        int(_stat(base, iv, ev, level, modifier))
+        for base, iv, ev, modifier in zip(base_stats[1:], ivs[1:], evs[1:], modifiers)
+    )
+
+
+def nature_modifiers(nature: Optional[str]) -> np.ndarray:
+    """
+    Return the stat modifiers of the given nature, ordered as in NATURE_STATS. A pokemon without
+    a nature gets neutral modifiers.
+
+    Args:
+        nature (Optional[str]): name of the nature, or None.
+
+    Returns:
+        A read-only numpy array with the 5 modifiers of the nature.
+    """
+    if nature is None:
+        return NEUTRAL_NATURE_MODIFIERS
+    return data.NATURE_MODIFIERS[data.NATURE_INDEX[nature]]
+
+
+# ----- Batch Computation ----- #
+
+
+def compute_stats_batch(
+    base_stats: np.ndarray,
+    ivs: np.ndarray,
+    evs: np.ndarray,
+    levels: Union[int, np.ndarray],
+    nature_ids: Union[int, np.ndarray],
+) -> np.ndarray:
+    """
+    Vectorized version of `compute_stats`, computing the stats of many pokemons in one pass with
+    the current backend, see `set_stats_backend`. Batches smaller than NUMBA_MIN_BATCH_SIZE always
+    use numpy. Inputs are broadcast against each other.
+
+    Args:
+        base_stats (np.ndarray): (N, 6) array of base stats of the species, as given by
+            SPECIES_ARRAYS["base_stats"].
+        ivs (np.ndarray): (N, 6) array of IVs.
+        evs (np.ndarray): (N, 6) array of EVs.
+        levels (Union[int, np.ndarray]): (N,) array of levels.
+        nature_ids (Union[int, np.ndarray]): (N,) array of nature ids, which are positions in
+            NATURE_NAMES, NO_NATURE for neutral modifiers.
+
+    Returns:
+        An (N, 6) integer array of stats, ordered as health, attack, defense, special_attack,
+        special_defense and speed.
+    """
+    # Widened first, narrow integer inputs such as the memory-mapped base stats would overflow
+    base_stats, ivs, evs, levels = np.broadcast_arrays(
+        np.asarray(base_stats, dtype=np.int64),
+        np.asarray(ivs, dtype=np.int64),
+        np.asarray(evs, dtype=np.int64),
+        np.asarray(levels, dtype=np.int64)[..., np.newaxis],
+    )
+    modifiers = np.broadcast_to(nature_modifiers_batch(nature_ids), levels.shape[:-1] + (5,))
+    if _backend == "numba" and base_stats.size // 6 >= NUMBA_MIN_BATCH_SIZE:
+        inputs = (
+            base_stats.reshape(-1, 6),
+            ivs.reshape(-1, 6),
+            evs.reshape(-1, 6),
+            levels.reshape(-1, 6)[:, 0],
+            modifiers.reshape(-1, 5),
+        )
+        for array in inputs:  # broadcast views are only to be read, numba warns otherwise
+            array.flags.writeable = False
+        return _numba_kernel()(*inputs).reshape(base_stats.shape)
+    return _numpy_kernel(base_stats, ivs, evs, levels[..., 0], modifiers)
+
+
+def nature_modifiers_batch(nature_ids: Union[int, np.ndarray]) -> np.ndarray:
+    """
+    Vectorized version of `nature_modifiers`, working on nature ids.
+
+    Args:
+        nature_ids (Union[int, np.ndarray]): ids of the natures, NO_NATURE for neutral modifiers.
+
+    Returns:
+        A float array with the 5 modifiers of each nature, of shape (..., 5).
+    """
+    return _modifiers_with_neutral()[nature_ids]
+
+
+def _numpy_kernel(
+    base_stats: np.ndarray,
+    ivs: np.ndarray,
+    evs: np.ndarray,
+    levels: np.ndarray,
+    modifiers: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluate the stat formula with numpy array operations.
+
+    Args:
+        base_stats (np.ndarray): array of shape (..., 6) of base stats.
+        ivs (np.ndarray): array of shape (..., 6) of IVs.
+        evs (np.ndarray): array of shape (..., 6) of EVs.
+        levels (np.ndarray): array of shape (...) of levels.
+        modifiers (np.ndarray): array of shape (..., 5) of nature modifiers.
+
+    Returns:
+        An integer array of shape (..., 6) of stats.
+    """
+    stats = np.empty(base_stats.shape, dtype=np.float64)
+    stats[..., 0] = _health(base_stats[..., 0], ivs[..., 0], evs[..., 0], levels)
+    stats[..., 1:] = _stat(
+        base_stats[..., 1:], ivs[..., 1:], evs[..., 1:], levels[..., np.newaxis], modifiers
+    )
+    return np.trunc(stats).astype(np.int64)
+
+
+@lru_cache(maxsize=None)
+def _numba_kernel() -> Callable[..., np.ndarray]:
+    """
+    Compile the numba counterpart of `_numpy_kernel`, looping over (N, 6) arrays of inputs. The
+    compilation happens on first use, so that numba is only imported when needed, and is cached on
+    disk by numba for the next processes. Inputs are always widened to int64 and float64 arrays,
+    so that narrow inputs such as the int16 columns of tables do not trigger new compilations.
+    """
+    import numba
+
+    logger.debug("Compiling the numba stats kernel")
+    health, stat = numba.njit(cache=True)(_health), numba.njit(cache=True)(_stat)
+
+    @numba.njit(cache=True)
+    def kernel(base_stats, ivs, evs, levels, modifiers):
+        stats = np.empty(base_stats.shape, dtype=np.int64)
+        for row in range(base_stats.shape[0]):
+            level = levels[row]
+            stats[row, 0] = int(health(base_stats[row, 0], ivs[row, 0], evs[row, 0], level))
+            for column in range(1, 6):
+                stats[row, column] = int(
+                    stat(
+                        base_stats[row, column],
+                        ivs[row, column],
+                        evs[row, column],
+                        level,
+                        modifiers[row, column - 1],
+                    )
+                )
+        return stats
+
+    return kernel
+
+
+@lru_cache(maxsize=None)
+def _modifiers_with_neutral() -> np.ndarray:
+    """Natures modifiers matrix with neutral modifiers appended, which NO_NATURE indexes."""
+    modifiers = np.vstack([data.NATURE_MODIFIERS, NEUTRAL_NATURE_MODIFIERS])
+    modifiers.flags.writeable = False
+    return modifiers
+
+
+data.on_reload(_modifiers_with_neutral.cache_clear)
+
+
+# ----- Backend Selection ----- #
+
+
+_backend = "numba" if importlib.util.find_spec("numba") is not None else "numpy"
+
+
+def stats_backend() -> str:
+    """
+    Return the backend of `compute_stats_batch`, which defaults to "numba" when numba is
+    installed and to "numpy" otherwise. Small batches use numpy anyway, see NUMBA_MIN_BATCH_SIZE.
+
+    Returns:
+        The name of the backend, one of STATS_BACKENDS.
+    """
+    return _backend
+
+
+def set_stats_backend(backend: str) -> None:
+    """
+    Select the backend of `compute_stats_batch`. Both give the same stats.
+
+    Args:
+        backend (str): "numpy" for array operations, or "numba" for a JIT compiled loop, which
+            requires numba to be installed.
+    """
+    global _backend
+    if backend not in STATS_BACKENDS:
+        logger.error(f"Invalid stats backend '{backend}', expected one of {STATS_BACKENDS}")
+        raise ValueError("Invalid stats backend.")
+    if backend == "numba" and importlib.util.find_spec("numba") is None:
+        logger.error("The numba stats backend was selected, but numba is not installed.")
+        raise ValueError("Invalid stats backend.")
+    logger.debug("Using the {} stats backend", backend)
+    _backend = backend
+
+
+# ----- Cache Management ----- #
+
+
+_cached_stats: Callable[..., StatsTuple] = lru_cache(maxsize=STATS_CACHE_SIZE)(_compute_stats)
+
+
+def stats_cache_info():
+    """
+    Return the statistics of the stats cache.
+
+    Returns:
+        A named tuple with the hits, misses, maxsize and currsize of the cache.
+    """
+    return _cached_stats.cache_info()
+
+
+@data.on_reload
+def clear_stats_cache() -> None:
+    """Empty the stats cache and reset its hit and miss counters."""
+    logger.debug("Clearing the stats cache")
+    _cached_stats.cache_clear()
+
+
+def set_stats_cache_size(maxsize: Optional[int]) -> None:
+    """
+    Resize the stats cache, which also empties it.
+
+    Args:
+        maxsize (Optional[int]): the maximum number of cached results, 0 to disable caching or
+            None for an unbounded cache.
+    """
+    global _cached_stats
+    if maxsize is not None and maxsize < 0:
+        logger.error(f"Invalid stats cache size {maxsize}, which should not be negative.")
+        raise ValueError("Invalid cache size.")
+    logger.debug("Resizing the stats cache to {}", maxsize)
+    _cached_stats = lru_cache(maxsize=maxsize)(_compute_stats)
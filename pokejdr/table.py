@@ -0,0 +1,508 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from pokejdr import base_stats as data
+from pokejdr.model import Pokemon, gain_evs_batch
+from pokejdr.stats import compute_stats_batch
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Scalar columns of the table and their dtypes, chosen compact but wide enough for game values
+SCALAR_COLUMNS: Dict[str, np.dtype] = {
+    "code": np.dtype(np.int32),
+    "number": np.dtype(np.int32),
+    "name_id": np.dtype(np.int32),
+    "level": np.dtype(np.int16),
+    "health": np.dtype(np.int32),
+    "attack": np.dtype(np.int32),
+    "defense": np.dtype(np.int32),
+    "special_attack": np.dtype(np.int32),
+    "special_defense": np.dtype(np.int32),
+    "speed": np.dtype(np.int32),
+    "nature_id": np.dtype(np.int8),
+    "accuracy": np.dtype(np.float64),
+    "dodge": np.dtype(np.float64),
+    "base_xp": np.dtype(np.int32),
+    "experience": np.dtype(np.int32),
+}
+# (N, 6) columns of the table, stats ordered as health, attack, defense, special_attack,
+# special_defense, speed
+MATRIX_COLUMNS: Dict[str, np.dtype] = {
+    "iv": np.dtype(np.int16),
+    "ev": np.dtype(np.int16),
+    "base_ev": np.dtype(np.int16),
+}
+STAT_COLUMNS = ("health", "attack", "defense", "special_attack", "special_defense", "speed")
+
+# A level of 0 stands for a missing level, an experience of -1 for untracked experience and a
+# nature id of -1 for a missing nature, see `_nature_names` and `pokejdr.stats.NO_NATURE`.
+_NO_LEVEL = 0
+_NO_EXPERIENCE = -1
+
+
+# ----- Containers ----- #
+
+
+class PokemonTable:
+    """
+    Columnar (struct-of-arrays) container for many pokemons, with one numpy array per attribute.
+    Names and natures are stored as integer ids referencing the species and natures registries of
+    `pokejdr.base_stats`, and IVs, EVs and base EVs as (N, 6) arrays. Indexing with an integer
+    gives a `PokemonRow` view, writing through to the arrays, while indexing with a slice, mask
+    or array of indices gives a new table.
+    """
+
+    __slots__ = tuple(SCALAR_COLUMNS) + tuple(MATRIX_COLUMNS)
+
+    def __init__(self, **columns: np.ndarray):
+        expected = set(SCALAR_COLUMNS) | set(MATRIX_COLUMNS)
+        if set(columns) != expected:
+            logger.error(
+                f"Invalid columns provided to PokemonTable, missing: {expected - set(columns)}, "
+                f"unexpected: {set(columns) - expected}"
+            )
+            raise ValueError("Invalid PokemonTable columns.")
+
+        size = len(columns["code"])
+        for column, dtype in SCALAR_COLUMNS.items():
+            array = np.asarray(columns[column], dtype=dtype)
+            if array.shape != (size,):
+                logger.error(f"Column '{column}' has shape {array.shape}, expected ({size},)")
+                raise ValueError("Invalid PokemonTable column shape.")
+            setattr(self, column, array)
+        for column, dtype in MATRIX_COLUMNS.items():
+            array = np.asarray(columns[column], dtype=dtype)
+            if array.shape != (size, 6):
+                logger.error(f"Column '{column}' has shape {array.shape}, expected ({size}, 6)")
+                raise ValueError("Invalid PokemonTable column shape.")
+            setattr(self, column, array)
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            index = int(key) + len(self) if key < 0 else int(key)
+            if not 0 <= index < len(self):
+                raise IndexError("PokemonTable index out of range.")
+            return PokemonRow(self, index)
+        return PokemonTable(**{column: getattr(self, column)[key] for column in self.__slots__})
+
+    def __iter__(self) -> Iterator["PokemonRow"]:
+        for index in range(len(self)):
+            yield PokemonRow(self, index)
+
+    def __repr__(self) -> str:
+        return f"PokemonTable({len(self)} pokemons, {self.nbytes:,} bytes)"
+
+    @property
+    def nbytes(self) -> int:
+        """Total memory used by the table's arrays, in bytes."""
+        return sum(getattr(self, column).nbytes for column in self.__slots__)
+
+    @property
+    def name(self) -> np.ndarray:
+        """Array of the pokemons' names."""
+        return data.SPECIES_ARRAYS["name"][self.name_id]
+
+    @property
+    def nature(self) -> np.ndarray:
+        """Array of the pokemons' nature names, None for pokemons without a nature."""
+        return _nature_names()[self.nature_id]
+
+    @property
+    def types(self) -> np.ndarray:
+        """
+        (N, 2) array of the ids of the pokemons' elemental types (see `pokejdr.type_chart`), with
+        NO_TYPE as second type of single typed pokemons.
+        """
+        return data.SPECIES_ARRAYS["types"][self.name_id]
+
+    @property
+    def stats(self) -> np.ndarray:
+        """(N, 6) array of the pokemons' current stats. This is a copy, not a view."""
+        return np.column_stack([getattr(self, column) for column in STAT_COLUMNS])
+
+    @property
+    def total(self) -> np.ndarray:
+        """Array of the sum of each pokemon's stats."""
+        return self.stats.sum(axis=1)
+
+    @property
+    def fainted(self) -> np.ndarray:
+        """Boolean mask of the pokemons that have fainted."""
+        return self.health == 0
+
+    # ----- Population Functionality ----- #
+
+    def max_health(self) -> np.ndarray:
+        """
+        Compute the maximum health of each pokemon from its species, IVs, EVs and level.
+
+        Returns:
+            An integer numpy array with the maximum health of each pokemon.
+        """
+        return self._leveled_stats()[:, 0]
+
+    def damage(self, amounts: Union[int, np.ndarray], mask: Optional[np.ndarray] = None) -> None:
+        """
+        Remove health from the pokemons, health values not dropping below 0.
+
+        Args:
+            amounts (Union[int, np.ndarray]): damage to remove from each pokemon's health.
+            mask (Optional[np.ndarray]): boolean mask or indices of the pokemons to damage.
+                Defaults to None, which means all pokemons.
+        """
+        selection = slice(None) if mask is None else mask
+        self.health[selection] = np.maximum(self.health[selection] - amounts, 0)
+
+    def heal(self, mask: Optional[np.ndarray] = None) -> None:
+        """
+        Restore the health of the pokemons to their maximum.
+
+        Args:
+            mask (Optional[np.ndarray]): boolean mask or indices of the pokemons to heal.
+                Defaults to None, which means all pokemons.
+        """
+        selection = slice(None) if mask is None else mask
+        self.health[selection] = self.max_health()[selection]
+
+    def level_up(
+        self, levels: Union[int, np.ndarray] = 1, mask: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Increment the pokemons' level, capped at 100, and update their stats. Pokemons without a
+        level are left untouched. Stats are only recomputed for the pokemons leveling up.
+
+        Args:
+            levels (Union[int, np.ndarray]): number of levels to gain, for all or each selected
+                pokemon. Defaults to 1.
+            mask (Optional[np.ndarray]): boolean mask or indices of the pokemons to level up.
+                Defaults to None, which means all pokemons.
+        """
+        rows = np.arange(len(self)) if mask is None else np.arange(len(self))[mask]
+        levels = np.broadcast_to(levels, rows.shape)
+        has_level = self.level[rows] != _NO_LEVEL
+        rows, levels = rows[has_level], levels[has_level]
+        logger.debug("Leveling up {} pokemons of the table", len(rows))
+        self.level[rows] = np.minimum(self.level[rows] + levels, 100)
+        stats = self._leveled_stats(rows)
+        for position, column in enumerate(STAT_COLUMNS):
+            getattr(self, column)[rows] = stats[:, position]
+
+    def gain_evs(self, gained_evs: np.ndarray, winners: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Add EVs to the pokemons, within the per stat and total limits, see
+        `pokejdr.model.gain_evs_batch`. Stats are only recomputed for the pokemons whose EVs
+        actually changed, which keep the damage they have taken.
+
+        Args:
+            gained_evs (np.ndarray): (N, 6) array of EVs gained by each pokemon, or (K, 6) array
+                of EVs gained in K battles if winners is given.
+            winners (Optional[np.ndarray]): (K,) array with the index of the pokemon winning each
+                battle. Defaults to None.
+
+        Returns:
+            A boolean numpy array telling which pokemons had their EVs changed.
+        """
+        new_evs = gain_evs_batch(self.ev, gained_evs, winners)
+        changed = (new_evs != self.ev).any(axis=1)
+        logger.debug("{} pokemons of the table gain EVs", int(changed.sum()))
+        leveled = changed & (self.level != _NO_LEVEL)
+        damage_taken = self._leveled_stats(leveled)[:, 0] - self.health[leveled]
+        self.ev[changed] = new_evs[changed]
+        stats = self._leveled_stats(leveled)
+        stats[:, 0] = np.maximum(stats[:, 0] - damage_taken, 0)
+        for position, column in enumerate(STAT_COLUMNS):
+            getattr(self, column)[leveled] = stats[:, position]
+        return changed
+
+    def _leveled_stats(self, selection: Union[slice, np.ndarray] = slice(None)) -> np.ndarray:
+        """Compute the stats at their current level of the selected pokemons, as a (K, 6) array."""
+        return compute_stats_batch(
+            data.SPECIES_ARRAYS["base_stats"][self.name_id[selection]],
+            self.iv[selection],
+            self.ev[selection],
+            self.level[selection].astype(np.int64),
+            self.nature_id[selection],
+        )
+
+    # ----- Conversions ----- #
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence]) -> "PokemonTable":
+        """
+        Create a table from columns keyed by Pokemon attribute names, with "name" and "nature"
+        holding names. This is the format returned by `Pokemon.generate_batch` when not returning
+        objects. Columns for attributes with a default value in Pokemon can be omitted.
+
+        Args:
+            columns (Dict[str, Sequence]): the data, as arrays or sequences of equal lengths.
+
+        Returns:
+            A PokemonTable with the data.
+        """
+        size = len(columns["code"])
+        levels = [_NO_LEVEL if level is None else level for level in columns.get("level", [])]
+        return cls(
+            code=columns["code"],
+            number=columns["number"],
+            name_id=_lookup_ids(columns["name"], data.SPECIES_INDEX, "pokemon name"),
+            level=np.full(size, _NO_LEVEL) if "level" not in columns else levels,
+            health=columns["health"],
+            attack=columns["attack"],
+            defense=columns["defense"],
+            special_attack=columns["special_attack"],
+            special_defense=columns["special_defense"],
+            speed=columns["speed"],
+            nature_id=_lookup_ids(
+                columns.get("nature", [None] * size), data.NATURE_INDEX, "nature"
+            ),
+            accuracy=columns.get("accuracy", np.ones(size)),
+            dodge=columns.get("dodge", np.ones(size)),
+            base_xp=_fill_none(columns.get("base_xp", np.zeros(size)), 0),
+            experience=_fill_none(columns.get("experience", [None] * size), _NO_EXPERIENCE),
+            iv=_matrix(columns.get("iv"), size),
+            ev=_matrix(columns.get("ev"), size),
+            base_ev=_matrix(columns.get("base_ev"), size),
+        )
+
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Export the table's data as columns keyed by Pokemon attribute names, with "name" and
+        "nature" holding names.
+
+        Returns:
+            A dictionary of numpy arrays.
+        """
+        level = self.level.astype(object)
+        level[self.level == _NO_LEVEL] = None
+        experience = self.experience.astype(object)
+        experience[self.experience == _NO_EXPERIENCE] = None
+        return {
+            "code": self.code,
+            "number": self.number,
+            "name": self.name,
+            "level": level,
+            "health": self.health,
+            "attack": self.attack,
+            "defense": self.defense,
+            "special_attack": self.special_attack,
+            "special_defense": self.special_defense,
+            "speed": self.speed,
+            "nature": self.nature,
+            "iv": self.iv,
+            "ev": self.ev,
+            "accuracy": self.accuracy,
+            "dodge": self.dodge,
+            "base_xp": self.base_xp,
+            "base_ev": self.base_ev,
+            "experience": experience,
+        }
+
+    @classmethod
+    def from_pokemons(cls, pokemons: Sequence[Pokemon]) -> "PokemonTable":
+        """
+        Create a table from Pokemon objects.
+
+        Args:
+            pokemons (Sequence[Pokemon]): the pokemons to gather.
+
+        Returns:
+            A PokemonTable with the pokemons' data.
+        """
+        logger.debug("Gathering {} pokemons in a table", len(pokemons))
+        return cls.from_columns(
+            {field: [getattr(poke, field) for poke in pokemons] for field in Pokemon.__fields__}
+        )
+
+    def to_pokemons(self) -> List[Pokemon]:
+        """
+        Export the table's data as Pokemon objects. The data is already valid and is not
+        validated again.
+
+        Returns:
+            A list of Pokemon objects.
+        """
+        records = {field: array.tolist() for field, array in self.to_columns().items()}
+        return [
+            Pokemon.construct(**{field: values[i] for field, values in records.items()})
+            for i in range(len(self))
+        ]
+
+    @classmethod
+    def from_dataframe(cls, dataframe: "pd.DataFrame") -> "PokemonTable":
+        """
+        Create a table from a DataFrame in the style of POKEMONS_DF, with one column per Pokemon
+        attribute and lists in the "iv", "ev" and "base_ev" columns. Columns for attributes with a
+        default value in Pokemon can be omitted, and extra columns (such as "total") are ignored.
+
+        Args:
+            dataframe (pd.DataFrame): the data.
+
+        Returns:
+            A PokemonTable with the data.
+        """
+        columns = {}
+        for field in Pokemon.__fields__:
+            if field not in dataframe.columns:
+                continue
+            values = dataframe[field].to_numpy(dtype=object)
+            columns[field] = [None if _is_missing(value) else value for value in values]
+        return cls.from_columns(columns)
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Export the table's data as a DataFrame in the style of POKEMONS_DF, with one column per
+        Pokemon attribute and lists in the "iv", "ev" and "base_ev" columns.
+
+        Returns:
+            A pandas DataFrame with the data.
+        """
+        import pandas as pd
+
+        columns = self.to_columns()
+        for column in MATRIX_COLUMNS:
+            columns[column] = columns[column].tolist()
+        return pd.DataFrame(columns)
+
+
+class PokemonRow:
+    """
+    Zero-copy view on one pokemon of a PokemonTable, exposing the same attributes as Pokemon.
+    Assignments write through to the table, with health values not dropping below 0.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: PokemonTable, index: int):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, attribute: str):
+        if attribute in SCALAR_COLUMNS:
+            return getattr(self._table, attribute)[self._index].item()
+        if attribute in MATRIX_COLUMNS:
+            return getattr(self._table, attribute)[self._index]
+        raise AttributeError(f"'PokemonRow' object has no attribute '{attribute}'")
+
+    def __setattr__(self, attribute: str, value) -> None:
+        if attribute == "health":
+            value = max(int(value), 0)
+        elif attribute == "name":
+            name_ids = _lookup_ids([value], data.SPECIES_INDEX, "pokemon name")
+            attribute, value = "name_id", name_ids[0]
+        elif attribute == "nature":
+            attribute, value = "nature_id", _lookup_ids([value], data.NATURE_INDEX, "nature")[0]
+        elif attribute == "level":
+            value = _NO_LEVEL if value is None else value
+        elif attribute == "experience":
+            value = _NO_EXPERIENCE if value is None else value
+        if attribute not in SCALAR_COLUMNS and attribute not in MATRIX_COLUMNS:
+            raise AttributeError(f"'PokemonRow' object has no attribute '{attribute}'")
+        getattr(self._table, attribute)[self._index] = value
+
+    def __repr__(self) -> str:
+        return f"PokemonRow({self._index}, name='{self.name}', level={self.level})"
+
+    @property
+    def name(self) -> str:
+        return data.SPECIES_STATS[self.name_id].name
+
+    @property
+    def level(self) -> Optional[int]:
+        level = self._table.level[self._index].item()
+        return None if level == _NO_LEVEL else level
+
+    @property
+    def experience(self) -> Optional[int]:
+        experience = self._table.experience[self._index].item()
+        return None if experience == _NO_EXPERIENCE else experience
+
+    @property
+    def nature(self) -> Optional[str]:
+        return _nature_names()[self.nature_id]
+
+    @property
+    def types(self) -> Tuple[str, ...]:
+        return data.SPECIES_STATS[self.name_id].types
+
+    @property
+    def total(self) -> int:
+        return sum(getattr(self, column) for column in STAT_COLUMNS)
+
+    def dict(self) -> dict:
+        """Return the pokemon's data as a dictionary, as `Pokemon.dict` does."""
+        data = {field: getattr(self, field) for field in Pokemon.__fields__}
+        for column in MATRIX_COLUMNS:
+            data[column] = data[column].tolist()
+        return data
+
+    def to_pokemon(self) -> Pokemon:
+        """Return a standalone Pokemon object with a copy of this row's data."""
+        return Pokemon(**self.dict())
+
+
+# ----- Private Helpers ----- #
+
+
+def _lookup_ids(values: Sequence, index: Dict[str, int], kind: str) -> np.ndarray:
+    """
+    Resolve names to their integer ids through the given registry index, None giving -1. Each
+    distinct name is only looked up once.
+
+    Args:
+        values (Sequence): the names to resolve.
+        index (Dict[str, int]): the name -> id mapping of the registry.
+        kind (str): what is being resolved, for error messages.
+
+    Returns:
+        An integer numpy array of ids.
+    """
+    values = np.asarray(values, dtype=object)
+    ids = np.full(len(values), -1, dtype=np.int64)
+    is_set = np.array([value is not None for value in values], dtype=bool)
+    unique_values, inverse = np.unique(values[is_set].astype(str), return_inverse=True)
+    unique_ids = np.empty(len(unique_values), dtype=np.int64)
+    for position, value in enumerate(unique_values):
+        if value not in index:
+            logger.error(f"An invalid {kind} was provided: '{value}'")
+            raise ValueError(f"Invalid {kind}.")
+        unique_ids[position] = index[value]
+    ids[is_set] = unique_ids[inverse]
+    return ids
+
+
+def _is_missing(value) -> bool:
+    """Whether a DataFrame cell holds a missing scalar value (None, NaN or pd.NA)."""
+    import pandas as pd
+
+    return value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value))
+
+
+def _fill_none(values: Sequence, default) -> list:
+    """Replace None values in a sequence by a default value."""
+    return [default if value is None else value for value in values]
+
+
+def _matrix(values: Optional[Sequence], size: int) -> np.ndarray:
+    """Build an (N, 6) array from a sequence of 6-values rows, None rows giving zeros."""
+    if values is None:
+        return np.zeros((size, 6), dtype=np.int64)
+    if isinstance(values, np.ndarray):
+        return values
+    rows = [[0] * 6 if row is None else list(row) for row in values]
+    return np.array(rows, dtype=np.int64).reshape(len(rows), 6)
+
+
+@lru_cache(maxsize=None)
+def _nature_names() -> np.ndarray:
+    """Nature names as an array indexed by nature id, where id -1 gives None."""
+    return np.array(data.NATURE_NAMES + (None,), dtype=object)
+
+
+data.on_reload(_nature_names.cache_clear)
@@ -0,0 +1,284 @@
+"""
+Elemental types and their effectiveness against each other. The type chart is precomputed as a
+(types x types) matrix of damage multipliers indexed by type ids, so that the effectiveness of a
+move against single or dual typed pokemons is a couple of numpy lookups, for one attack as well as
+for a whole batch of them.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+TYPES: Tuple[str, ...] = (
+    "Normal",
+    "Feu",
+    "Eau",
+    "Plante",
+    "Électrik",
+    "Glace",
+    "Combat",
+    "Poison",
+    "Sol",
+    "Vol",
+    "Psy",
+    "Insecte",
+    "Roche",
+    "Spectre",
+    "Dragon",
+    "Ténèbres",
+    "Acier",
+    "Fée",
+)
+TYPE_INDEX: Dict[str, int] = {type_name: type_id for type_id, type_name in enumerate(TYPES)}
+NO_TYPE = -1  # type id of the missing second type of single typed pokemons
+
+STAB_MULTIPLIER = 1.5  # same type attack bonus, for moves sharing a type of the attacker
+
+# Multipliers of the attacking types that are not neutral, by defending type
+_MATCHUPS: Dict[str, Dict[str, float]] = {
+    "Normal": {"Roche": 0.5, "Spectre": 0, "Acier": 0.5},
+    "Feu": {
+        "Feu": 0.5,
+        "Eau": 0.5,
+        "Plante": 2,
+        "Glace": 2,
+        "Insecte": 2,
+        "Roche": 0.5,
+        "Dragon": 0.5,
+        "Acier": 2,
+    },
+    "Eau": {"Feu": 2, "Eau": 0.5, "Plante": 0.5, "Sol": 2, "Roche": 2, "Dragon": 0.5},
+    "Plante": {
+        "Feu": 0.5,
+        "Eau": 2,
+        "Plante": 0.5,
+        "Poison": 0.5,
+        "Sol": 2,
+        "Vol": 0.5,
+        "Insecte": 0.5,
+        "Roche": 2,
+        "Dragon": 0.5,
+        "Acier": 0.5,
+    },
+    "Électrik": {"Eau": 2, "Plante": 0.5, "Électrik": 0.5, "Sol": 0, "Vol": 2, "Dragon": 0.5},
+    "Glace": {
+        "Feu": 0.5,
+        "Eau": 0.5,
+        "Plante": 2,
+        "Glace": 0.5,
+        "Sol": 2,
+        "Vol": 2,
+        "Dragon": 2,
+        "Acier": 0.5,
+    },
+    "Combat": {
+        "Normal": 2,
+        "Glace": 2,
+        "Poison": 0.5,
+        "Vol": 0.5,
+        "Psy": 0.5,
+        "Insecte": 0.5,
+        "Roche": 2,
+        "Spectre": 0,
+        "Ténèbres": 2,
+        "Acier": 2,
+        "Fée": 0.5,
+    },
+    "Poison": {
+        "Plante": 2,
+        "Poison": 0.5,
+        "Sol": 0.5,
+        "Roche": 0.5,
+        "Spectre": 0.5,
+        "Acier": 0,
+        "Fée": 2,
+    },
+    "Sol": {
+        "Feu": 2,
+        "Plante": 0.5,
+        "Électrik": 2,
+        "Poison": 2,
+        "Vol": 0,
+        "Insecte": 0.5,
+        "Roche": 2,
+        "Acier": 2,
+    },
+    "Vol": {"Plante": 2, "Électrik": 0.5, "Combat": 2, "Insecte": 2, "Roche": 0.5, "Acier": 0.5},
+    "Psy": {"Combat": 2, "Poison": 2, "Psy": 0.5, "Ténèbres": 0, "Acier": 0.5},
+    "Insecte": {
+        "Feu": 0.5,
+        "Plante": 2,
+        "Combat": 0.5,
+        "Poison": 0.5,
+        "Vol": 0.5,
+        "Psy": 2,
+        "Spectre": 0.5,
+        "Ténèbres": 2,
+        "Acier": 0.5,
+        "Fée": 0.5,
+    },
+    "Roche": {
+        "Feu": 2,
+        "Glace": 2,
+        "Combat": 0.5,
+        "Sol": 0.5,
+        "Vol": 2,
+        "Insecte": 2,
+        "Acier": 0.5,
+    },
+    "Spectre": {"Normal": 0, "Psy": 2, "Spectre": 2, "Ténèbres": 0.5},
+    "Dragon": {"Dragon": 2, "Acier": 0.5, "Fée": 0},
+    "Ténèbres": {"Combat": 0.5, "Psy": 2, "Spectre": 2, "Ténèbres": 0.5, "Fée": 0.5},
+    "Acier": {
+        "Feu": 0.5,
+        "Eau": 0.5,
+        "Électrik": 0.5,
+        "Glace": 2,
+        "Roche": 2,
+        "Acier": 0.5,
+        "Fée": 2,
+    },
+    "Fée": {"Feu": 0.5, "Combat": 2, "Poison": 0.5, "Dragon": 2, "Ténèbres": 2, "Acier": 0.5},
+}
+
+
+def _build_effectiveness_matrix() -> np.ndarray:
+    """
+    Build the read-only matrix of damage multipliers, with attacking types as rows and defending
+    types as columns. An extra neutral column is appended, which the NO_TYPE id (-1) indexes, so
+    that the second type of single typed pokemons needs no special case.
+    """
+    matrix = np.ones((len(TYPES), len(TYPES) + 1), dtype=np.float64)
+    for attacking, matchups in _MATCHUPS.items():
+        for defending, multiplier in matchups.items():
+            matrix[TYPE_INDEX[attacking], TYPE_INDEX[defending]] = multiplier
+    matrix.flags.writeable = False
+    return matrix
+
+
+EFFECTIVENESS = _build_effectiveness_matrix()
+
+
+# ----- Lookups ----- #
+
+
+def effectiveness(move_type: str, defender_types: Sequence[str]) -> float:
+    """
+    Calculate the damage multiplier of a move of the given type against a pokemon.
+
+    Args:
+        move_type (str): elemental type of the move.
+        defender_types (Sequence[str]): the one or two types of the pokemon getting attacked.
+
+    Returns:
+        The damage multiplier, 0 when the pokemon is immune to the move.
+    """
+    _assert_valid_type(move_type)
+    move_id = TYPE_INDEX[move_type]
+    multiplier = 1.0
+    for defender_type in defender_types:
+        multiplier *= EFFECTIVENESS[move_id, type_id(defender_type)]
+    return float(multiplier)
+
+
+def stab(move_type: str, attacker_types: Sequence[str]) -> float:
+    """
+    Calculate the same type attack bonus of a move used by a pokemon.
+
+    Args:
+        move_type (str): elemental type of the move.
+        attacker_types (Sequence[str]): the one or two types of the attacking pokemon.
+
+    Returns:
+        STAB_MULTIPLIER if the move shares a type of the pokemon, 1 otherwise.
+    """
+    _assert_valid_type(move_type)
+    return STAB_MULTIPLIER if move_type in attacker_types else 1.0
+
+
+def effectiveness_batch(move_type_ids: np.ndarray, defender_type_ids: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of `effectiveness`, working on type ids. Inputs are broadcast against each
+    other.
+
+    Args:
+        move_type_ids (np.ndarray): type ids of the moves.
+        defender_type_ids (np.ndarray): array of shape (..., 2) with the type ids of the pokemons
+            getting attacked, NO_TYPE for the missing second type of single typed pokemons.
+
+    Returns:
+        A float numpy array with the damage multiplier of each attack.
+    """
+    move_type_ids = np.asarray(move_type_ids)
+    defender_type_ids = np.asarray(defender_type_ids)
+    return (
+        EFFECTIVENESS[move_type_ids, defender_type_ids[..., 0]]
+        * EFFECTIVENESS[move_type_ids, defender_type_ids[..., 1]]
+    )
+
+
+def stab_batch(move_type_ids: np.ndarray, attacker_type_ids: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of `stab`, working on type ids. Inputs are broadcast against each other.
+
+    Args:
+        move_type_ids (np.ndarray): type ids of the moves.
+        attacker_type_ids (np.ndarray): array of shape (..., 2) with the type ids of the
+            attacking pokemons, NO_TYPE for the missing second type of single typed pokemons.
+
+    Returns:
+        A float numpy array with the same type attack bonus of each attack.
+    """
+    shares_type = (np.asarray(attacker_type_ids) == np.asarray(move_type_ids)[..., None]).any(-1)
+    return np.where(shares_type, STAB_MULTIPLIER, 1.0)
+
+
+def type_id(type_name: Optional[str]) -> int:
+    """
+    Resolve a type name to its id, which is its position in TYPES. None and empty names, used for
+    the missing second type of single typed pokemons, resolve to NO_TYPE.
+
+    Args:
+        type_name (Optional[str]): name of the type.
+
+    Returns:
+        The id of the type.
+    """
+    if not type_name:
+        return NO_TYPE
+    _assert_valid_type(type_name)
+    return TYPE_INDEX[type_name]
+
+
+def type_ids(type_names: Union[str, Sequence]) -> np.ndarray:
+    """
+    Vectorized version of `type_id`, resolving an array of type names to their ids. Each distinct
+    name is only checked once.
+
+    Args:
+        type_names (Union[str, Sequence]): names of the types, of any shape.
+
+    Returns:
+        An integer numpy array of type ids, with the shape of the input.
+    """
+    names = np.asarray(type_names, dtype=object)
+    flat_names = np.array([name or "" for name in names.ravel()], dtype=str)
+    unique_names, inverse = np.unique(flat_names, return_inverse=True)
+    unique_ids = np.array([type_id(name) for name in unique_names], dtype=np.int64)
+    return unique_ids[inverse].reshape(names.shape)
+
+
+# ----- Private Helpers ----- #
+
+
+def _assert_valid_type(type_name: str) -> None:
+    """
+    Ensure the given elemental type is valid, log then raise ValueError if not.
+
+    Args:
+        type_name (str): name of the type to check the validity of.
+    """
+    if type_name not in TYPE_INDEX:
+        logger.error(f"An invalid elemental type was provided: '{type_name}'")
+        raise ValueError("Invalid elemental type.")
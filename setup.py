@@ -29,6 +29,12 @@ EXTRA_DEPENDENCIES = {
         "pytest>=5.2",
         "pytest-cov>=2.7",
     ],
+    "benchmark": [
+        "pytest-benchmark>=3.2",
+    ],
+    "fast": [
+        "numba>=0.50",
+    ],
 }
 EXTRA_DEPENDENCIES.update(
     {"all": [elem for list_ in EXTRA_DEPENDENCIES.values() for elem in list_]}
@@ -48,14 +54,13 @@ setuptools.setup(
     package_data={
         "pokejdr": ["data/*"],
     },  # Include all files found in the "data" subdirectory
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     license=ABOUT_POKEJDR["__license__"],
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Natural Language :: English",
         "Programming Language :: Python",
         "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -0,0 +1,36 @@
+"""
+Shared fixtures of the test suite. Pokemons are loaded from the files of the inputs directory, or
+generated with seeded random number generators.
+"""
+
+import pathlib
+
+import numpy as np
+import pytest
+
+from pokejdr.model import Pokemon
+
+INPUTS_DIR = pathlib.Path(__file__).parent / "inputs"
+
+
+@pytest.fixture()
+def _attacker_pokemon() -> Pokemon:
+    return Pokemon.from_json(INPUTS_DIR / "bulbizarre.json")
+
+
+@pytest.fixture()
+def _defender_pokemon() -> Pokemon:
+    return Pokemon.from_pickle(INPUTS_DIR / "nosferapti.pkl")
+
+
+@pytest.fixture()
+def _pokemons() -> list:
+    pikachu = Pokemon.generate_random("Pikachu", 25, rng=np.random.default_rng(0))
+    pikachu.nature = None
+    pikachu.experience = 15_000
+    return [
+        Pokemon.from_json(INPUTS_DIR / "bulbizarre.json"),
+        Pokemon.from_pickle(INPUTS_DIR / "nosferapti.pkl"),
+        pikachu,
+        Pokemon.generate_random("Bekaglaçon", 80, rng=np.random.default_rng(1)),
+    ]
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pokejdr import aio
+from pokejdr.model import Pokemon
+from pokejdr.table import PokemonTable
+
+
+class TestSinglePokemon:
+    @pytest.mark.parametrize("format", ["json", "pickle", "binary"])
+    def test_save_load(self, tmp_path, _pokemons, format):
+        save, load = getattr(aio, f"to_{format}"), getattr(aio, f"from_{format}")
+
+        async def round_trip():
+            await save(_pokemons[0], tmp_path / "save")
+            return await load(tmp_path / "save")
+
+        assert asyncio.run(round_trip()) == _pokemons[0]
+
+    def test_event_loop_is_not_blocked(self, tmp_path, _pokemons, monkeypatch):
+        io_thread = []
+
+        def slow_to_json(pokemon, json_file):
+            io_thread.append(threading.current_thread())
+            time.sleep(0.2)
+
+        monkeypatch.setattr(Pokemon, "to_json", slow_to_json)
+
+        async def save_and_tick():
+            ticks = 0
+            save = asyncio.ensure_future(aio.to_json(_pokemons[0], tmp_path / "save.json"))
+            while not save.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return ticks
+
+        assert asyncio.run(save_and_tick()) > 5
+        assert io_thread[0] is not threading.main_thread()
+
+
+class TestManyPokemons:
+    @pytest.mark.parametrize("format", ["json", "pickle", "binary"])
+    def test_save_load(self, tmp_path, _pokemons, format):
+        files = [tmp_path / f"{position}.{format}" for position in range(len(_pokemons))]
+
+        async def round_trip():
+            await aio.save_pokemons(_pokemons, files, format=format, max_workers=3)
+            return await aio.load_pokemons(files, format=format, max_workers=3)
+
+        assert asyncio.run(round_trip()) == _pokemons
+
+    def test_workers_are_bounded(self, tmp_path, _pokemons, monkeypatch):
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def counting_to_json(pokemon, json_file):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        monkeypatch.setattr(Pokemon, "to_json", counting_to_json)
+        pokemons = _pokemons * 5
+        files = [tmp_path / f"{position}.json" for position in range(len(pokemons))]
+        asyncio.run(aio.save_pokemons(pokemons, files, max_workers=2))
+        assert peak[0] == 2
+
+    def test_roster(self, tmp_path, _pokemons):
+        async def round_trip():
+            await aio.save_roster(_pokemons, tmp_path / "box.bin")
+            return await aio.load_roster(tmp_path / "box.bin", as_table=True)
+
+        table = asyncio.run(round_trip())
+        assert isinstance(table, PokemonTable)
+        assert table.to_pokemons() == _pokemons
+
+    @pytest.mark.parametrize(
+        "parameters", [dict(format="yaml"), dict(max_workers=0), dict(files=["one.json"])]
+    )
+    def test_invalid_parameters(self, _pokemons, parameters):
+        parameters = dict(dict(pokemons=_pokemons, files=["a.json"] * 4), **parameters)
+        with pytest.raises(ValueError, match="Invalid bulk parameters"):
+            asyncio.run(aio.save_pokemons(**parameters))
@@ -0,0 +1,97 @@
+import struct
+
+import numpy as np
+import pytest
+
+from pokejdr import base_stats
+from pokejdr.columnar import FORMAT_VERSION, MAGIC, read_columns, write_columns
+
+
+class TestColumnarFormat:
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_round_trip(self, tmp_path, _columns, mmap):
+        write_columns(tmp_path / "data.bin", _columns)
+        loaded = read_columns(tmp_path / "data.bin", mmap=mmap)
+        assert list(loaded) == list(_columns)
+        for name, column in _columns.items():
+            assert loaded[name].dtype == column.dtype
+            assert np.array_equal(loaded[name], column)
+        assert isinstance(loaded["level"], np.memmap) == mmap
+
+    def test_columns_are_aligned(self, tmp_path, _columns):
+        write_columns(tmp_path / "data.bin", _columns)
+        for column in read_columns(tmp_path / "data.bin").values():
+            assert column.ctypes.data % 64 == 0
+
+    def test_columns_are_read_only(self, tmp_path, _columns):
+        write_columns(tmp_path / "data.bin", _columns)
+        loaded = read_columns(tmp_path / "data.bin")
+        with pytest.raises(ValueError):
+            loaded["level"][0] = 100
+
+    def test_empty_columns(self, tmp_path):
+        write_columns(tmp_path / "data.bin", {"level": np.array([], dtype=np.int16)})
+        assert read_columns(tmp_path / "data.bin")["level"].shape == (0,)
+
+    def test_object_columns_are_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_columns(tmp_path / "data.bin", {"name": np.array(["Pikachu"], dtype=object)})
+
+    def test_invalid_magic(self, tmp_path):
+        (tmp_path / "data.bin").write_bytes(b"NOTADATAFILE" * 4)
+        with pytest.raises(ValueError, match="Invalid data file"):
+            read_columns(tmp_path / "data.bin")
+
+    def test_truncated_file(self, tmp_path):
+        (tmp_path / "data.bin").write_bytes(MAGIC)
+        with pytest.raises(ValueError, match="Invalid data file"):
+            read_columns(tmp_path / "data.bin")
+
+    def test_unsupported_version(self, tmp_path, _columns):
+        write_columns(tmp_path / "data.bin", _columns)
+        content = bytearray((tmp_path / "data.bin").read_bytes())
+        content[len(MAGIC) : len(MAGIC) + 4] = struct.pack("<I", FORMAT_VERSION + 1)
+        (tmp_path / "data.bin").write_bytes(bytes(content))
+        with pytest.raises(ValueError, match="Unsupported data file version"):
+            read_columns(tmp_path / "data.bin")
+
+    def test_convert_pickles(self, tmp_path):
+        for path in (
+            base_stats.NATURES_PICKLE,
+            base_stats.POKEMONS_PICKLE,
+            base_stats.MOVES_PICKLE,
+        ):
+            (tmp_path / path.name).write_bytes(path.read_bytes())
+        base_stats.convert_pickles(tmp_path)
+        for path in (
+            base_stats.NATURES_BINARY,
+            base_stats.POKEMONS_BINARY,
+            base_stats.MOVES_BINARY,
+        ):
+            assert (tmp_path / path.name).read_bytes() == path.read_bytes()
+
+    def test_data_files_are_compact(self):
+        pokemons_data = read_columns(base_stats.POKEMONS_BINARY)
+        assert pokemons_data["base_stats"].dtype == np.uint8
+        assert pokemons_data["base_ev"].dtype == np.uint8
+        assert pokemons_data["name"].dtype.kind == "S"
+        assert read_columns(base_stats.MOVES_BINARY)["priority"].dtype.kind == "i"
+        assert base_stats.POKEMONS_BINARY.stat().st_size < base_stats.POKEMONS_PICKLE.stat().st_size
+
+    def test_data_strings_are_decoded(self):
+        assert base_stats.SPECIES_STATS[0].name == "Bulbizarre"
+        assert base_stats.SPECIES_STATS[0].attack == 49
+        assert "Électrik" in {record.type for record in base_stats.MOVES}
+
+
+# ----- Fixtures ----- #
+
+
+@pytest.fixture()
+def _columns():
+    return {
+        "name": np.array(["Pikachu", "Bulbizarre", "Évoli"]),
+        "level": np.array([5, 12, 100], dtype=np.int16),
+        "accuracy": np.array([1.0, 0.9, 1.1]),
+        "iv": np.arange(18, dtype=np.int64).reshape(3, 6),
+    }
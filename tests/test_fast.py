@@ -0,0 +1,97 @@
+import pickle
+
+import pytest
+
+from pokejdr.fast import FastPokemon
+from pokejdr.model import Pokemon, dealt_damage
+
+
+class TestConversions:
+    def test_round_trip(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        assert isinstance(fast, FastPokemon)
+        assert fast == _attacker_pokemon
+        assert fast.to_pokemon() == _attacker_pokemon
+
+    def test_lists_are_copied(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        fast.ev[0] = 100
+        assert _attacker_pokemon.ev[0] == 0
+
+    def test_pickle(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        assert pickle.loads(pickle.dumps(fast)) == fast
+
+    def test_bytes(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        assert fast.to_bytes() == _attacker_pokemon.to_bytes()
+        assert fast == Pokemon.from_bytes(fast.to_bytes())
+
+
+class TestAssignments:
+    def test_attributes_conversions(self):
+        fast = FastPokemon(
+            code="50",
+            number=37.0,
+            name="Goupix",
+            level=15,
+            health=38.0,
+            attack="41",
+            defense=40.0,
+            special_attack=50.0,
+            special_defense=65.0,
+            speed=65.0,
+        )
+        for attribute in ("code", "number", "health", "attack", "defense", "speed"):
+            assert isinstance(getattr(fast, attribute), int)
+        assert fast.total == 299
+        assert fast.iv == [0, 0, 0, 0, 0, 0]
+        assert isinstance(fast.accuracy, float)
+
+    def test_health_drops_below_0(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        fast.health -= 1000
+        assert fast.health == 0
+
+    def test_invalid_health_type(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        with pytest.raises(TypeError):
+            fast.health = dict()
+
+    def test_no_extra_attributes(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        with pytest.raises(AttributeError):
+            fast.charisma = 10
+
+
+class TestSharedFunctionality:
+    def test_level_up_matches_pokemon(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        fast.ev = [50, 50, 50, 50, 50, 50]
+        _attacker_pokemon.ev = [50, 50, 50, 50, 50, 50]
+        fast.level_up()
+        _attacker_pokemon.level_up()
+        assert fast == _attacker_pokemon
+
+    def test_gain_experience_matches_pokemon(self, _attacker_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        assert fast.gain_experience(50_000, "slow") == _attacker_pokemon.gain_experience(
+            50_000, "slow"
+        )
+        assert fast == _attacker_pokemon
+
+    def test_gain_evs_matches_pokemon(self, _attacker_pokemon, _defender_pokemon):
+        fast = FastPokemon.from_pokemon(_attacker_pokemon)
+        assert fast.gain_evs_from(_defender_pokemon, 10) == _attacker_pokemon.gain_evs_from(
+            _defender_pokemon, 10
+        )
+        assert fast == _attacker_pokemon
+
+    def test_combat(self, _attacker_pokemon, _defender_pokemon):
+        attacker = FastPokemon.from_pokemon(_attacker_pokemon)
+        defender = FastPokemon.from_pokemon(_defender_pokemon)
+        assert 19 <= dealt_damage(attacker, defender, "normal", 10) <= 23
+        assert attacker.hit_probability(defender, 1) == 1
+        for _ in range(2):
+            attacker.perform_physical_attack(defender, attack_power=15)
+        assert defender.health == 0
@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import pytest
+
+from pokejdr import aio, instrumentation, model, simulation
+from pokejdr.fast import FastPokemon
+from pokejdr.model import Pokemon
+
+
+class TestInstrumentation:
+    def test_counts_operations(self):
+        with instrumentation.instrumented(reset=True):
+            attacker = Pokemon.generate_random("Pikachu", 10, rng=1)
+            defender = Pokemon.generate_random("Bulbizarre", 10, rng=2)
+            attacker.level_up()
+            attacker.perform_physical_attack(defender, 50, rng=3)
+        counters = instrumentation.snapshot()
+        assert counters["Pokemon.generate_random"]["calls"] == 2
+        assert counters["Pokemon.generate_random"]["category"] == "generation"
+        assert counters["Pokemon._update_stats_on_levelup"]["calls"] == 1
+        assert counters["dealt_damage"]["calls"] == 1
+        assert counters["Pokemon.__init__"]["calls"] == 2
+        assert counters["Pokemon.to_json"]["calls"] == 0
+        assert counters["Pokemon.generate_random"]["seconds"] > 0
+
+    def test_counts_fast_pokemon_operations(self):
+        attacker = FastPokemon.from_pokemon(Pokemon.generate_random("Pikachu", 10, rng=1))
+        defender = FastPokemon.from_pokemon(Pokemon.generate_random("Bulbizarre", 10, rng=2))
+        with instrumentation.instrumented(reset=True):
+            attacker.perform_physical_attack(defender, 40, rng=3)
+            attacker.perform_special_attack(defender, 40, rng=4)
+            attacker.level_up()
+            attacker.gain_evs([4] * 6)
+        counters = instrumentation.snapshot()
+        assert counters["FastPokemon.perform_physical_attack"]["calls"] == 1
+        assert counters["FastPokemon.perform_special_attack"]["calls"] == 1
+        assert counters["FastPokemon.perform_physical_attack"]["category"] == "damage"
+        assert counters["FastPokemon.level_up"]["calls"] == 1
+        assert counters["FastPokemon.gain_evs"]["calls"] == 1
+        assert counters["Pokemon.level_up"]["calls"] == 0
+        assert counters["dealt_damage"]["calls"] == 2
+
+    def test_counts_io(self, tmp_path):
+        pokemon = Pokemon.generate_random("Pikachu", 10, rng=1)
+        with instrumentation.instrumented(reset=True):
+            pokemon.to_json(tmp_path / "pikachu.json")
+            Pokemon.from_json(tmp_path / "pikachu.json")
+            FastPokemon.from_pokemon(pokemon).to_bytes()
+        counters = instrumentation.snapshot()
+        assert counters["Pokemon.to_json"]["calls"] == 1
+        assert counters["Pokemon.from_json"]["calls"] == 1
+        assert counters["FastPokemon.to_bytes"]["calls"] == 1
+        assert counters["Pokemon.to_json"]["category"] == "io"
+
+    def test_counts_bulk_io(self, tmp_path):
+        pokemons = [Pokemon.generate_random("Pikachu", 10, rng=seed) for seed in range(3)]
+        files = [tmp_path / f"{position}.json" for position in range(len(pokemons))]
+        with instrumentation.instrumented(reset=True):
+            asyncio.run(aio.save_pokemons(pokemons, files))
+            asyncio.run(aio.load_pokemons(files))
+        counters = instrumentation.snapshot()
+        assert counters["Pokemon.to_json"]["calls"] == 3
+        assert counters["Pokemon.from_json"]["calls"] == 3
+
+    def test_disabling_restores_functions(self):
+        generate_random = vars(Pokemon)["generate_random"].__func__
+        with instrumentation.instrumented():
+            assert instrumentation.instrumentation_enabled()
+            assert model.dealt_damage is not _dealt_damage
+            assert "__init__" in vars(Pokemon)
+        assert not instrumentation.instrumentation_enabled()
+        assert model.dealt_damage is _dealt_damage
+        assert vars(Pokemon)["generate_random"].__func__ is generate_random
+        assert "__init__" not in vars(Pokemon)
+        assert "__setattr__" not in vars(Pokemon)
+        assert vars(FastPokemon)["level_up"] is vars(Pokemon)["level_up"]
+
+    def test_disabled_operations_are_not_counted(self):
+        with instrumentation.instrumented(reset=True):
+            pass
+        Pokemon.generate_random("Pikachu", 10, rng=1)
+        assert instrumentation.snapshot()["Pokemon.generate_random"]["calls"] == 0
+
+    def test_nested_contexts(self):
+        with instrumentation.instrumented():
+            with instrumentation.instrumented():
+                pass
+            assert instrumentation.instrumentation_enabled()
+        assert not instrumentation.instrumentation_enabled()
+
+    def test_reset(self):
+        with instrumentation.instrumented():
+            Pokemon.generate_random("Pikachu", 10, rng=1)
+        instrumentation.reset_instrumentation()
+        counters = instrumentation.snapshot()
+        assert all(values["calls"] == 0 for values in counters.values())
+        assert all(values["seconds"] == 0 for values in counters.values())
+
+    def test_imported_names_are_counted(self):
+        with instrumentation.instrumented(reset=True):
+            simulation.dealt_damage_batch([[30] * 6], [[30] * 6], 10, "physical", 50, rng=1)
+        assert instrumentation.snapshot()["dealt_damage_batch"]["calls"] == 1
+
+
+class TestExport:
+    def test_snapshot_json(self):
+        with instrumentation.instrumented(reset=True):
+            Pokemon.generate_random("Pikachu", 10, rng=1)
+        assert json.loads(instrumentation.snapshot_json()) == instrumentation.snapshot()
+
+    def test_prometheus_text(self):
+        with instrumentation.instrumented(reset=True):
+            Pokemon.generate_random("Pikachu", 10, rng=1)
+        lines = instrumentation.prometheus_text().splitlines()
+        assert "# TYPE pokejdr_operation_calls_total counter" in lines
+        assert "# TYPE pokejdr_operation_seconds_total counter" in lines
+        assert (
+            'pokejdr_operation_calls_total{operation="Pokemon.generate_random",'
+            'category="generation"} 1'
+        ) in lines
+        samples = [line for line in lines if not line.startswith("#")]
+        assert len(samples) == 2 * len(instrumentation.snapshot())
+        assert all(float(sample.rsplit(" ", 1)[1]) >= 0 for sample in samples)
+
+
+# ----- Fixtures ----- #
+
+
+_dealt_damage = model.dealt_damage
+
+
+@pytest.fixture(autouse=True)
+def _disabled_instrumentation():
+    yield
+    instrumentation.disable_instrumentation()
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+from pokejdr import disable_logging, enable_logging, quiet_logging
+from pokejdr.model import dealt_damage
+
+
+class FormatCounter:
+    """Stands in for a pokemon name and counts how many times it is formatted."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __format__(self, format_spec: str) -> str:
+        self.count += 1
+        return "Counter"
+
+
+class TestLogging:
+    def test_enabled_logging_formats_messages(self, _sink):
+        attacker, defender = _fighters()
+        dealt_damage(attacker, defender, "normal", 40)
+        assert attacker.name.count == 1
+        assert any("Counter performs a normal attack" in message for message in _sink)
+
+    def test_quiet_mode_skips_formatting(self, _sink):
+        attacker, defender = _fighters()
+        disable_logging()
+        try:
+            dealt_damage(attacker, defender, "normal", 40)
+        finally:
+            enable_logging(sink=None)
+        assert attacker.name.count == 0
+        assert not _sink
+
+    def test_quiet_logging_context(self, _sink):
+        attacker, defender = _fighters()
+        with quiet_logging():
+            dealt_damage(attacker, defender, "normal", 40)
+        assert not _sink
+        dealt_damage(attacker, defender, "normal", 40)
+        assert _sink
+
+    def test_import_does_not_add_handlers(self):
+        script = (
+            "from loguru import logger; handlers = logger.add(lambda _: None); "
+            "import pokejdr; logger.remove(handlers); logger.remove(0)"  # fails if 0 was removed
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_import_is_lazy(self):
+        script = (
+            "import sys; import pokejdr; "
+            "assert not {'pandas', 'pydantic', 'loguru'} & set(sys.modules); "
+            "pokejdr.Pokemon.generate_random('Pikachu', level=10); "
+            "assert 'pandas' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_quiet_environment_variable(self):
+        script = "import pokejdr.logs as logs; assert logs._quiet"
+        environment = dict(os.environ, POKEJDR_QUIET="1")
+        subprocess.run([sys.executable, "-c", script], check=True, env=environment)
+
+
+# ----- Helpers ----- #
+
+
+def _fighters():
+    stats = dict(level=30, attack=100, special_attack=100, defense=80, special_defense=80)
+    return SimpleNamespace(name=FormatCounter(), **stats), SimpleNamespace(name="Target", **stats)
+
+
+@pytest.fixture()
+def _sink() -> list:
+    messages = []
+    handler_id = enable_logging(sink=messages.append, level="INFO", format="{message}")
+    yield messages
+    logger.remove(handler_id)
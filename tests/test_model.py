@@ -1,13 +1,31 @@
 import json
 import pathlib
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
 from pokejdr import base_stats
-from pokejdr.model import Pokemon, dealt_damage, erratic_leveling, fluctuating_leveling
+from pokejdr.model import (
+    BINARY_FORMAT_VERSION,
+    BINARY_LAYOUT,
+    LEVELING_CURVES,
+    MAX_STAT_EV,
+    MAX_TOTAL_EV,
+    Pokemon,
+    dealt_damage,
+    dealt_damage_batch,
+    erratic_leveling,
+    experience_for_levels,
+    fluctuating_leveling,
+    gain_evs_batch,
+    level_from_experience,
+)
+from pokejdr.stats import compute_stats
+from pokejdr.type_chart import type_ids
 
 CURRENT_DIR = pathlib.Path(__file__).parent
+STAT_COLUMNS = ("health", "attack", "defense", "special_attack", "special_defense", "speed")
 
 
 class TestGeneration:
@@ -44,6 +62,128 @@ class TestGeneration:
             assert record.levelname == "ERROR"
             assert "An invalid pokemon name was provided" in record.message
 
+    def test_generate_batch(self):
+        pokemons = Pokemon.generate_batch(["Dracaufeu", "random", "Pikachu"], [100, 10, 25])
+        assert len(pokemons) == 3
+        assert all(isinstance(poke, Pokemon) for poke in pokemons)
+        assert pokemons[0].name == "Dracaufeu"
+        assert pokemons[2].name == "Pikachu"
+        assert [poke.level for poke in pokemons] == [100, 10, 25]
+        assert pokemons[1].name in base_stats.POKEMONS_DF.name.to_numpy()
+
+    def test_generate_batch_broadcasts_and_sizes(self):
+        assert len(Pokemon.generate_batch("Pikachu", [5, 10, 15, 20])) == 4
+        assert len(Pokemon.generate_batch(["Pikachu", "Paras"], 30)) == 2
+        assert len(Pokemon.generate_batch("random", 30, size=7)) == 7
+
+    def test_generate_batch_matches_generate_random(self):
+        # with same IVs and nature, the batch formula must give the same stats as the scalar one
+        pokemons = Pokemon.generate_batch("Reptincel", 42, size=50)
+        for poke in pokemons:
+            base = base_stats.SPECIES_STATS[base_stats.SPECIES_INDEX["Reptincel"]]
+            modifiers = base_stats.NATURE_MODIFIERS[base_stats.NATURE_INDEX[poke.nature]]
+            assert poke.health == int((2 * base.health + poke.iv[0]) * 42 / 100 + 42 + 10)
+            assert poke.speed == int(((2 * base.speed + poke.iv[5]) * 42 / 100 + 5) * modifiers[4])
+
+    def test_generate_batch_columnar(self):
+        columns = Pokemon.generate_batch("random", 50, size=1000, as_objects=False)
+        assert columns["iv"].shape == (1000, 6)
+        assert columns["base_ev"].shape == (1000, 6)
+        assert (columns["level"] == 50).all()
+        assert ((0 <= columns["iv"]) & (columns["iv"] < 32)).all()
+        assert set(columns["nature"]) <= set(base_stats.NATURE_NAMES)
+        assert (columns["ev"] == 0).all()
+
+    def test_generate_batch_fails_with_invalid_name(self):
+        with pytest.raises(ValueError):
+            _ = Pokemon.generate_batch(["Pikachu", "Human"], 50)
+
+    @pytest.mark.parametrize("invalid_level", [0, -3, 101])
+    def test_generate_batch_fails_with_invalid_level(self, invalid_level):
+        with pytest.raises(ValueError):
+            _ = Pokemon.generate_batch("Pikachu", [50, invalid_level])
+
+
+class TestSpeciesRegistry:
+    def test_registry_matches_dataframe(self):
+        assert len(base_stats.SPECIES_STATS) == len(base_stats.POKEMONS_DF)
+        for name, row_number in base_stats.SPECIES_INDEX.items():
+            assert base_stats.SPECIES_STATS[row_number].name == name
+
+    def test_registry_record(self):
+        bulbizarre = base_stats.SPECIES_STATS[base_stats.SPECIES_INDEX["Bulbizarre"]]
+        assert bulbizarre.code == 1
+        assert bulbizarre.health == 45
+        assert bulbizarre.total == 318
+        assert bulbizarre.base_ev == (0, 0, 0, 1, 0, 0)
+        assert bulbizarre.types == ("Plante", "Poison")
+
+    def test_registry_records_are_frozen(self):
+        with pytest.raises(AttributeError):
+            base_stats.SPECIES_STATS[0].health = 1000
+
+    def test_natures_matrix_matches_dataframe(self):
+        assert base_stats.NATURE_MODIFIERS.shape == (len(base_stats.NATURES_DF), 5)
+        for name, nature_id in base_stats.NATURE_INDEX.items():
+            row = base_stats.NATURES_DF[base_stats.NATURES_DF.nature == name]
+            assert base_stats.NATURE_NAMES[nature_id] == name
+            assert (
+                base_stats.NATURE_MODIFIERS[nature_id]
+                == row[list(base_stats.NATURE_STATS)].to_numpy()[0]
+            ).all()
+
+    def test_binary_data_matches_dataframe(self):
+        species = base_stats._read_data_columns(base_stats.POKEMONS_BINARY)
+        stats = list(base_stats.BASE_STATS)
+        assert set(species) == set(base_stats.POKEMONS_DF.columns) - set(stats) | {"base_stats"}
+        assert species["name"].tolist() == base_stats.POKEMONS_DF.name.tolist()
+        assert species["base_ev"].tolist() == [list(ev) for ev in base_stats.POKEMONS_DF.base_ev]
+        assert (species["base_stats"] == base_stats.POKEMONS_DF[stats].to_numpy()).all()
+        natures = base_stats._read_data_columns(base_stats.NATURES_BINARY)
+        assert natures["nature"].tolist() == base_stats.NATURES_DF.nature.tolist()
+        assert (
+            natures["modifiers"] == base_stats.NATURES_DF[list(base_stats.NATURE_STATS)].to_numpy()
+        ).all()
+
+    @pytest.mark.parametrize(
+        "array",
+        [
+            lambda: base_stats.SPECIES_ARRAYS["base_stats"],
+            lambda: base_stats.SPECIES_ARRAYS["base_ev"],
+            lambda: base_stats.SPECIES_ARRAYS["base_xp"],
+            lambda: base_stats.NATURE_MODIFIERS,
+            lambda: base_stats.MOVE_ARRAYS["power"],
+        ],
+    )
+    def test_registry_arrays_are_memory_mapped(self, array):
+        assert isinstance(array(), np.memmap)
+        assert isinstance(array().base, np.memmap)
+
+    def test_species_names_array(self):
+        assert base_stats.SPECIES_ARRAYS["name"].tolist() == [
+            record.name for record in base_stats.SPECIES_STATS
+        ]
+
+    def test_species_types(self):
+        assert {len(record.types) for record in base_stats.SPECIES_STATS} == {1, 2}
+        assert base_stats.SPECIES_ARRAYS["types"].shape == (len(base_stats.SPECIES_STATS), 2)
+        dracaufeu_x = base_stats.SPECIES_STATS[base_stats.SPECIES_INDEX["Mega-Dracaufeu X"]]
+        assert dracaufeu_x.types == ("Feu", "Dragon")
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            base_stats.NOT_A_TABLE
+
+    def test_natures_matrix_is_read_only(self):
+        with pytest.raises(ValueError):
+            base_stats.NATURE_MODIFIERS[0, 0] = 2.0
+
+    def test_level_up_without_nature(self, _attacker_pokemon):
+        assert _attacker_pokemon.nature is None
+        _attacker_pokemon.level_up()
+        assert _attacker_pokemon.level == 31
+        assert _attacker_pokemon.attack == int((2 * 49 + 0) * 31 / 100 + 5)
+
 
 class TestPokemon:
     def test_attributes_conversions(self):
@@ -177,6 +317,64 @@ class TestPokemon:
     def test_experience_to_next_level(self, leveling_curve, result, _attacker_pokemon):
         assert _attacker_pokemon.experience_to_next_level(leveling_curve) == result
 
+    def test_gain_experience_single_level(self, _attacker_pokemon):
+        assert _attacker_pokemon.experience is None
+        assert _attacker_pokemon.gain_experience(100, "average") == 0
+        assert _attacker_pokemon.experience == 27_100  # starts from level 30 threshold
+        assert _attacker_pokemon.gain_experience(2_691, "average") == 1
+        assert _attacker_pokemon.level == 31
+
+    def test_gain_experience_multiple_levels(self, _attacker_pokemon):
+        expected = _attacker_pokemon.copy()
+        for _ in range(20):
+            expected.level_up()
+
+        assert _attacker_pokemon.gain_experience(125_000 - 27_000, "average") == 20
+        assert _attacker_pokemon.level == 50
+        assert _attacker_pokemon.experience == 125_000
+        for stat in STAT_COLUMNS:
+            assert getattr(_attacker_pokemon, stat) == getattr(expected, stat)
+
+    def test_gain_experience_capped_at_level_100(self, _attacker_pokemon):
+        assert _attacker_pokemon.gain_experience(10**9, "slow") == 70
+        assert _attacker_pokemon.level == 100
+        assert _attacker_pokemon.experience == 1_250_000
+
+    def test_gain_negative_experience(self, _attacker_pokemon):
+        experience, level = _attacker_pokemon.experience, _attacker_pokemon.level
+        with pytest.raises(ValueError, match="Invalid experience gain"):
+            _attacker_pokemon.gain_experience(-1, "average")
+        assert _attacker_pokemon.experience == experience
+        assert _attacker_pokemon.level == level
+
+    def test_gain_experience_from(self, _attacker_pokemon, _defender_pokemon):
+        _defender_pokemon.gain_experience_from(_attacker_pokemon, "quick", contextual_bonus=2)
+        assert _defender_pokemon.experience == 100 + 549
+        assert _defender_pokemon.level == 9
+
+    @pytest.mark.parametrize("leveling_curve", list(LEVELING_CURVES))
+    def test_experience_table_matches_curves(self, leveling_curve):
+        levels = np.arange(1, 101)
+        expected = [round(LEVELING_CURVES[leveling_curve](level)) for level in levels]
+        assert experience_for_levels(levels, leveling_curve).tolist() == expected
+
+    def test_experience_for_levels_case_insensitive(self):
+        assert experience_for_levels(15, "Quick") == 2700
+
+    @pytest.mark.parametrize("target_level", [-1, 101])
+    def test_experience_for_levels_invalid_level(self, target_level):
+        with pytest.raises(ValueError):
+            experience_for_levels([10, target_level], "slow")
+
+    @pytest.mark.parametrize("leveling_curve", list(LEVELING_CURVES))
+    def test_level_from_experience(self, leveling_curve):
+        levels = np.arange(1, 101)
+        thresholds = experience_for_levels(levels, leveling_curve)
+        assert (level_from_experience(thresholds, leveling_curve) == levels).all()
+        assert (level_from_experience(thresholds[1:] - 1, leveling_curve) == levels[:-1]).all()
+        assert level_from_experience(10**9, leveling_curve) == 100
+        assert level_from_experience(-1000, leveling_curve) == 1
+
 
 class TestValidations:
     @pytest.mark.parametrize("invalid_pokemon_code", [-5, -10, "-20"])
@@ -289,6 +487,75 @@ class TestIO:
         read_salameche = Pokemon.from_pickle(tmp_path / "save.pkl")
         assert read_salameche == random_salameche
 
+    def test_write_read_binary(self, tmp_path):
+        random_salameche = Pokemon.generate_random("Salameche", 37)
+        random_salameche.to_binary(tmp_path / "save.bin")
+
+        read_salameche = Pokemon.from_binary(tmp_path / "save.bin")
+        assert read_salameche == random_salameche
+
+    def test_bytes_round_trip(self, _pokemon_json_file):
+        bulbizarre = Pokemon.from_json(_pokemon_json_file)
+        encoded = bulbizarre.to_bytes()
+        assert len(encoded) == BINARY_LAYOUT.size < 100
+        assert Pokemon.from_bytes(encoded) == bulbizarre
+
+    def test_bytes_round_trip_optional_values(self):
+        pikachu = Pokemon.generate_random("Pikachu", 25)
+        pikachu.nature, pikachu.level, pikachu.base_xp, pikachu.experience = None, None, None, None
+        decoded = Pokemon.from_bytes(pikachu.to_bytes())
+        assert decoded == pikachu
+        decoded.health = -5  # decoded instances are still validated on assignment
+        assert decoded.health == 0
+
+    def test_bytes_keep_experience_and_floats(self):
+        dracaufeu = Pokemon.generate_random("Dracaufeu", 100)
+        dracaufeu.experience, dracaufeu.accuracy = 1_250_000, 1.1
+        assert Pokemon.from_bytes(dracaufeu.to_bytes()) == dracaufeu
+
+    def test_unencodable_pokemon(self):
+        pikachu = Pokemon.generate_random("Pikachu", 25)
+        pikachu.ev = [0, 0, 0, 0, 0, 70_000]
+        with pytest.raises(ValueError, match="can not be encoded"):
+            pikachu.to_bytes()
+
+    @pytest.mark.parametrize("corruption", ["version", "length", "name_id"])
+    def test_invalid_bytes(self, corruption):
+        encoded = bytearray(Pokemon.generate_random("Pikachu", 25).to_bytes())
+        if corruption == "version":
+            encoded[0] = BINARY_FORMAT_VERSION + 1
+        elif corruption == "length":
+            encoded = encoded[:-1]
+        else:
+            encoded[1:3] = (60_000).to_bytes(2, "little")
+        with pytest.raises(ValueError, match="Invalid binary Pokemon data"):
+            Pokemon.from_bytes(bytes(encoded))
+
+    @pytest.mark.parametrize(
+        "offset, value",
+        [
+            (3, (-2).to_bytes(1, "little", signed=True)),  # nature id
+            (3, (-5).to_bytes(1, "little", signed=True)),
+            (3, (-26).to_bytes(1, "little", signed=True)),
+            (3, (25).to_bytes(1, "little")),
+            (4, (0).to_bytes(2, "little")),  # code
+            (6, (0).to_bytes(2, "little")),  # number
+            (8, (101).to_bytes(1, "little")),  # level
+            (8, (255).to_bytes(1, "little")),
+        ],
+    )
+    def test_out_of_range_bytes(self, offset, value):
+        encoded = bytearray(Pokemon.generate_random("Pikachu", 25).to_bytes())
+        encoded[offset : offset + len(value)] = value
+        with pytest.raises(ValueError, match="Invalid binary Pokemon data"):
+            Pokemon.from_bytes(bytes(encoded))
+
+    def test_decoded_bytes_pass_validation(self):
+        pikachu = Pokemon.generate_random("Pikachu", 25, rng=0)
+        pikachu.nature, pikachu.level = None, None
+        decoded = Pokemon.from_bytes(pikachu.to_bytes())
+        assert Pokemon(**decoded.dict()) == decoded
+
 
 class TestDamageCalculation:
     @pytest.mark.parametrize(
@@ -385,6 +652,108 @@ class TestDamageCalculation:
             assert record.levelname == "ERROR"
             assert "An invalid attack type was provided" in record.message
 
+    @pytest.mark.parametrize("attack_type", ["normal", "special"])
+    def test_batch_damage_within_scalar_bounds(
+        self, _attacker_pokemon, _defender_pokemon, attack_type
+    ):
+        attacker_stats = [getattr(_attacker_pokemon, stat) for stat in STAT_COLUMNS]
+        defender_stats = [getattr(_defender_pokemon, stat) for stat in STAT_COLUMNS]
+        damages = dealt_damage_batch(
+            attacker_stats=np.array([attacker_stats] * 1000),
+            defender_stats=np.array(defender_stats),
+            attacker_levels=_attacker_pokemon.level,
+            attack_types=attack_type,
+            attack_powers=35,
+            attack_modifiers=2,
+            defense_modifiers=0.8,
+            global_modifiers=1.1,
+        )
+        lower_bound, higher_bound = (170, 200) if attack_type == "normal" else (197, 232)
+        assert damages.shape == (1000,)
+        assert ((lower_bound <= damages) & (damages <= higher_bound)).all()
+
+    def test_batch_damage_broadcasting(self):
+        attackers = Pokemon.generate_batch("random", 50, size=4, as_objects=False)
+        defenders = Pokemon.generate_batch("random", 50, size=3, as_objects=False)
+        attacker_stats = np.column_stack([attackers[stat] for stat in STAT_COLUMNS])
+        defender_stats = np.column_stack([defenders[stat] for stat in STAT_COLUMNS])
+        damages = dealt_damage_batch(
+            attacker_stats=attacker_stats[:, np.newaxis, :],
+            defender_stats=defender_stats[np.newaxis, :, :],
+            attacker_levels=50,
+            attack_types=np.array(["physical", "spe", "normal"]),
+            attack_powers=np.array([40, 90, 120]),
+        )
+        assert damages.shape == (4, 3)
+        assert (damages > 0).all()
+
+    def test_batch_damage_is_reproducible(self):
+        kwargs = dict(
+            attacker_stats=np.full((100, 6), 80),
+            defender_stats=np.full((100, 6), 60),
+            attacker_levels=np.arange(1, 101),
+            attack_types="special",
+            attack_powers=60,
+        )
+        first = dealt_damage_batch(**kwargs, rng=np.random.default_rng(42))
+        second = dealt_damage_batch(**kwargs, rng=np.random.default_rng(42))
+        assert (first == second).all()
+
+    def test_damage_type_modifiers(self, _attacker_pokemon, _defender_pokemon):
+        def damage(move_type):
+            return dealt_damage(
+                _attacker_pokemon, _defender_pokemon, "special", 500, rng=5, move_type=move_type
+            )
+
+        neutral = damage(None)
+        assert damage("Psy") == pytest.approx(2 * neutral, abs=2)  # super effective on Poison
+        assert damage("Plante") == pytest.approx(0.375 * neutral, abs=2)  # STAB, resisted twice
+        assert damage("Sol") == 0  # Nosferapti flies
+
+    def test_damage_invalid_move_type(self, _attacker_pokemon, _defender_pokemon):
+        with pytest.raises(ValueError, match="Invalid elemental type"):
+            dealt_damage(_attacker_pokemon, _defender_pokemon, "normal", 40, move_type="Fire")
+
+    def test_batch_damage_type_modifiers(self):
+        kwargs = dict(
+            attacker_stats=np.full((4, 6), 80),
+            defender_stats=np.full((4, 6), 60),
+            attacker_levels=50,
+            attack_types="physical",
+            attack_powers=500,
+        )
+        neutral = dealt_damage_batch(**kwargs, rng=3)
+        typed = dealt_damage_batch(
+            **kwargs,
+            rng=3,
+            move_types=["Eau", "Eau", "Normal", "Feu"],
+            attacker_types=type_ids([["Eau", ""], ["Feu", ""], ["Normal", ""], ["Eau", ""]]),
+            defender_types=type_ids([["Feu", ""], ["Feu", "Sol"], ["Spectre", ""], ["Acier", ""]]),
+        )
+        assert typed == pytest.approx(neutral * np.array([3, 4, 0, 2]), abs=4)
+
+    def test_batch_damage_invalid_move_type(self):
+        with pytest.raises(ValueError, match="Invalid elemental type"):
+            _ = dealt_damage_batch(
+                attacker_stats=np.full((2, 6), 80),
+                defender_stats=np.full((2, 6), 60),
+                attacker_levels=10,
+                attack_types="normal",
+                attack_powers=60,
+                move_types=["Eau", ""],
+                defender_types=type_ids([["Feu", ""], ["Feu", ""]]),
+            )
+
+    def test_batch_damage_invalid_attack_type(self):
+        with pytest.raises(ValueError):
+            _ = dealt_damage_batch(
+                attacker_stats=np.full((2, 6), 80),
+                defender_stats=np.full((2, 6), 60),
+                attacker_levels=10,
+                attack_types=["normal", "invalid"],
+                attack_powers=60,
+            )
+
 
 class TestCombat:
     @pytest.mark.parametrize("move_accuracy, result", [(1, 1), (1.1, 1.1), (2, 2)])
@@ -428,6 +797,142 @@ class TestCombat:
         assert _attacker_pokemon.experience_given(bonus) == att_xp
         assert _defender_pokemon.experience_given(bonus) == def_xp
 
+    def test_use_damaging_move(self, _attacker_pokemon, _defender_pokemon):
+        initial_health = _defender_pokemon.health
+        assert _attacker_pokemon.use_move(_defender_pokemon, "Psychic", rng=0)
+        assert _defender_pokemon.health < initial_health
+
+    def test_use_move_dispatches_on_category(
+        self, _attacker_pokemon, _defender_pokemon, monkeypatch
+    ):
+        calls = []
+        for category in ("physical", "special"):
+            monkeypatch.setattr(
+                Pokemon,
+                f"perform_{category}_attack",
+                lambda self, target, power, *args, category=category: calls.append(
+                    (category, power, args[-1])
+                ),
+            )
+        _attacker_pokemon.use_move(_defender_pokemon, "Zen Headbutt", rng=0)
+        _attacker_pokemon.use_move(_defender_pokemon, "Psychic", rng=0)
+        assert calls == [("physical", 80, "Psy"), ("special", 90, "Psy")]
+
+    def test_use_move_accounts_for_types(self, _attacker_pokemon, _defender_pokemon):
+        initial_health = _defender_pokemon.health
+        assert _attacker_pokemon.use_move(_defender_pokemon, "Earthquake", rng=0)
+        assert _defender_pokemon.health == initial_health  # nosferapti flies
+
+    def test_use_status_move(self, _attacker_pokemon, _defender_pokemon):
+        initial_health = _defender_pokemon.health
+        assert _attacker_pokemon.use_move(_defender_pokemon, "Growl", rng=0)
+        assert _defender_pokemon.health == initial_health
+
+    def test_use_move_can_miss(self, _attacker_pokemon, _defender_pokemon):
+        _attacker_pokemon.accuracy = 0.01
+        initial_health = _defender_pokemon.health
+        assert not _attacker_pokemon.use_move(_defender_pokemon, "Psychic", rng=0)
+        assert _defender_pokemon.health == initial_health
+
+    @pytest.mark.parametrize("move_name", ["Seismic Toss", "Low Kick", "Guillotine", "Return"])
+    def test_use_move_without_power(self, _attacker_pokemon, _defender_pokemon, move_name):
+        initial_health = _defender_pokemon.health
+        with pytest.raises(ValueError, match="fixed or variable damage"):
+            _attacker_pokemon.use_move(_defender_pokemon, move_name, rng=0)
+        assert _defender_pokemon.health == initial_health
+
+    def test_use_invalid_move(self, _attacker_pokemon, _defender_pokemon):
+        with pytest.raises(ValueError, match="Invalid move name"):
+            _attacker_pokemon.use_move(_defender_pokemon, "Not A Move")
+
+    def test_types(self, _attacker_pokemon, _defender_pokemon):
+        assert _attacker_pokemon.types == ("Plante", "Poison")
+        assert _defender_pokemon.types == ("Poison", "Vol")
+        assert Pokemon.generate_random("Salameche", 5, rng=0).types == ("Feu",)
+
+    def test_perform_attack_with_move_type(self, _attacker_pokemon, _defender_pokemon):
+        initial_health = _defender_pokemon.health
+        _attacker_pokemon.perform_physical_attack(_defender_pokemon, 15, move_type="Sol")
+        assert _defender_pokemon.health == initial_health
+
+
+class TestEffortValues:
+    def test_gain_evs_from(self, _attacker_pokemon, _defender_pokemon):
+        assert _attacker_pokemon.gain_evs_from(_defender_pokemon, multiplier=100) == [
+            0,
+            0,
+            0,
+            0,
+            0,
+            200,
+        ]
+        assert _attacker_pokemon.ev == [0, 0, 0, 0, 0, 200]
+        assert (
+            _attacker_pokemon.speed
+            == compute_stats(
+                "Bulbizarre",
+                30,
+                _attacker_pokemon.nature,
+                _attacker_pokemon.iv,
+                [0, 0, 0, 0, 0, 200],
+            )[5]
+        )
+
+    def test_gain_evs_keeps_damage(self, _attacker_pokemon):
+        _attacker_pokemon.health = 3
+        max_health = compute_stats(
+            "Bulbizarre", 30, _attacker_pokemon.nature, _attacker_pokemon.iv, [0] * 6
+        )[0]
+        _attacker_pokemon.gain_evs([252, 0, 0, 0, 0, 0])
+        new_max_health = compute_stats(
+            "Bulbizarre", 30, _attacker_pokemon.nature, _attacker_pokemon.iv, _attacker_pokemon.ev
+        )[0]
+        assert new_max_health > max_health
+        assert _attacker_pokemon.health == 3 + new_max_health - max_health
+
+    def test_gain_evs_caps(self, _attacker_pokemon):
+        _attacker_pokemon.ev = [250, 0, 0, 0, 0, 0]
+        assert _attacker_pokemon.gain_evs([10, 252, 252, 0, 0, 0]) == [2, 252, 6, 0, 0, 0]
+        assert _attacker_pokemon.ev == [MAX_STAT_EV, 252, 6, 0, 0, 0]
+        assert sum(_attacker_pokemon.ev) == MAX_TOTAL_EV
+
+    def test_unchanged_evs_skip_stats_update(self, _attacker_pokemon, monkeypatch):
+        _attacker_pokemon.ev = [MAX_STAT_EV, MAX_STAT_EV, 6, 0, 0, 0]
+        monkeypatch.setattr(Pokemon, "_update_stats_on_levelup", _fail_stats_update)
+        assert _attacker_pokemon.gain_evs([0, 0, 0, 0, 4, 4]) == [0] * 6
+        assert _attacker_pokemon.gain_evs([0] * 6) == [0] * 6
+
+    def test_gain_evs_batch(self):
+        evs = np.array([[0] * 6, [250, 0, 0, 0, 0, 0], [252, 252, 0, 0, 0, 0]])
+        new_evs = gain_evs_batch(evs, [4, 0, 8, 0, 0, 0])
+        assert new_evs.tolist() == [
+            [4, 0, 8, 0, 0, 0],
+            [252, 0, 8, 0, 0, 0],
+            [252, 252, 6, 0, 0, 0],
+        ]
+        assert evs[0].tolist() == [0] * 6
+
+    def test_gain_evs_batch_with_winners(self):
+        evs = np.zeros((3, 6), dtype=np.int64)
+        gained_evs = np.array([[0, 0, 0, 0, 0, 200]] * 4)
+        new_evs = gain_evs_batch(evs, gained_evs, winners=[0, 0, 2, 0])
+        assert new_evs[:, 5].tolist() == [MAX_STAT_EV, 0, 200]
+
+    def test_gain_evs_batch_matches_sequential_gains(self):
+        rng = np.random.default_rng(0)
+        gains = rng.integers(0, 120, size=(20, 6))
+        sequential = np.zeros(6, dtype=np.int64)
+        for gain in gains:
+            sequential = gain_evs_batch(sequential, gain)
+        assert (sequential <= MAX_STAT_EV).all()
+        assert sequential.sum() == MAX_TOTAL_EV
+        batched = gain_evs_batch(np.zeros((1, 6)), gains, winners=[0] * 20)
+        assert batched.sum() == MAX_TOTAL_EV
+
+    def test_negative_ev_gains(self, _attacker_pokemon):
+        with pytest.raises(ValueError, match="Invalid EV gain"):
+            _attacker_pokemon.gain_evs([-4, 0, 0, 0, 0, 0])
+
 
 # ----- Fixtures ----- #
 
@@ -442,11 +947,5 @@ def _pokemon_pickle_file() -> pathlib.Path:
     return CURRENT_DIR / "inputs" / "nosferapti.pkl"
 
 
-@pytest.fixture()
-def _attacker_pokemon() -> Pokemon:
-    return Pokemon.from_json(CURRENT_DIR / "inputs" / "bulbizarre.json")
-
-
-@pytest.fixture()
-def _defender_pokemon() -> Pokemon:
-    return Pokemon.from_pickle(CURRENT_DIR / "inputs" / "nosferapti.pkl")
+def _fail_stats_update(self) -> None:
+    raise AssertionError("Stats should not be updated.")
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from pokejdr import base_stats
+from pokejdr.moves import MOVE_CATEGORIES, get_move, move_rows
+from pokejdr.type_chart import TYPES, type_id
+
+
+class TestMovesRegistry:
+    def test_registry_matches_dataframe(self):
+        assert len(base_stats.MOVES) == len(base_stats.MOVES_DF)
+        assert [move._asdict() for move in base_stats.MOVES] == base_stats.MOVES_DF.to_dict(
+            "records"
+        )
+        for name, row_number in base_stats.MOVE_INDEX.items():
+            assert base_stats.MOVES[row_number].name == name
+
+    def test_moves_values(self):
+        assert {move.category for move in base_stats.MOVES} == set(MOVE_CATEGORIES)
+        assert {move.type for move in base_stats.MOVES} == set(TYPES)
+        assert all(0 < move.accuracy <= 1 for move in base_stats.MOVES)
+
+    def test_move_arrays(self):
+        arrays = base_stats.MOVE_ARRAYS
+        row = base_stats.MOVE_INDEX["Thunderbolt"]
+        assert arrays["name"][row] == "Thunderbolt"
+        assert arrays["type"][row] == type_id("Électrik")
+        assert arrays["category"][row] == "special"
+        assert arrays["power"][row] == 90
+        with pytest.raises(ValueError):
+            arrays["power"][row] = 200
+
+
+class TestLookups:
+    def test_get_move(self):
+        quick_attack = get_move("Quick Attack")
+        assert quick_attack.type == "Normal"
+        assert quick_attack.category == "physical"
+        assert quick_attack.power == 40
+        assert quick_attack.accuracy == 1
+        assert quick_attack.priority == 1
+
+    def test_move_rows(self):
+        rows = move_rows([["Pound", "Thunderbolt"], ["Pound", "Growl"]])
+        assert rows.shape == (2, 2)
+        assert base_stats.MOVE_ARRAYS["name"][rows].tolist() == [
+            ["Pound", "Thunderbolt"],
+            ["Pound", "Growl"],
+        ]
+        assert move_rows("Pound") == base_stats.MOVE_INDEX["Pound"]
+        assert np.array_equal(move_rows([]), np.array([], dtype=np.int64))
+
+    @pytest.mark.parametrize("move_name", ["Tonnerre", "thunderbolt", ""])
+    def test_invalid_move(self, move_name):
+        with pytest.raises(ValueError, match="Invalid move name"):
+            get_move(move_name)
+        with pytest.raises(ValueError, match="Invalid move name"):
+            move_rows(["Pound", move_name])
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from pokejdr import rng as pokejdr_rng
+from pokejdr.model import Pokemon, dealt_damage
+
+
+class TestRandomState:
+    def test_get_rng(self):
+        generator = np.random.default_rng(1)
+        assert pokejdr_rng.get_rng(generator) is generator
+        assert isinstance(pokejdr_rng.get_rng(5), np.random.Generator)
+        assert pokejdr_rng.get_rng() is pokejdr_rng.get_rng(None)
+
+    def test_set_seed(self):
+        pokejdr_rng.set_seed(12)
+        first = Pokemon.generate_random("random", 50)
+        pokejdr_rng.set_seed(12)
+        assert Pokemon.generate_random("random", 50) == first
+        pokejdr_rng.set_seed(None)
+
+    def test_using_rng_restores_default(self):
+        default = pokejdr_rng.get_rng()
+        with pokejdr_rng.using_rng(7) as generator:
+            assert pokejdr_rng.get_rng() is generator
+            first = Pokemon.generate_batch("random", 50, size=10)
+        assert pokejdr_rng.get_rng() is default
+
+        with pokejdr_rng.using_rng(7):
+            assert Pokemon.generate_batch("random", 50, size=10) == first
+
+    def test_spawn_rngs(self):
+        first_streams = pokejdr_rng.spawn_rngs(3, seed=42)
+        second_streams = pokejdr_rng.spawn_rngs(3, seed=42)
+        first_draws = [stream.random(5) for stream in first_streams]
+        assert len(first_streams) == 3
+        assert all(
+            (draws == stream.random(5)).all() for draws, stream in zip(first_draws, second_streams)
+        )
+        assert not (first_draws[0] == first_draws[1]).all()
+
+
+class TestReproducibility:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_generate_random(self, seed):
+        first = Pokemon.generate_random("random", 30, rng=seed)
+        assert Pokemon.generate_random("random", 30, rng=seed) == first
+
+    def test_generate_batch(self):
+        first = Pokemon.generate_batch("random", 30, size=100, rng=3)
+        assert Pokemon.generate_batch("random", 30, size=100, rng=3) == first
+
+    def test_dealt_damage(self):
+        attacker = Pokemon.generate_random("Pikachu", 30, rng=0)
+        defender = Pokemon.generate_random("Salameche", 30, rng=1)
+        first_rng, second_rng = np.random.default_rng(9), np.random.default_rng(9)
+        first = [dealt_damage(attacker, defender, "special", 90, rng=first_rng) for _ in range(20)]
+        second = [
+            dealt_damage(attacker, defender, "special", 90, rng=second_rng) for _ in range(20)
+        ]
+        assert first == second
@@ -0,0 +1,162 @@
+import json
+
+import numpy as np
+import pytest
+
+from pokejdr.columnar import read_columns, write_columns
+from pokejdr.fast import FastPokemon
+from pokejdr.model import Pokemon
+from pokejdr.roster import iter_roster, iter_roster_chunks, load_roster, save_roster
+from pokejdr.table import PokemonTable
+
+
+class TestRosterPersistence:
+    @pytest.mark.parametrize("suffix", [".ndjson", ".jsonl", ".bin"])
+    @pytest.mark.parametrize("compression", ["", ".gz", ".bz2", ".xz"])
+    def test_save_load(self, tmp_path, _pokemons, suffix, compression):
+        roster_file = tmp_path / f"box{suffix}{compression}"
+        save_roster(_pokemons, roster_file)
+        assert load_roster(roster_file) == _pokemons
+
+    @pytest.mark.parametrize("format", ["ndjson", "columnar"])
+    def test_table_round_trip(self, tmp_path, _pokemons, format):
+        table = PokemonTable.from_pokemons(_pokemons)
+        save_roster(table, tmp_path / "box", format=format, compression=None)
+        loaded = load_roster(tmp_path / "box", format=format, compression=None, as_table=True)
+        assert isinstance(loaded, PokemonTable)
+        assert loaded.to_pokemons() == _pokemons
+
+    def test_loaded_table_is_writable(self, tmp_path, _pokemons):
+        save_roster(_pokemons, tmp_path / "box.bin")
+        table = load_roster(tmp_path / "box.bin", as_table=True)
+        table.damage(10)
+        assert (table.health == [poke.health - 10 for poke in _pokemons]).all()
+
+    def test_save_generator_and_fast_pokemons(self, tmp_path, _pokemons):
+        save_roster((FastPokemon.from_pokemon(poke) for poke in _pokemons), tmp_path / "box.ndjson")
+        assert load_roster(tmp_path / "box.ndjson") == _pokemons
+
+    def test_ndjson_has_one_pokemon_per_line(self, tmp_path, _pokemons):
+        save_roster(_pokemons, tmp_path / "box.ndjson")
+        lines = (tmp_path / "box.ndjson").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [poke.dict() for poke in _pokemons]
+
+    def test_iter_roster_is_lazy(self, tmp_path, _pokemons):
+        save_roster(_pokemons, tmp_path / "box.ndjson.gz")
+        with (tmp_path / "box.ndjson.gz").open("ab") as roster_file:
+            roster_file.write(b"not json")  # only reached when reading past the pokemons
+        roster = iter_roster(tmp_path / "box.ndjson.gz")
+        assert [next(roster) for _ in _pokemons] == _pokemons
+
+    def test_empty_roster(self, tmp_path):
+        save_roster([], tmp_path / "box.bin")
+        assert load_roster(tmp_path / "box.bin") == []
+
+    def test_columnar_roster_is_compact(self, tmp_path):
+        table = PokemonTable.from_columns(
+            Pokemon.generate_batch("random", 20, size=1000, as_objects=False, rng=0)
+        )
+        save_roster(table, tmp_path / "box.bin")
+        save_roster(table, tmp_path / "box.ndjson")
+        assert (tmp_path / "box.bin").stat().st_size < (tmp_path / "box.ndjson").stat().st_size
+
+
+class TestStreaming:
+    @pytest.mark.parametrize("roster_name", ["box.ndjson", "box.bin", "box.bin.gz"])
+    def test_iter_roster(self, tmp_path, _pokemons, roster_name):
+        save_roster(_pokemons, tmp_path / roster_name)
+        assert list(iter_roster(tmp_path / roster_name, chunk_size=3)) == _pokemons
+
+    @pytest.mark.parametrize(
+        "roster_name", ["box.ndjson", "box.ndjson.xz", "box.bin", "box.bin.gz"]
+    )
+    def test_chunks(self, tmp_path, _pokemons, roster_name):
+        save_roster(_pokemons, tmp_path / roster_name)
+        chunks = list(iter_roster_chunks(tmp_path / roster_name, chunk_size=3))
+        assert [len(chunk["code"]) for chunk in chunks] == [3, 1]
+        expected = PokemonTable.from_pokemons(_pokemons).to_columns()
+        for field, values in expected.items():
+            assert np.concatenate([chunk[field] for chunk in chunks]).tolist() == values.tolist()
+        tables = [PokemonTable.from_columns(chunk) for chunk in chunks]
+        assert [poke for table in tables for poke in table.to_pokemons()] == _pokemons
+
+    @pytest.mark.parametrize("roster_name", ["box.ndjson", "box.bin"])
+    def test_field_projection(self, tmp_path, _pokemons, roster_name):
+        save_roster(_pokemons, tmp_path / roster_name)
+        (chunk,) = iter_roster_chunks(tmp_path / roster_name, fields=["level", "name", "nature"])
+        assert list(chunk) == ["name", "level", "nature"]
+        assert chunk["name"].tolist() == [poke.name for poke in _pokemons]
+        assert chunk["nature"].tolist() == [poke.nature for poke in _pokemons]
+
+    def test_missing_ndjson_fields_take_defaults(self, tmp_path, _pokemons):
+        record = _pokemons[0].dict()
+        del record["experience"], record["base_ev"]
+        (tmp_path / "box.ndjson").write_text(json.dumps(record), encoding="utf-8")
+        (chunk,) = iter_roster_chunks(tmp_path / "box.ndjson")
+        assert chunk["experience"].tolist() == [None]
+        assert chunk["base_ev"].tolist() == [[0, 0, 0, 0, 0, 0]]
+
+    def test_invalid_fields(self, tmp_path, _pokemons):
+        save_roster(_pokemons, tmp_path / "box.bin")
+        with pytest.raises(ValueError, match="Invalid roster fields"):
+            next(iter_roster_chunks(tmp_path / "box.bin", fields=["name", "shininess"]))
+
+    def test_invalid_chunk_size(self, tmp_path, _pokemons):
+        save_roster(_pokemons, tmp_path / "box.bin")
+        with pytest.raises(ValueError, match="Invalid chunk size"):
+            next(iter_roster_chunks(tmp_path / "box.bin", chunk_size=0))
+
+
+class TestRosterValidation:
+    def test_invalid_records_are_rejected(self, tmp_path, _pokemons):
+        record = dict(_pokemons[0].dict(), health=-10)
+        (tmp_path / "box.ndjson").write_text(json.dumps(record), encoding="utf-8")
+        assert load_roster(tmp_path / "box.ndjson")[0].health == 0
+        assert load_roster(tmp_path / "box.ndjson", validate=False)[0].health == -10
+
+    @pytest.mark.parametrize(
+        "column, value",
+        [
+            ("name", -1),
+            ("name", 4),
+            ("nature", 10),
+            ("level", 101),
+            ("health", -10),
+            ("code", 0),
+            ("experience", -2),
+            ("speed", 2 ** 40),
+        ],
+    )
+    def test_invalid_columnar_values_are_rejected(self, tmp_path, _pokemons, column, value):
+        save_roster(_pokemons, tmp_path / "box.bin")
+        columns = {
+            name: np.array(values) for name, values in read_columns(tmp_path / "box.bin").items()
+        }
+        columns[column] = columns[column].astype(np.int64)
+        columns[column][0] = value
+        write_columns(tmp_path / "box.bin", columns)
+        with pytest.raises(ValueError, match="Invalid columnar roster"):
+            load_roster(tmp_path / "box.bin")
+        if column in ("name", "nature"):
+            with pytest.raises(ValueError, match="Invalid columnar roster"):
+                next(iter_roster_chunks(tmp_path / "box.bin", fields=[column]))
+
+    def test_incomplete_columnar_roster_is_rejected(self, tmp_path, _pokemons):
+        save_roster(_pokemons, tmp_path / "box.bin")
+        columns = dict(read_columns(tmp_path / "box.bin"))
+        del columns["iv"]
+        write_columns(tmp_path / "box.bin", columns)
+        with pytest.raises(ValueError, match="Invalid columnar roster"):
+            load_roster(tmp_path / "box.bin")
+
+    def test_format_can_not_be_inferred(self, tmp_path, _pokemons):
+        with pytest.raises(ValueError, match="Invalid roster format"):
+            save_roster(_pokemons, tmp_path / "box.txt")
+
+    def test_invalid_format(self, tmp_path, _pokemons):
+        with pytest.raises(ValueError, match="Invalid roster format"):
+            save_roster(_pokemons, tmp_path / "box.bin", format="csv")
+
+    def test_invalid_compression(self, tmp_path, _pokemons):
+        with pytest.raises(ValueError, match="Invalid compression"):
+            save_roster(_pokemons, tmp_path / "box.bin", compression="zip")
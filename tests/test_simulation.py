@@ -0,0 +1,116 @@
+import pytest
+
+from pokejdr.model import Pokemon
+from pokejdr.simulation import (
+    Attack,
+    BattleStatistics,
+    Matchup,
+    simulate_battles,
+    simulate_matchups,
+)
+
+
+class TestSimulation:
+    def test_stronger_pokemon_always_wins(self, _attacker_pokemon, _defender_pokemon):
+        stats = simulate_battles(
+            _attacker_pokemon, Attack(15), _defender_pokemon, Attack(15), n_battles=500, n_workers=1
+        )
+        assert isinstance(stats, BattleStatistics)
+        assert stats.n_battles == 500
+        assert stats.first_win_probability == 1
+        assert stats.mean_turns == 2  # lvl 5 nosferapti faints on the second attack
+
+    def test_pokemons_are_not_modified(self, _attacker_pokemon, _defender_pokemon):
+        initial_health = _defender_pokemon.health
+        _ = simulate_battles(
+            _attacker_pokemon, Attack(15), _defender_pokemon, Attack(15), n_battles=10, n_workers=1
+        )
+        assert _defender_pokemon.health == initial_health
+
+    def test_missed_attacks_give_draws(self, _attacker_pokemon, _defender_pokemon):
+        stats = simulate_battles(
+            _attacker_pokemon,
+            Attack(15, accuracy=0),
+            _defender_pokemon,
+            Attack(15, accuracy=0),
+            n_battles=100,
+            max_turns=5,
+            n_workers=1,
+        )
+        assert stats.draws == 100
+        assert stats.draw_probability == 1
+
+    def test_reproducible_across_workers(self):
+        first = Pokemon.generate_random("Pikachu", 30)
+        second = Pokemon.generate_random("Salameche", 30)
+        kwargs = dict(n_battles=2_000, seed=42, chunk_size=500)
+        in_process = simulate_battles(
+            first, Attack(40, "special", 0.9), second, Attack(40), n_workers=1, **kwargs
+        )
+        in_pool = simulate_battles(
+            first, Attack(40, "special", 0.9), second, Attack(40), n_workers=2, **kwargs
+        )
+        assert in_process == in_pool
+        assert in_process.first_wins + in_process.second_wins + in_process.draws == 2_000
+
+    def test_type_immunity_gives_draws(self, _attacker_pokemon, _defender_pokemon):
+        stats = simulate_battles(
+            _attacker_pokemon,
+            Attack(15, move_type="Sol"),
+            _defender_pokemon,
+            Attack(15, move_type="Normal"),
+            n_battles=100,
+            max_turns=3,
+            n_workers=1,
+        )
+        assert stats.first_wins == 0  # nosferapti flies, and does not faint in 3 turns
+
+    def test_priority_attacks_first(self):
+        first = Pokemon.generate_random("Pikachu", 50, rng=1)
+        second = Pokemon.generate_random("Pikachu", 50, rng=1)
+        stats = simulate_battles(
+            first, Attack(1000), second, Attack(1000, priority=1), n_battles=100, n_workers=1
+        )
+        assert stats.second_wins == 100
+
+    def test_attack_from_move(self):
+        attack = Attack.from_move("Quick Attack", global_modifier=1.2)
+        assert attack == Attack(
+            40, "physical", 1.0, global_modifier=1.2, move_type="Normal", priority=1
+        )
+        with pytest.raises(ValueError, match="Invalid attack type"):
+            Attack.from_move("Growl")
+        with pytest.raises(ValueError, match="fixed or variable damage"):
+            Attack.from_move("Seismic Toss")
+        with pytest.raises(ValueError, match="Invalid move name"):
+            Attack.from_move("Not A Move")
+
+    def test_simulate_matchups(self, _attacker_pokemon, _defender_pokemon):
+        results = simulate_matchups(
+            [
+                Matchup(_attacker_pokemon, Attack(15), _defender_pokemon, Attack(15)),
+                Matchup(_defender_pokemon, Attack(15), _attacker_pokemon, Attack(15)),
+            ],
+            n_battles=100,
+            n_workers=1,
+        )
+        assert results[0].first_win_probability == 1
+        assert results[1].second_win_probability == 1
+
+    def test_invalid_attack_type(self, _attacker_pokemon, _defender_pokemon):
+        with pytest.raises(ValueError):
+            simulate_battles(
+                _attacker_pokemon, Attack(15, "invalid"), _defender_pokemon, Attack(15)
+            )
+
+    @pytest.mark.parametrize("n_battles, max_turns", [(0, 10), (10, 0), (-5, 10)])
+    def test_invalid_parameters(self, _attacker_pokemon, _defender_pokemon, n_battles, max_turns):
+        with pytest.raises(ValueError):
+            simulate_battles(
+                _attacker_pokemon,
+                Attack(15),
+                _defender_pokemon,
+                Attack(15),
+                n_battles=n_battles,
+                max_turns=max_turns,
+            )
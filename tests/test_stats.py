@@ -0,0 +1,218 @@
+import numpy as np
+import pytest
+
+from pokejdr import base_stats, stats, table
+from pokejdr.model import Pokemon
+
+
+class TestComputeStats:
+    def test_formula(self):
+        bulbizarre = base_stats.SPECIES_STATS[base_stats.SPECIES_INDEX["Bulbizarre"]]
+        modifiers = base_stats.NATURE_MODIFIERS[base_stats.NATURE_INDEX["Rigide"]]
+        ivs, evs = (1, 2, 3, 4, 5, 6), (8, 12, 16, 20, 24, 28)
+        computed = stats.compute_stats("Bulbizarre", 50, "Rigide", ivs, evs)
+        assert computed[0] == int((2 * bulbizarre.health + 1 + 2) * 50 / 100 + 50 + 10)
+        assert computed[1] == int(((2 * bulbizarre.attack + 2 + 3) * 50 / 100 + 5) * modifiers[0])
+        assert computed[5] == int(((2 * bulbizarre.speed + 6 + 7) * 50 / 100 + 5) * modifiers[4])
+
+    def test_no_nature_is_neutral(self):
+        bulbizarre = base_stats.SPECIES_STATS[base_stats.SPECIES_INDEX["Bulbizarre"]]
+        computed = stats.compute_stats("Bulbizarre", 10)
+        assert computed[1] == int((2 * bulbizarre.attack) * 10 / 100 + 5)
+
+    def test_matches_generate_random(self):
+        pokemon = Pokemon.generate_random("Reptincel", 37, rng=3)
+        computed = stats.compute_stats("Reptincel", 37, pokemon.nature, pokemon.iv)
+        assert list(computed) == [
+            pokemon.health,
+            pokemon.attack,
+            pokemon.defense,
+            pokemon.special_attack,
+            pokemon.special_defense,
+            pokemon.speed,
+        ]
+
+    def test_matches_level_up(self):
+        pokemon = Pokemon.generate_random("Reptincel", 37, rng=3)
+        pokemon.ev = [4, 8, 12, 16, 20, 252]
+        pokemon.level_up()
+        computed = stats.compute_stats("Reptincel", 38, pokemon.nature, pokemon.iv, pokemon.ev)
+        assert list(computed) == [
+            pokemon.health,
+            pokemon.attack,
+            pokemon.defense,
+            pokemon.special_attack,
+            pokemon.special_defense,
+            pokemon.speed,
+        ]
+
+
+class TestBatchStats:
+    def test_matches_compute_stats(self):
+        rows = [base_stats.SPECIES_INDEX[name] for name in ("Bulbizarre", "Pikachu", "Mew")]
+        ivs, evs = np.array([[1, 2, 3, 4, 5, 6]] * 3), np.array([[8, 12, 16, 20, 24, 28]] * 3)
+        nature_ids = [base_stats.NATURE_INDEX["Rigide"], 0, stats.NO_NATURE]
+        computed = stats.compute_stats_batch(
+            base_stats.SPECIES_ARRAYS["base_stats"][rows], ivs, evs, [50, 5, 100], nature_ids
+        )
+        assert computed.tolist() == [
+            list(stats.compute_stats("Bulbizarre", 50, "Rigide", ivs[0], evs[0])),
+            list(stats.compute_stats("Pikachu", 5, base_stats.NATURE_NAMES[0], ivs[1], evs[1])),
+            list(stats.compute_stats("Mew", 100, None, ivs[2], evs[2])),
+        ]
+
+    def test_narrow_inputs_do_not_overflow(self):
+        base, ivs, evs = np.full((1, 6), 250), np.full((1, 6), 31), np.full((1, 6), 252)
+        expected = stats.compute_stats_batch(base, ivs, evs, 100, stats.NO_NATURE)
+        computed = stats.compute_stats_batch(
+            base.astype(np.uint8), ivs.astype(np.int8), evs.astype(np.uint8), np.uint8(100), -1
+        )
+        assert computed.tolist() == expected.tolist()
+
+    def test_broadcasts_scalars(self):
+        pikachu = base_stats.SPECIES_ARRAYS["base_stats"][base_stats.SPECIES_INDEX["Pikachu"]]
+        computed = stats.compute_stats_batch(np.tile(pikachu, (4, 1)), 31, 0, 50, stats.NO_NATURE)
+        assert computed.shape == (4, 6)
+        assert computed[0].tolist() == list(stats.compute_stats("Pikachu", 50, None, [31] * 6))
+
+    def test_matches_level_up(self):
+        pokemons = [Pokemon.generate_random("Reptincel", level, rng=level) for level in (5, 37)]
+        for pokemon in pokemons:
+            pokemon.ev = [4, 8, 12, 16, 20, 252]
+            pokemon.level_up()
+        recomputed = stats.compute_stats_batch(
+            base_stats.SPECIES_ARRAYS["base_stats"][[base_stats.SPECIES_INDEX["Reptincel"]] * 2],
+            [pokemon.iv for pokemon in pokemons],
+            [pokemon.ev for pokemon in pokemons],
+            [pokemon.level for pokemon in pokemons],
+            [base_stats.NATURE_INDEX[pokemon.nature] for pokemon in pokemons],
+        )
+        assert recomputed.dtype == np.int64
+        assert recomputed.tolist() == [
+            [
+                pokemon.health,
+                pokemon.attack,
+                pokemon.defense,
+                pokemon.special_attack,
+                pokemon.special_defense,
+                pokemon.speed,
+            ]
+            for pokemon in pokemons
+        ]
+
+    def test_generation_and_level_up_agree(self):
+        pokemon = Pokemon.generate_random("Reptincel", 36, rng=5)
+        generated = [pokemon.health, pokemon.attack, pokemon.speed]
+        pokemon.level = 35
+        pokemon.level_up()
+        assert [pokemon.health, pokemon.attack, pokemon.speed] == generated
+
+    def test_nature_modifiers_batch(self):
+        modifiers = stats.nature_modifiers_batch([0, stats.NO_NATURE])
+        assert modifiers[0].tolist() == base_stats.NATURE_MODIFIERS[0].tolist()
+        assert modifiers[1].tolist() == [1.0] * 5
+
+
+class TestStatsBackends:
+    def test_default_backend(self):
+        assert stats.stats_backend() in stats.STATS_BACKENDS
+
+    def test_numpy_backend(self):
+        stats.set_stats_backend("numpy")
+        assert stats.stats_backend() == "numpy"
+        computed = stats.compute_stats_batch(*_random_inputs(100))
+        assert computed.dtype == np.int64
+        assert computed.shape == (100, 6)
+
+    def test_numba_matches_numpy(self):
+        pytest.importorskip("numba")
+        size = stats.NUMBA_MIN_BATCH_SIZE
+        inputs = _random_inputs(size)
+        stats.set_stats_backend("numpy")
+        expected = stats.compute_stats_batch(*inputs)
+        stats.set_stats_backend("numba")
+        assert stats.compute_stats_batch(*inputs).tolist() == expected.tolist()
+        assert stats.compute_stats_batch(*inputs[:3], 50, stats.NO_NATURE).shape == (size, 6)
+        table_inputs = [array.astype(np.int16) for array in inputs[:4]]
+        stats.compute_stats_batch(*table_inputs, inputs[4])
+        signatures = stats._numba_kernel().signatures
+        assert {str(array.dtype) for signature in signatures for array in signature} == {
+            "int64",
+            "float64",
+        }
+
+    def test_small_batches_skip_numba(self, monkeypatch):
+        monkeypatch.setattr(stats, "_backend", "numba")
+        monkeypatch.setattr(stats, "_numba_kernel", _fail_numba_kernel)
+        computed = stats.compute_stats_batch(*_random_inputs(stats.NUMBA_MIN_BATCH_SIZE - 1))
+        assert computed.shape == (stats.NUMBA_MIN_BATCH_SIZE - 1, 6)
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            stats.set_stats_backend("fortran")
+
+
+class TestStatsCache:
+    def test_hits_and_misses(self):
+        stats.compute_stats("Pikachu", 5, "Hardi", [31] * 6)
+        stats.compute_stats("Pikachu", 5, "Hardi", (31,) * 6)
+        stats.compute_stats("Pikachu", 6, "Hardi", (31,) * 6)
+        info = stats.stats_cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+        assert info.currsize == 2
+
+    def test_cache_is_bounded(self):
+        stats.set_stats_cache_size(3)
+        for level in range(1, 11):
+            stats.compute_stats("Pikachu", level)
+        assert stats.stats_cache_info().currsize == 3
+        assert stats.stats_cache_info().maxsize == 3
+
+    def test_invalid_cache_size(self):
+        with pytest.raises(ValueError):
+            stats.set_stats_cache_size(-1)
+
+    def test_reload_clears_caches(self):
+        stats.compute_stats("Pikachu", 5)
+        table._nature_names()
+        species_stats = base_stats.SPECIES_STATS
+        base_stats.reload_data()
+        assert stats.stats_cache_info().currsize == 0
+        assert table._nature_names.cache_info().currsize == 0
+        assert base_stats.SPECIES_STATS is not species_stats
+        assert base_stats.SPECIES_STATS == species_stats
+
+
+# ----- Fixtures ----- #
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    stats.set_stats_cache_size(stats.STATS_CACHE_SIZE)
+    yield
+    stats.set_stats_cache_size(stats.STATS_CACHE_SIZE)
+
+
+@pytest.fixture(autouse=True)
+def _default_backend():
+    backend = stats.stats_backend()
+    yield
+    stats.set_stats_backend(backend)
+
+
+def _random_inputs(size: int) -> tuple:
+    rng = np.random.default_rng(0)
+    return (
+        base_stats.SPECIES_ARRAYS["base_stats"][
+            rng.integers(len(base_stats.SPECIES_STATS), size=size)
+        ],
+        rng.integers(0, 32, size=(size, 6)),
+        rng.integers(0, 253, size=(size, 6)),
+        rng.integers(1, 101, size=size),
+        rng.integers(-1, len(base_stats.NATURE_NAMES), size=size),
+    )
+
+
+def _fail_numba_kernel():
+    raise AssertionError("The numba kernel should not be used.")
@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+
+from pokejdr import base_stats
+from pokejdr.model import Pokemon
+from pokejdr.table import PokemonRow, PokemonTable
+from pokejdr.type_chart import type_ids
+
+
+class TestConversions:
+    def test_from_to_pokemons(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        assert len(table) == len(_pokemons)
+        assert table.to_pokemons() == _pokemons
+
+    def test_from_generated_columns(self):
+        columns = Pokemon.generate_batch("random", 20, size=100, as_objects=False)
+        table = PokemonTable.from_columns(columns)
+        assert len(table) == 100
+        assert (table.name == columns["name"]).all()
+        assert (table.nature == columns["nature"]).all()
+        assert (table.iv == columns["iv"]).all()
+
+    def test_types(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        assert table.types.shape == (4, 2)
+        assert table.types.tolist() == [
+            type_ids(list(pokemon.types) + [""] * (2 - len(pokemon.types))).tolist()
+            for pokemon in _pokemons
+        ]
+
+    def test_from_to_dataframe(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        dataframe = table.to_dataframe()
+        assert list(dataframe.columns) == list(Pokemon.__fields__)
+        assert PokemonTable.from_dataframe(dataframe).to_pokemons() == _pokemons
+
+    def test_from_species_dataframe(self):
+        table = PokemonTable.from_dataframe(base_stats.POKEMONS_DF)
+        assert len(table) == len(base_stats.POKEMONS_DF)
+        bulbizarre = table[0]
+        assert bulbizarre.name == "Bulbizarre"
+        assert bulbizarre.level is None
+        assert bulbizarre.nature is None
+        assert bulbizarre.base_ev.tolist() == [0, 0, 0, 1, 0, 0]
+
+    def test_invalid_name(self, _pokemons):
+        _pokemons[0].name = "Human"
+        with pytest.raises(ValueError):
+            PokemonTable.from_pokemons(_pokemons)
+
+    def test_compact_memory(self):
+        table = PokemonTable.from_columns(
+            Pokemon.generate_batch("random", 50, size=1000, as_objects=False)
+        )
+        assert table.nbytes / len(table) < 128
+
+
+class TestRows:
+    def test_row_acts_like_pokemon(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        row = table[1]
+        assert isinstance(row, PokemonRow)
+        assert row.name == _pokemons[1].name
+        assert row.total == _pokemons[1].total
+        assert row.dict() == _pokemons[1].dict()
+        assert row.to_pokemon() == _pokemons[1]
+        assert row.types == _pokemons[1].types
+        assert table[-1].name == _pokemons[-1].name
+
+    def test_row_writes_through(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        row = table[0]
+        row.attack = 250
+        row.iv[0] = 31
+        row.nature = "Brave"
+        assert table.attack[0] == 250
+        assert table.iv[0, 0] == 31
+        assert table.nature[0] == "Brave"
+
+    def test_row_health_does_not_drop_below_0(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        table[0].health -= 1000
+        assert table.health[0] == 0
+        assert table.fainted[0]
+
+    def test_row_invalid_attribute(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        with pytest.raises(AttributeError):
+            table[0].charisma = 10
+
+    def test_out_of_range(self, _pokemons):
+        with pytest.raises(IndexError):
+            _ = PokemonTable.from_pokemons(_pokemons)[len(_pokemons)]
+
+    def test_slicing_gives_table(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        assert isinstance(table[:2], PokemonTable)
+        assert len(table[table.level > 10]) == sum(poke.level > 10 for poke in _pokemons)
+
+
+class TestPopulation:
+    def test_damage_and_heal(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        table.damage(10_000)
+        assert table.fainted.all()
+        table.heal(mask=np.array([0]))
+        assert table.health[0] == table.max_health()[0]
+        assert table.fainted[1:].all()
+        table.heal()
+        assert not table.fainted.any()
+
+    def test_level_up_matches_pokemon(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        table.level_up()
+        for poke in _pokemons:
+            poke.level_up()
+        assert table.to_pokemons() == _pokemons
+
+    def test_level_up_is_capped(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        table.level_up(500, mask=np.array([True, False, False, False]))
+        assert table.level[0] == 100
+        assert (table.level[1:] == [poke.level for poke in _pokemons[1:]]).all()
+
+    def test_level_up_skips_pokemons_without_level(self, _pokemons):
+        _pokemons[1].level = None
+        table = PokemonTable.from_pokemons(_pokemons)
+        health = table.health.copy()
+        table.level_up(np.array([1, 2, 3, 4]))
+        assert table.level.tolist() == [_pokemons[0].level + 1, 0] + [
+            poke.level + gained for poke, gained in zip(_pokemons[2:], (3, 4))
+        ]
+        assert table.health[1] == health[1]
+
+    def test_level_up_with_mask(self, _pokemons, monkeypatch):
+        table = PokemonTable.from_pokemons(_pokemons)
+        computed_rows = []
+        leveled_stats = PokemonTable._leveled_stats
+
+        def counting_leveled_stats(self, selection=slice(None)):
+            stats = leveled_stats(self, selection)
+            computed_rows.append(len(stats))
+            return stats
+
+        monkeypatch.setattr(PokemonTable, "_leveled_stats", counting_leveled_stats)
+        table.level_up([1, 5], mask=np.array([3, 0]))
+        assert computed_rows == [2]
+        assert table.level[[3, 0]].tolist() == [_pokemons[3].level + 1, _pokemons[0].level + 5]
+        _pokemons[0].level += 4
+        _pokemons[0].level_up()
+        assert table[0].to_pokemon() == _pokemons[0]
+
+    def test_gain_evs_matches_pokemon(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        gained_evs = np.array([[0, 0, 0, 0, 0, 8], [0] * 6, [300, 0, 0, 0, 0, 0], [4] * 6])
+        changed = table.gain_evs(gained_evs)
+        assert changed.tolist() == [True, False, True, True]
+        for poke, evs in zip(_pokemons, gained_evs.tolist()):
+            poke.gain_evs(evs)
+        assert table.to_pokemons() == _pokemons
+
+    def test_gain_evs_from_battles(self, _pokemons):
+        table = PokemonTable.from_pokemons(_pokemons)
+        table.damage(20)
+        health, damage_taken = table.health.copy(), table.max_health() - table.health
+        changed = table.gain_evs(np.array([[200, 0, 0, 0, 0, 0]] * 3), winners=[3, 3, 0])
+        assert changed.tolist() == [True, False, False, True]
+        assert table.ev[:, 0].tolist() == [200, 0, 0, 252]
+        assert (table.health[1:3] == health[1:3]).all()
+        assert (table.health[[0, 3]] > health[[0, 3]]).all()
+        assert (table.max_health() - table.health == damage_taken).all()
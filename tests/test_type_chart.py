@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from pokejdr.type_chart import (
+    EFFECTIVENESS,
+    NO_TYPE,
+    STAB_MULTIPLIER,
+    TYPES,
+    effectiveness,
+    effectiveness_batch,
+    stab,
+    stab_batch,
+    type_id,
+    type_ids,
+)
+
+
+class TestTypeChart:
+    def test_matrix_shape(self):
+        assert EFFECTIVENESS.shape == (len(TYPES), len(TYPES) + 1)
+        assert (EFFECTIVENESS[:, NO_TYPE] == 1).all()
+        assert set(np.unique(EFFECTIVENESS)) == {0, 0.5, 1, 2}
+
+    def test_matrix_is_read_only(self):
+        with pytest.raises(ValueError):
+            EFFECTIVENESS[0, 0] = 2
+
+    @pytest.mark.parametrize(
+        "move_type, defender_types, result",
+        [
+            ("Eau", ["Feu"], 2),
+            ("Feu", ["Eau"], 0.5),
+            ("Normal", ["Spectre"], 0),
+            ("Glace", ["Dragon", "Vol"], 4),
+            ("Plante", ["Poison", "Vol"], 0.25),
+            ("Sol", ["Électrik", "Vol"], 0),
+            ("Combat", ["Normal", "Spectre"], 0),
+            ("Feu", ["Eau", "Plante"], 1),
+            ("Psy", ["Poison", ""], 2),
+        ],
+    )
+    def test_effectiveness(self, move_type, defender_types, result):
+        assert effectiveness(move_type, defender_types) == result
+
+    def test_stab(self):
+        assert stab("Plante", ("Plante", "Poison")) == STAB_MULTIPLIER
+        assert stab("Poison", ("Plante", "Poison")) == STAB_MULTIPLIER
+        assert stab("Feu", ("Plante", "Poison")) == 1
+
+    @pytest.mark.parametrize("type_name", ["Fire", "feu", "Electrik"])
+    def test_invalid_type(self, type_name):
+        with pytest.raises(ValueError, match="Invalid elemental type"):
+            effectiveness(type_name, ["Eau"])
+        with pytest.raises(ValueError, match="Invalid elemental type"):
+            stab(type_name, ["Eau"])
+
+    def test_type_ids(self):
+        assert type_id("Normal") == 0
+        assert type_id("") == type_id(None) == NO_TYPE
+        assert type_ids([["Plante", "Poison"], ["Feu", None]]).tolist() == [[3, 7], [1, NO_TYPE]]
+        with pytest.raises(ValueError):
+            type_ids(["Eau", "Invalid"])
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        move_ids = rng.integers(len(TYPES), size=200)
+        defender_ids = rng.integers(-1, len(TYPES), size=(200, 2))
+        attacker_ids = rng.integers(-1, len(TYPES), size=(200, 2))
+        multipliers = effectiveness_batch(move_ids, defender_ids)
+        bonuses = stab_batch(move_ids, attacker_ids)
+        for position, move_id in enumerate(move_ids):
+            defender_types = [TYPES[i] for i in defender_ids[position] if i != NO_TYPE]
+            attacker_types = [TYPES[i] for i in attacker_ids[position] if i != NO_TYPE]
+            assert multipliers[position] == effectiveness(TYPES[move_id], defender_types)
+            assert bonuses[position] == stab(TYPES[move_id], attacker_types)
+
+    def test_batch_broadcasting(self):
+        move_ids = type_ids(["Eau", "Feu", "Sol"])
+        defender_ids = type_ids([["Feu", ""], ["Vol", "Acier"]])
+        multipliers = effectiveness_batch(move_ids[:, np.newaxis], defender_ids[np.newaxis, :, :])
+        assert multipliers.tolist() == [[2, 1], [0.5, 2], [2, 0]]